@@ -71,6 +71,12 @@ cdef extern from 'alure2-alext.h' nogil:
 cdef extern from 'alure2-aliases.h' namespace 'alure' nogil:
     ctypedef duration[double] Seconds
 
+    cdef cppclass SharedFuture[T]:
+        SharedFuture()  # nil
+        boolean valid()
+        T get() except +
+        void wait() except +
+
 
 cdef extern from 'alure2-typeviews.h' namespace 'alure' nogil:
     cdef cppclass ArrayView[T]:
@@ -225,6 +231,7 @@ cdef extern from 'alure2.h' namespace 'alure' nogil:
         boolean operator<(const Device&)
         boolean operator>(const Device&)
         boolean operator bool()
+        DeviceImpl* get_handle 'getHandle'()
 
         string get_name 'getName'() except +
         string get_name 'getName'(PlaybackName) except +
@@ -254,6 +261,7 @@ cdef extern from 'alure2.h' namespace 'alure' nogil:
 
     cdef cppclass Context:
         Context()   # nil
+        Context(ContextImpl*)
         boolean operator==(const Context&)
         boolean operator!=(const Context&)
         boolean operator<=(const Context&)
@@ -261,6 +269,7 @@ cdef extern from 'alure2.h' namespace 'alure' nogil:
         boolean operator<(const Context&)
         boolean operator>(const Context&)
         boolean operator bool()
+        ContextImpl* get_handle 'getHandle'()
 
         @staticmethod
         void make_current 'MakeCurrent'(Context) except +
@@ -296,6 +305,7 @@ cdef extern from 'alure2.h' namespace 'alure' nogil:
         ArrayView[string] get_available_resamplers 'getAvailableResamplers'() except +
         int get_default_resampler_index 'getDefaultResamplerIndex'() except +
 
+        SharedFuture[Buffer] get_buffer_async 'getBufferAsync'(string) except +
         void precache_buffers_async 'precacheBuffersAsync'(vector[StringView]) except +
         Buffer create_buffer_from 'createBufferFrom'(string, shared_ptr[Decoder]) except +
         Buffer find_buffer 'findBuffer'(string) except +
@@ -352,6 +362,7 @@ cdef extern from 'alure2.h' namespace 'alure' nogil:
         boolean operator<(const Source&)
         boolean operator>(const Source&)
         boolean operator bool()
+        SourceImpl* get_handle 'getHandle'()
 
         void play(Buffer) except +
         void play(shared_ptr[Decoder], int, int) except +
@@ -454,6 +465,7 @@ cdef extern from 'alure2.h' namespace 'alure' nogil:
         boolean operator<(const SourceGroup&)
         boolean operator>(const SourceGroup&)
         boolean operator bool()
+        SourceGroupImpl* get_handle 'getHandle'()
 
         void set_parent_group 'setParentGroup'(SourceGroup) except +
         SourceGroup get_parent_group 'getParentGroup'() except +
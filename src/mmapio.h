@@ -0,0 +1,178 @@
+// Memory-mapped file I/O
+// Copyright (C) 2020  Nguyễn Gia Phong
+//
+// This file is part of palace.
+//
+// palace is free software: you can redistribute it and/or modify it
+// under the terms of the GNU Lesser General Public License as published
+// by the Free Software Foundation, either version 3 of the License,
+// or (at your option) any later version.
+//
+// palace is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public License
+// along with palace.  If not, see <https://www.gnu.org/licenses/>.
+
+#ifndef PALACE_MMAPIO_H
+#define PALACE_MMAPIO_H
+
+#include <cstddef>
+#include <ios>
+#include <istream>
+#include <memory>
+#include <streambuf>
+#include <string>
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+#include "alure2.h"
+
+namespace palace
+{
+  // Read-only stream buffer whose get area is the whole mapped file,
+  // so that reading and seeking are merely pointer arithmetic.
+  // Like Python's mmap, empty files cannot be mapped and thus opened.
+  class MmapStreamBuf : public std::streambuf
+  {
+    char* data = nullptr;
+    std::size_t size = 0;
+    bool opened = false;
+
+  public:
+    MmapStreamBuf (const std::string& name) noexcept
+    {
+#ifdef _WIN32
+      int n = MultiByteToWideChar (CP_UTF8, 0, name.c_str(), -1, nullptr, 0);
+      std::wstring wname (n, L'\0');
+      MultiByteToWideChar (CP_UTF8, 0, name.c_str(), -1, &wname[0], n);
+      HANDLE file = CreateFileW (wname.c_str(), GENERIC_READ, FILE_SHARE_READ,
+                                 nullptr, OPEN_EXISTING,
+                                 FILE_ATTRIBUTE_NORMAL, nullptr);
+      if (file == INVALID_HANDLE_VALUE)
+        return;
+      LARGE_INTEGER length;
+      if (!GetFileSizeEx (file, &length))
+        length.QuadPart = -1;
+      if (length.QuadPart > 0)
+        {
+          HANDLE mapping = CreateFileMappingW (file, nullptr, PAGE_READONLY,
+                                               0, 0, nullptr);
+          if (mapping)
+            {
+              data = static_cast<char*> (MapViewOfFile (mapping, FILE_MAP_READ,
+                                                        0, 0, 0));
+              CloseHandle (mapping);
+            }
+          if (data)
+            size = length.QuadPart;
+          opened = data;
+        }
+      CloseHandle (file);
+#else
+      int fd = open (name.c_str(), O_RDONLY);
+      if (fd == -1)
+        return;
+      struct stat st;
+      if (fstat (fd, &st) != 0)
+        st.st_size = -1;
+      if (st.st_size > 0)
+        {
+          void* p = mmap (nullptr, st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+          if (p != MAP_FAILED)
+            {
+              data = static_cast<char*> (p);
+              size = st.st_size;
+              opened = true;
+            }
+        }
+      close (fd);
+#endif
+      setg (data, data, data + size);
+    }
+
+    ~MmapStreamBuf() override
+    {
+      if (!data)
+        return;
+#ifdef _WIN32
+      UnmapViewOfFile (data);
+#else
+      munmap (data, size);
+#endif
+    }
+
+    inline bool is_open() const noexcept { return opened; }
+
+  protected:
+    inline pos_type
+    seekoff (off_type off, std::ios_base::seekdir way,
+             std::ios_base::openmode which = std::ios_base::in) override
+    {
+      off_type pos;
+      switch (way)
+        {
+        case std::ios_base::beg:
+          pos = off;
+          break;
+        case std::ios_base::cur:
+          pos = gptr() - eback() + off;
+          break;
+        case std::ios_base::end:
+          pos = size + off;
+          break;
+        default:
+          return off_type (-1);
+        }
+      if (pos < 0 || pos > static_cast<off_type> (size))
+        return off_type (-1);
+      setg (data, data + pos, data + size);
+      return pos;
+    }
+
+    inline pos_type
+    seekpos (pos_type sp,
+             std::ios_base::openmode which = std::ios_base::in) override
+    { return seekoff (off_type (sp), std::ios_base::beg, which); }
+  };
+
+  // Input stream owning its memory-mapped stream buffer
+  class MmapStream : public std::istream
+  {
+    MmapStreamBuf buf;
+
+  public:
+    MmapStream (const std::string& name) noexcept
+    : std::istream (nullptr), buf (name)
+    {
+      init (&buf);
+      if (!buf.is_open())
+        setstate (std::ios_base::failbit);
+    }
+  };
+
+  // File I/O factory never calling back into Python
+  class MmapFileIOFactory : public alure::FileIOFactory
+  {
+  public:
+    inline alure::UniquePtr<std::istream>
+    openFile (const alure::String &name) noexcept override
+    {
+      std::unique_ptr<MmapStream> stream {new MmapStream (name)};
+      if (stream->fail())
+        return nullptr;
+      return std::move (stream);
+    }
+  };
+} // namespace palace
+
+#endif // PALACE_MMAPIO_H
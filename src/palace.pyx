@@ -72,22 +72,42 @@ __all__ = [
     'INT', 'UNSIGNED_INT', 'FLOAT', 'HRTF', 'HRTF_ID',
     'sample_types', 'channel_configs', 'device_names',
     'reverb_preset_names', 'decoder_factories', 'distance_models',
-    'current_fileio', 'use_fileio', 'query_extension',
+    'current_fileio', 'use_fileio', 'current_pcm_cache', 'use_pcm_cache',
+    'enable_instrumentation', 'stats', 'query_extension',
     'thread_local', 'current_context', 'use_context',
-    'cache', 'free', 'decode', 'sample_size', 'sample_length',
-    'Device', 'Context', 'Listener', 'Buffer', 'Source', 'SourceGroup',
+    'cache', 'load_buffers', 'free', 'decode', 'sample_size', 'sample_length',
+    'Device', 'Context', 'Listener', 'Buffer', 'BufferCache', 'CachedBuffer',
+    'Source', 'SourceGroup', 'SourcePool', 'StreamStats', 'CallStats',
+    'Emitter', 'VoiceManager',
     'BaseEffect', 'ReverbEffect', 'ChorusEffect',
-    'Decoder', 'BaseDecoder', 'FileIO', 'MessageHandler']
+    'Decoder', 'BaseDecoder', 'ChunkDecoder', 'FileIO', 'MmapFileIO',
+    'Event', 'MessageHandler']
 
 from abc import abstractmethod, ABCMeta
+from asyncio import Queue, get_event_loop, sleep as async_sleep
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
+from collections import OrderedDict
 from enum import Enum, auto
+from hashlib import sha256
+from heapq import nlargest
 from contextlib import contextmanager
 from io import DEFAULT_BUFFER_SIZE
+from json import dump, load
+from mmap import mmap, ACCESS_READ
 from operator import itemgetter
+from os import makedirs, replace, stat
+from os.path import abspath, join, splitext
+from stat import S_ISREG
+from struct import calcsize
+from sys import byteorder
+from tempfile import NamedTemporaryFile
+from time import monotonic
+from threading import Lock, Thread
 from types import TracebackType
-from typing import (Any, Callable, Dict, Iterable, Iterator,
-                    List, Optional, Sequence, Tuple, Type)
+from weakref import WeakKeyDictionary, WeakValueDictionary
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, Iterable,
+                    Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type)
 from warnings import catch_warnings, simplefilter, warn
 
 try:    # Python 3.8+
@@ -96,25 +116,33 @@ except ImportError:
     from abc import ABC as Protocol
 
 from libc.stdint cimport uint64_t   # noqa
+from libc.float cimport FLT_MAX
+from libc.math cimport floor, sqrt
 from libc.stdio cimport EOF
 from libc.string cimport memcpy
 
 from libcpp cimport bool as boolean, nullptr
-from libcpp.memory cimport (make_unique, unique_ptr,    # noqa
-                            shared_ptr, static_pointer_cast)
+from libcpp.memory cimport (make_shared, make_unique,   # noqa
+                            shared_ptr, static_pointer_cast, unique_ptr)
 from libcpp.string cimport string
 from libcpp.utility cimport pair
 from libcpp.vector cimport vector
 from std cimport istream, milliseconds, streambuf
 
-from cpython.mem cimport PyMem_RawMalloc, PyMem_RawFree
+from cpython.buffer cimport (PyObject_GetBuffer, PyBuffer_Release,
+                             PyBUF_C_CONTIGUOUS, PyBUF_WRITABLE, PyBUF_WRITE)
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.memoryview cimport PyMemoryView_FromMemory
 from cpython.ref cimport Py_INCREF, Py_DECREF
 from cython.view cimport array
 
 cimport alure   # noqa
 from util cimport (     # noqa
     REVERB_PRESETS, SAMPLE_TYPES, CHANNEL_CONFIGS, DISTANCE_MODELS,
-    reverb_presets, mkattrs, make_filter, from_vector3, to_vector3)
+    reverb_presets, mkattrs, make_filter, from_vector3, to_vector3, now,
+    MmapFileIOFactory, Updater, Event as NativeEvent, ChunkRing, RingDecoder,
+    StreamStats as NativeStreamStats, StreamTelemetry, MonitoredDecoder,
+    prefetch_native)
 
 
 # Aliases
@@ -163,6 +191,23 @@ distance_models: Tuple[str, ...] = (
     'inverse clamped', 'linear clamped', 'exponent clamped',
     'inverse', 'linear', 'exponent', 'none')
 
+# Mappings from buffer protocol item formats and number of channels
+# for inferring properties of arrays of samples.
+cdef str native_order = '<' if byteorder == 'little' else '>'
+cdef dict ARRAY_SAMPLE_TYPES = {
+    'B': 'Unsigned 8-bit', 'h': 'Signed 16-bit', 'f': '32-bit float',
+    native_order+'h': 'Signed 16-bit', native_order+'f': '32-bit float'}
+cdef dict ARRAY_CHANNEL_CONFIGS = {
+    1: 'Mono', 2: 'Stereo', 4: 'Quadrophonic',
+    6: '5.1 Surround', 7: '6.1 Surround', 8: '7.1 Surround'}
+cdef dict SAMPLE_FORMATS = {
+    'Unsigned 8-bit': 'B', 'Signed 16-bit': 'h',
+    '32-bit float': 'f', 'Mulaw': 'B'}
+
+# Number of grids indexing the emitters of a voice manager,
+# whose cells double in size from one grid to the next.
+cdef int GRID_LEVELS = 32
+
 # Since multiple calls of DeviceManager.get_instance() will give
 # the same instance, we can create module-level variable and expose
 # its attributes and methods.  This also prevents the device manager
@@ -174,6 +219,22 @@ cdef boolean _thread = False
 reverb_preset_names: Tuple[str, ...] = tuple(reverb_presets())
 decoder_factories: DecoderNamespace = DecoderNamespace()
 cdef object fileio_factory = None   # type: Optional[Callable[[str], FileIO]]
+cdef object pcm_cache = None    # type: Optional[str]
+# Waiting for asynchronously loaded buffers is done on a separate thread,
+# in the same order the buffers are loaded by alure's background thread.
+cdef object buffer_loader = None    # type: Optional[ThreadPoolExecutor]
+# Pending Source.finished futures and their event loops,
+# keyed by the address of the underlying source implementation.
+cdef dict stop_waiters = {}
+# Live wrappers of devices, contexts, sources and source groups,
+# keyed by the addresses of the underlying implementations.
+cdef object wrappers = WeakValueDictionary()
+# Addresses of the contexts owning the live sources and source groups
+cdef dict owners = {}
+# Timing of Python callbacks, by name and by BaseDecoder instance
+cdef boolean instrumenting = False
+cdef dict call_records = {}
+cdef object decoder_records = WeakKeyDictionary()
 
 
 def sample_size(length: int, channel_config: str, sample_type: str) -> int:
@@ -259,17 +320,14 @@ def current_context(thread: Optional[bool] = None) -> Optional[Context]:
     In case `thread` is not specified, fallback to preference made by
     `thread_local`.
     """
-    cdef Context current = Context.__new__(Context)
+    cdef alure.Context impl
     if thread is None: thread = _thread
     if thread:
-        current.impl = alure.Context.get_thread_current()
+        impl = alure.Context.get_thread_current()
     else:
-        current.impl = alure.Context.get_current()
-    if not current: return None
-    current.device = Device.__new__(Device)
-    current.device.impl = current.impl.get_device()
-    current.listener = Listener(current)
-    return current
+        impl = alure.Context.get_current()
+    if not <boolean> impl: return None
+    return wrap_context(impl)
 
 
 def use_context(context: Optional[Context],
@@ -294,18 +352,23 @@ def use_context(context: Optional[Context],
         alure.Context.make_current(alure_context)
 
 
-def cache(names: Iterable[str], context: Optional[Context] = None) -> None:
+def cache(names: Iterable[str],
+          context: Optional[Context] = None) -> Dict[str, Future]:
     """Cache given audio resources asynchronously.
 
     Duplicate names and buffers already cached are ignored.
     Cached buffers must be freed before destroying the context.
 
     The resources will be scheduled for caching asynchronously,
-    and should be retrieved later when needed by initializing
-    `Buffer` corresponding objects.  Resources that cannot be
-    loaded, for example due to an unsupported format, will be
-    ignored and a later `Buffer` initialization will raise
-    an exception.
+    and can be retrieved later when needed by initializing
+    `Buffer` corresponding objects.
+
+    Return a dictionary mapping each name to a future of the buffer
+    being loaded, which can be used to wait for the buffer
+    or to report the progress of caching.  Resources that cannot be
+    loaded, for example due to an unsupported format, will have
+    their futures set with the exception, and a later `Buffer`
+    initialization will raise an exception as well.
 
     If `context` is not given, `current_context()` will be used.
 
@@ -317,14 +380,105 @@ def cache(names: Iterable[str], context: Optional[Context] = None) -> None:
     See Also
     --------
     free : Free cached audio resources given their names
+    Buffer.load_async : Load a buffer asynchronously
     Buffer.destroy : Free the buffer's cache
     """
-    cdef vector[string] std_names = list(names)
-    cdef vector[alure.StringView] alure_names
-    for name in std_names: alure_names.push_back(<alure.StringView> name)
     if context is None: context = current_context()
     if not context: raise RuntimeError('there is no context current')
-    (<Context> context).impl.precache_buffers_async(alure_names)
+    futures: Dict[str, Future] = {}
+    for name in names:
+        if name not in futures:
+            futures[name] = load_buffer_async(context, name)
+    return futures
+
+
+def load_buffers(names: Iterable[str], workers: Optional[int] = None,
+                 context: Optional[Context] = None) -> Dict[str, Buffer]:
+    """Load given audio resources, decoding them in parallel.
+
+    Resources not yet cached are decoded by `decode`, including
+    registered decoder factories, on a pool of `workers` threads,
+    while their samples are uploaded as buffers on the calling
+    thread as soon as each one is decoded.  Duplicate names
+    are ignored and buffers already cached are reused.
+
+    Return a dictionary mapping each name to its buffer.
+
+    If `context` is not given, `current_context()` will be used.
+    Like `cache`, the context must be current for all threads.
+
+    Raise
+    -----
+    RuntimeError
+        If there is neither any context specified nor current,
+        or if any of the resources cannot be loaded, in which case
+        the buffers loaded by this call are freed.
+
+    See Also
+    --------
+    cache : Cache given audio resources asynchronously
+    Buffer.from_buffer : Create a buffer from raw samples
+
+    Note
+    ----
+    Native decoders release the global interpreter lock while
+    decoding, unlike decoders implemented in Python, which
+    therefore would not benefit as much from more workers.
+    """
+    if context is None: context = current_context()
+    if not context: raise RuntimeError('there is no context current')
+    cdef alure.Context impl = (<Context> context).impl
+    cdef alure.Buffer existing
+    cdef string alure_name
+    buffers: Dict[str, Optional[Buffer]] = dict.fromkeys(names)
+    with ThreadPoolExecutor(max_workers=workers,
+                            thread_name_prefix='palace-decoder') as executor:
+        futures: Dict[Future, str] = {}
+        for name in buffers:
+            alure_name = name
+            with nogil: existing = impl.find_buffer(alure_name)
+            if <boolean> existing:
+                buffers[name] = Buffer(name, context)
+            else:
+                futures[executor.submit(_decode_all, name, context)] = name
+        loaded: List[Buffer] = []
+        try:
+            for future in as_completed(futures):
+                (samples, frequency, channel_config, sample_type,
+                 loop_points) = future.result()
+                buffer: Buffer = Buffer.from_buffer(
+                    samples, futures[future], frequency,
+                    channel_config, sample_type, context)
+                loaded.append(buffer)
+                start, end = loop_points
+                if start < end: buffer.loop_points = loop_points
+                buffers[futures[future]] = buffer
+        except BaseException:
+            for future in futures: future.cancel()
+            for buffer in loaded: buffer.destroy()
+            raise
+    return buffers
+
+
+def _decode_all(name: str, context: Context) -> Tuple[
+        bytearray, int, str, str, Tuple[int, int]]:
+    """Decode the whole resource and return its samples and format."""
+    return read_all(decode(name, context))
+
+
+cdef tuple read_all(decoder):
+    """Read the whole decoder and return its samples and format."""
+    channel_config, sample_type = decoder.channel_config, decoder.sample_type
+    frame_size: int = sample_size(1, channel_config, sample_type)
+    samples: bytearray = bytearray(decoder.length * frame_size)
+    del samples[decoder.readinto(samples):]
+    # The length is only a hint and may even be unknown.
+    chunk: bytes = decoder.read(DEFAULT_BUFFER_SIZE)
+    while chunk:
+        samples += chunk
+        chunk = decoder.read(DEFAULT_BUFFER_SIZE)
+    return (samples, decoder.frequency, channel_config, sample_type,
+            decoder.loop_points)
 
 
 def free(names: Iterable[str], context: Optional[Context] = None) -> None:
@@ -342,14 +496,20 @@ def free(names: Iterable[str], context: Optional[Context] = None) -> None:
     cdef alure.Context alure_context = (<Context> context).impl
     # Cython cannot infer collection types yet.
     cdef vector[string] std_names = list(names)
-    for name in std_names: alure_context.remove_buffer(name)
+    cdef BufferCache buffer_cache = handler_of(alure_context).buffer_cache
+    for name in std_names:
+        alure_context.remove_buffer(name)
+        buffer_cache.discard(name)
 
 
 def decode(name: str, context: Optional[Context] = None) -> Decoder:
     """Return the decoder created from the given resource name.
 
-    This first tries user-registered decoder factories in
-    lexicographical order, then fallback to the internal ones.
+    This first tries user-registered decoder factories whose declared
+    signatures or extensions match the resource, then the ones
+    declaring neither, then the remaining ones, each group
+    in lexicographical order, and finally fallback to
+    the internal ones.
 
     Raise
     -----
@@ -360,21 +520,36 @@ def decode(name: str, context: Optional[Context] = None) -> Decoder:
     --------
     decoder_factories : Simple object for storing decoder factories
     """
-    def find_resource(name, subst):
-        if not name: raise RuntimeError('failed to open file')
-        try:
-            if fileio_factory is None:
-                return open(name, 'rb')
-            else:
-                return fileio_factory(name)
-        except FileNotFoundError:
-            return find_resource(subst(name), subst)
-
     if context is None: context = current_context()
     if not context: raise RuntimeError('there is no context current')
+    if pcm_cache is not None:
+        decoder = cached_decoder(name, context)
+        if decoder is not None: return decoder
+    return decode_resource(name, context)
+
+
+cdef object find_resource(str name, object subst):
+    """Return the file-like object of the given resource name,
+    substituting it with subst until one is found.
+    """
+    if not name: raise RuntimeError('failed to open file')
+    try:
+        if fileio_factory is None:
+            return open(name, 'rb')
+        else:
+            return fileio_factory(name)
+    except FileNotFoundError:
+        return find_resource(subst(name), subst)
+
+
+cdef object decode_resource(str name, Context context):
+    """Return the decoder created from the given resource name,
+    without looking up the PCM cache.
+    """
     resource = find_resource(
         name, context.message_handler.resource_not_found)
-    for decoder_factory in decoder_factories:
+    for decoder_factory in (<DecoderNamespace> decoder_factories).dispatch(
+            resource, name):
         resource.seek(0)
         try:
             return decoder_factory(resource)
@@ -383,6 +558,97 @@ def decode(name: str, context: Optional[Context] = None) -> Decoder:
     return Decoder(name, context)
 
 
+cdef object cached_decoder(str name, Context context):
+    """Return the decoder of the cached samples of the given file,
+    decoding and caching them first if needed.
+
+    If the resource is not a regular file or it has no samples,
+    return None.
+    """
+    try:
+        path: str = abspath(name)
+        status = stat(path)
+    except (OSError, ValueError):
+        return None
+    if not S_ISREG(status.st_mode): return None
+    # Registered factories may decode the same file differently.
+    key: str = sha256('\0'.join([
+        path, str(status.st_mtime_ns), str(status.st_size),
+        *sorted(vars(decoder_factories))]).encode()).hexdigest()
+    base: str = join(pcm_cache, key)
+    try:
+        with open(f'{base}.json') as f: info: Dict[str, Any] = load(f)
+        return map_samples(f'{base}.pcm', info)
+    except (OSError, ValueError, KeyError, IndexError):
+        pass
+
+    samples, frequency, channel_config, sample_type, loop_points = read_all(
+        decode_resource(name, context))
+    if not samples: return None
+    info = dict(frequency=frequency, channel_config=channel_config,
+                sample_type=sample_type, loop_points=loop_points)
+    # Metadata are written last since they mark complete entries.
+    for suffix, content, mode in (('.pcm', samples, 'wb'),
+                                  ('.json', info, 'w')):
+        with NamedTemporaryFile(mode, dir=pcm_cache, delete=False) as f:
+            if suffix == '.json':
+                dump(content, f)
+            else:
+                f.write(content)
+        replace(f.name, base + suffix)
+    return map_samples(f'{base}.pcm', info)
+
+
+cdef Decoder map_samples(path, dict info):
+    """Return the decoder of the memory-mapped samples
+    of the given format stored in path.
+    """
+    cdef alure.ChannelConfig channel_config = CHANNEL_CONFIGS.at(
+        info['channel_config'])
+    cdef alure.SampleType sample_type = SAMPLE_TYPES.at(info['sample_type'])
+    cdef pair[uint64_t, uint64_t] loop_points = info['loop_points']
+    with open(path, 'rb') as f: samples = mmap(f.fileno(), 0,
+                                               access=ACCESS_READ)
+    cdef Py_buffer view
+    PyObject_GetBuffer(samples, &view, PyBUF_C_CONTIGUOUS)
+    cdef CppArrayDecoder* impl
+    try:
+        impl = new CppArrayDecoder(view.buf, view.len, info['frequency'],
+                                   channel_config, sample_type)
+    finally:
+        PyBuffer_Release(&view)
+    impl.owner, impl.loop_points = samples, loop_points
+    decoder: Decoder = Decoder.__new__(Decoder)
+    decoder.pimpl = shared_ptr[alure.Decoder](impl)
+    return decoder
+
+
+def current_pcm_cache() -> Optional[str]:
+    """Return the directory of the decoded PCM cache currently in use.
+
+    If no cache is being used, return `None`.
+    """
+    return pcm_cache
+
+
+def use_pcm_cache(directory: Optional[str]) -> None:
+    """Persistently cache samples decoded from files in directory.
+
+    Cached samples are keyed by the absolute paths of the files,
+    their modification times and sizes and the names of the
+    registered decoder factories.  Once enabled, `decode`,
+    and thus buffer creation, decodes each file at most once
+    and memory-maps its stored samples afterwards.
+    The directory is created if it does not exist.
+
+    If `directory=None` is provided, stop using the cache.
+    Stored samples are left intact and can be removed manually.
+    """
+    global pcm_cache
+    if directory is not None: makedirs(directory, exist_ok=True)
+    pcm_cache = directory
+
+
 def current_fileio() -> Optional[Callable[[str], 'FileIO']]:
     """Return the file I/O factory currently in used by audio decoders.
 
@@ -396,16 +662,96 @@ def use_fileio(factory: Optional[Callable[[str], 'FileIO']],
     """Set the file I/O factory instance to be used by audio decoders.
 
     If `factory=None` is provided, revert to the default.
+
+    If `factory=MmapFileIO` is provided, internal decoders read
+    memory-mapped files natively without calling back into Python,
+    and `buffer_size` is ignored.
     """
     global fileio_factory
     fileio_factory = factory
     if fileio_factory is None:
         alure.FileIOFactory.set(unique_ptr[alure.FileIOFactory]())
+    elif fileio_factory is MmapFileIO:
+        alure.FileIOFactory.set(unique_ptr[alure.FileIOFactory](
+            new MmapFileIOFactory()))
     else:
         alure.FileIOFactory.set(unique_ptr[alure.FileIOFactory](
             new CppFileIOFactory(fileio_factory, buffer_size)))
 
 
+CallStats: Type = NamedTuple('CallStats', [
+    ('calls', int), ('total', float), ('max', float), ('gil_wait', float)])
+CallStats.__doc__ = """Timing statistics of a callback recorded by palace.
+
+The total and maximum durations of the calls and the total time
+spent waiting for the global interpreter lock are in seconds.
+"""
+
+
+def enable_instrumentation(enabled: bool = True) -> None:
+    """Start or stop timing Python callbacks.
+
+    This covers the methods of `BaseDecoder`, `FileIO` and
+    `MessageHandler` called by palace, often from native threads
+    which are invisible to Python profilers, as well as
+    `Context.update`.  Statistics recorded previously are
+    cleared upon enabling.
+
+    See Also
+    --------
+    stats : Timing statistics of callbacks
+    """
+    global instrumenting
+    if enabled and not instrumenting:
+        call_records.clear()
+        decoder_records.clear()
+    instrumenting = enabled
+
+
+def stats(decoder: Optional[BaseDecoder] = None) -> Dict[str, CallStats]:
+    """Return timing statistics of callbacks by their names.
+
+    If a decoder is given, only return the statistics of calls
+    to its methods.  Recording must be turned on beforehand
+    via `enable_instrumentation`.
+    """
+    records: dict = call_records if decoder is None else (
+        decoder_records.get(decoder, {}))
+    return {name: record.stats() for name, record in records.items()}
+
+
+cdef class CallRecord:
+    """Mutable accumulator of timing statistics of a callback."""
+    cdef unsigned long long calls
+    cdef double total, max, gil_wait
+
+    cdef void add(self, double elapsed, double wait):
+        self.calls += 1
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.gil_wait += wait
+
+    cdef object stats(self):
+        return CallStats(self.calls, self.total, self.max, self.gil_wait)
+
+
+cdef void record(str name, double start, double acquired,
+                 object decoder=None) except *:
+    """Record the callback of the given name, which started
+    waiting for the GIL at start and acquired it at acquired.
+    """
+    cdef double elapsed = now() - acquired
+    cdef CallRecord call_record = call_records.get(name)
+    if call_record is None:
+        call_record = call_records[name] = CallRecord()
+    call_record.add(elapsed, acquired - start)
+    if decoder is None: return
+    cdef dict records = decoder_records.setdefault(decoder, {})
+    call_record = records.get(name)
+    if call_record is None: call_record = records[name] = CallRecord()
+    call_record.add(elapsed, acquired - start)
+
+
 cdef class DeviceNames:
     """Read-only namespace of device names by category.
 
@@ -476,20 +822,24 @@ cdef class Device:
     """
 
     cdef alure.Device impl
+    cdef object __weakref__
 
     def __init__(self, name: str = '', fallback: Iterable[str] = ()) -> None:
         names: Tuple[str] = name, *fallback
         message: Optional[str] = None
+        cdef string alure_name
         for name in names:
             if message is not None:
                 with catch_warnings():
                     simplefilter('always')
                     warn(message, category=RuntimeWarning)
+            alure_name = name
             try:
-                self.impl = devmgr.open_playback(name)
+                with nogil: self.impl = devmgr.open_playback(alure_name)
             except RuntimeError:
                 message = f'failed to open device: {name}'
             else:
+                wrappers[<size_t> self.impl.get_handle()] = self
                 return
         raise RuntimeError(message)
 
@@ -609,7 +959,8 @@ cdef class Device:
         If `ALC_SOFT_HRTF` extension is unavailable,
         this will be a no-op.
         """
-        self.impl.reset(mkattrs(attrs.items()))
+        cdef vector[alure.AttributePair] alure_attrs = mkattrs(attrs.items())
+        with nogil: self.impl.reset(alure_attrs)
 
     def pause_dsp(self) -> None:
         """Pause device processing and stop contexts' updates.
@@ -647,9 +998,32 @@ cdef class Device:
 
         All previously-created contexts must first be destroyed.
         """
-        self.impl.close()
+        cdef size_t handle = <size_t> self.impl.get_handle()
+        with nogil: self.impl.close()
+        wrappers.pop(handle, None)
 
 
+cdef class UpdateLock:
+    """Lock serializing calls into alure with the updates of a context.
+
+    This can be used as a context manager acquiring the lock
+    without holding the global interpreter lock.  If it is
+    not bound to any context, nothing is locked.
+
+    This class is NOT meant to be instantiated directly.
+    """
+
+    cdef shared_ptr[Updater] updater
+
+    def __enter__(self) -> None:
+        cdef Updater* updater = self.updater.get()
+        if updater == NULL: return
+        with nogil: updater.lock()
+
+    def __exit__(self, *exc) -> Optional[bool]:
+        if self.updater.get() != NULL: self.updater.get().unlock()
+
+
 cdef class Context:
     """Container maintaining the audio environment.
 
@@ -695,13 +1069,16 @@ cdef class Context:
     cdef alure.Context previous
     cdef readonly Device device
     cdef readonly Listener listener
+    cdef object __weakref__
 
     def __init__(self, device: Device, attrs: Dict[int, int] = {}) -> None:
-        self.impl = device.impl.create_context(mkattrs(attrs.items()))
+        cdef vector[alure.AttributePair] alure_attrs = mkattrs(attrs.items())
+        with nogil: self.impl = device.impl.create_context(alure_attrs)
+        wrappers[<size_t> self.impl.get_handle()] = self
         self.device = device
         self.listener = Listener(self)
         self.impl.set_message_handler(shared_ptr[alure.MessageHandler](
-            new CppMessageHandler(MessageHandler())))
+            new CppMessageHandler(MessageHandler(), BufferCache(self))))
 
     def __enter__(self) -> Context:
         self.previous = alure.Context.get_current()
@@ -743,7 +1120,18 @@ cdef class Context:
 
         The context must not be current when this is called.
         """
-        self.impl.destroy()
+        cdef Updater* updater = handler_of(self.impl).updater.get()
+        cdef size_t handle = <size_t> self.impl.get_handle()
+        with nogil:
+            updater.halt()
+            self.impl.destroy()
+        # The context's sources and source groups are destroyed as well,
+        # whose addresses may then be reused by another context.
+        wrappers.pop(handle, None)
+        for key, owner in list(owners.items()):
+            if owner == handle:
+                del owners[key]
+                wrappers.pop(key, None)
 
     def start_batch(self) -> None:
         """Suspend the context to start batching."""
@@ -753,16 +1141,113 @@ cdef class Context:
         """Continue processing the context and end batching."""
         self.impl.end_batch()
 
+    def set_sources(self, sources: Sequence[Source],
+                    const float[:, :] position = None,
+                    const float[:, :] velocity = None,
+                    const float[:] gain = None,
+                    const float[:] pitch = None) -> None:
+        """Update properties of many sources at once.
+
+        The updates are applied in a single batch without holding
+        the global interpreter lock, which is considerably cheaper
+        than setting the properties of each source one by one.
+
+        Parameters
+        ----------
+        sources : Sequence[Source]
+            Sources to be updated.
+        position : Optional[Any], optional
+            Array of shape `(len(sources), 3)` of 32-bit floats
+            (e.g. a NumPy array of `dtype=float32`) of 3D positions.
+        velocity : Optional[Any], optional
+            Array of shape `(len(sources), 3)` of 32-bit floats
+            of 3D velocities, in units per second.
+        gain : Optional[Any], optional
+            Array of shape `(len(sources),)` of 32-bit floats
+            of base linear volume gains.
+        pitch : Optional[Any], optional
+            Array of shape `(len(sources),)` of 32-bit floats
+            of linear pitch shift bases.
+
+        Raise
+        -----
+        ValueError
+            If any given array is of the wrong type or shape,
+            or contains invalid values.
+
+        See Also
+        --------
+        Source.position : 3D position of the source
+        Source.velocity : 3D velocity of the source
+        Source.gain : Base linear volume gain of the source
+        Source.pitch : Linear pitch shift base of the source
+        """
+        cdef vector[alure.Source] impls
+        for source in sources: impls.push_back((<Source?> source).impl)
+        cdef size_t n = impls.size()
+        if position is not None and (position.shape[0] != n
+                                     or position.shape[1] != 3):
+            raise ValueError('position must be of shape (len(sources), 3)')
+        if velocity is not None and (velocity.shape[0] != n
+                                     or velocity.shape[1] != 3):
+            raise ValueError('velocity must be of shape (len(sources), 3)')
+        if gain is not None and gain.shape[0] != n:
+            raise ValueError('gain must be of shape (len(sources),)')
+        if pitch is not None and pitch.shape[0] != n:
+            raise ValueError('pitch must be of shape (len(sources),)')
+
+        cdef bint has_position = position is not None
+        cdef bint has_velocity = velocity is not None
+        cdef bint has_gain = gain is not None
+        cdef bint has_pitch = pitch is not None
+        cdef Updater* updater = handler_of(self.impl).updater.get()
+        cdef size_t i
+        with nogil:
+            updater.lock()
+            self.impl.start_batch()
+            try:
+                for i in range(n):
+                    if has_position:
+                        impls[i].set_position(alure.Vector3(
+                            position[i, 0], position[i, 1], position[i, 2]))
+                    if has_velocity:
+                        impls[i].set_velocity(alure.Vector3(
+                            velocity[i, 0], velocity[i, 1], velocity[i, 2]))
+                    if has_gain: impls[i].set_gain(gain[i])
+                    if has_pitch: impls[i].set_pitch(pitch[i])
+            finally:
+                self.impl.end_batch()
+                updater.unlock()
+
     @property
     def message_handler(self) -> MessageHandler:
-        """Handler of some certain events."""
+        """Handler of some certain events.
+
+        Which `MessageHandler` methods are overridden is checked
+        once upon assignment, so that messages not handled in Python
+        never acquire the global interpreter lock, e.g. when buffers
+        are loaded asynchronously.  Methods overridden afterwards
+        only take effect on the next assignment.
+        """
         return static_pointer_cast[CppMessageHandler, alure.MessageHandler](
             self.impl.get_message_handler()).get()[0].pyo
 
     @message_handler.setter
     def message_handler(self, message_handler: MessageHandler) -> None:
-        static_pointer_cast[CppMessageHandler, alure.MessageHandler](
-            self.impl.get_message_handler()).get()[0].pyo = message_handler
+        handler_of(self.impl).use(message_handler)
+
+    @getter
+    def buffer_cache(self) -> BufferCache:
+        """Manager of buffers cached by this context."""
+        return handler_of(self.impl).buffer_cache
+
+    def cached_buffers(self) -> List[CachedBuffer]:
+        """Return information of buffers recorded by `buffer_cache`.
+
+        The buffers are ordered from the least to the most recently
+        used.  This method requires the context to be current.
+        """
+        return handler_of(self.impl).buffer_cache.records()
 
     @property
     def async_wake_interval(self) -> int:
@@ -776,7 +1261,7 @@ cdef class Context:
     def is_supported(self, channel_config: str, sample_type: str) -> bool:
         """Return if the channel config and sample type is supported.
 
-        This method require the context to be current.
+        This method requires the context to be current.
 
         See Also
         --------
@@ -804,7 +1289,7 @@ cdef class Context:
         this will be an empty list. Otherwise there would be
         at least one entry.
 
-        This method require the context to be current.
+        This method requires the context to be current.
         """
         cdef alure.ArrayView[string] resamplers
         resamplers = self.impl.get_available_resamplers()
@@ -821,7 +1306,7 @@ cdef class Context:
         without extension, undefined behavior will occur
         (accessing an out of bounds array index).
 
-        This method require the context to be current.
+        This method requires the context to be current.
         """
         return self.impl.get_default_resampler_index()
 
@@ -868,13 +1353,165 @@ cdef class Context:
             raise ValueError(f'invalid distance model: {value}') from None
 
     def update(self) -> None:
-        """Update the context and all sources belonging to this context."""
-        self.impl.update()
-        # source_stopped is called outside of alure::Context::update
-        # to allow applications to destroy the source on this message.
-        handler: MessageHandler = self.message_handler
-        while handler.stopped_sources:
-            handler.source_stopped(handler.stopped_sources.pop())
+        """Update the context and all sources belonging to this context.
+
+        Messages queued since the previous update, including the ones
+        received by the auto-updating thread, are then dispatched
+        to the message handler at once via `MessageHandler.on_batch`.
+
+        See Also
+        --------
+        Context.start_auto_update : Update the context natively
+        Context.drain_events : Take queued messages without dispatching
+        """
+        cdef double start = now()
+        cdef CppMessageHandler* cpp_handler = handler_of(self.impl)
+        cdef Updater* updater = cpp_handler.updater.get()
+        with nogil: updater.update(self.impl)
+        # Messages are dispatched outside of alure::Context::update
+        # to allow applications to destroy sources on them.
+        cpp_handler.dispatch(take_events(updater, <size_t> -1))
+        cpp_handler.buffer_cache.evict()
+        if instrumenting: record('Context.update', start, start)
+
+    def drain_events(self, max: Optional[int] = None) -> List[Event]:
+        """Take queued messages of this context without dispatching.
+
+        Messages are queued as soon as they are received, e.g. during
+        updates or calls to `SourceGroup.stop_all`.  At most `max`
+        of the oldest ones are taken, or all of them by default.
+        Taken messages are neither passed to the message handler
+        nor to `events` iterators.
+
+        The queue holds about 4096 messages, beyond which
+        the oldest ones are dropped, e.g. when the context is only
+        updated natively and nothing takes the messages.
+        Messages of sources stopping are never dropped,
+        but only the latest one of each source is kept
+        once the queue is full of them.
+        """
+        cdef Updater* updater = handler_of(self.impl).updater.get()
+        if max is None: return take_events(updater, <size_t> -1)
+        return take_events(updater, max)
+
+    def start_auto_update(self, period: int) -> None:
+        """Update the context every `period` milliseconds natively.
+
+        The updates are run on a dedicated thread without holding
+        the global interpreter lock, so that streaming and fading
+        do not depend on the responsiveness of Python threads.
+        Messages received are queued until the next `update` call.
+        Any previous auto-updating of this context is stopped.
+
+        Note
+        ----
+        Updates are serialized with `update` and with the methods
+        and property setters of sources and source groups,
+        `Buffer.play`, `Decoder.play` and `set_sources`,
+        which wait for any running update without holding
+        the global interpreter lock.  `Source.wait` and `wait_idle`
+        only read the sources found active by the last update.
+
+        If an update fails, auto-updating stops and the error
+        is raised by the next `stop_auto_update` or `auto_updating`.
+
+        See Also
+        --------
+        Context.stop_auto_update : Stop updating the context natively
+        """
+        cdef Updater* updater = handler_of(self.impl).updater.get()
+        cdef milliseconds interval = milliseconds(period)
+        with nogil: updater.start(self.impl, interval)
+
+    def stop_auto_update(self) -> None:
+        """Stop updating the context natively, if it is.
+
+        Raise
+        -----
+        RuntimeError
+            If auto-updating has been stopped by a failed update.
+        """
+        cdef Updater* updater = handler_of(self.impl).updater.get()
+        with nogil: updater.stop()
+
+    @getter
+    def auto_updating(self) -> bool:
+        """Whether the context is being updated natively.
+
+        Raise
+        -----
+        RuntimeError
+            If auto-updating has been stopped by a failed update.
+        """
+        cdef Updater* updater = handler_of(self.impl).updater.get()
+        cdef boolean result
+        with nogil: result = updater.is_running()
+        return result
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no played source is playing or paused.
+
+        Only sources played via `Buffer.play` and `Decoder.play`
+        are taken into account.  Return `False` if `timeout`
+        seconds have passed before that happens, otherwise `True`.
+
+        The condition is only rechecked after each update, so either
+        `start_auto_update` or `update` on another thread is needed
+        to wait longer than the expiration of the timeout.
+        """
+        cdef Updater* updater = handler_of(self.impl).updater.get()
+        cdef milliseconds ms = to_timeout(timeout)
+        cdef boolean result
+        with nogil: result = updater.wait_idle(ms)
+        return result
+
+    async def update_forever(self, interval: Optional[float] = None) -> None:
+        """Update the context periodically on the running event loop.
+
+        This coroutine never returns and is meant to be wrapped
+        in a task, which can be cancelled to stop updating.
+
+        Parameters
+        ----------
+        interval : Optional[float], optional
+            Number of seconds between updates.  If not specified,
+            `async_wake_interval` is used, or 25 ms if that is zero.
+
+        See Also
+        --------
+        Context.update : Update the context and its sources
+        Source.finished : Wait for a source to stop playing
+        Context.events : Iterate over messages of this context
+        """
+        while True:
+            self.update()
+            if interval is None:
+                await async_sleep(self.async_wake_interval/1000 or 0.025)
+            else:
+                await async_sleep(interval)
+
+    async def events(self) -> AsyncIterator[Tuple[str, Any]]:
+        """Iterate over messages of this context.
+
+        Each event is a pair of the message name and its target,
+        as described in `Event`, given after the message handler
+        is called.  Only messages dispatched after the iteration
+        starts are given.
+
+        Note
+        ----
+        Messages are only delivered during `Context.update` calls,
+        e.g. by running `Context.update_forever` on the same loop.
+        """
+        listeners: list = static_pointer_cast[
+            CppMessageHandler, alure.MessageHandler](
+                self.impl.get_message_handler()).get()[0].listeners
+        listener = get_event_loop(), Queue()
+        listeners.append(listener)
+        try:
+            while True: yield await listener[1].get()
+        finally:
+            listeners.remove(listener)
 
 
 cdef class Listener:
@@ -897,10 +1534,12 @@ cdef class Listener:
     """
 
     cdef alure.Listener impl
+    cdef alure.Context context
 
     def __init__(self, context: Optional[Context] = None) -> None:
         if context is None: context = current_context()
-        self.impl = (<Context> context).impl.get_listener()
+        self.context = (<Context> context).impl
+        self.impl = self.context.get_listener()
 
     def __bool__(self) -> bool: return <boolean> self.impl
 
@@ -912,7 +1551,9 @@ cdef class Listener:
     @setter
     def position(self, value: Vector3) -> None:
         """3D position of the listener."""
-        self.impl.set_position(to_vector3(value))
+        cdef alure.Vector3 position = to_vector3(value)
+        self.impl.set_position(position)
+        handler_of(self.context).listener_position = position
 
     @setter
     def velocity(self, value: Vector3) -> None:
@@ -988,11 +1629,20 @@ cdef class Buffer:
         if context is None: context = current_context()
         if not context: raise RuntimeError('there is no context current')
         self.context, self.name = context, name
-        self.impl = self.context.impl.find_buffer(self.name)
-        if not self:
-            decoder: Decoder = decode(self.name, self.context)
-            self.impl = self.context.impl.create_buffer_from(
-                self.name, decoder.pimpl)
+        cdef string alure_name = name
+        with nogil: self.impl = self.context.impl.find_buffer(alure_name)
+        cdef BufferCache buffer_cache = handler_of(
+            self.context.impl).buffer_cache
+        if self:
+            buffer_cache.hits += 1
+            buffer_cache.touch(name)
+            return
+        start: float = monotonic()
+        decoder: Decoder = decode(self.name, self.context)
+        with nogil: self.impl = self.context.impl.create_buffer_from(
+            alure_name, decoder.pimpl)
+        buffer_cache.misses += 1
+        buffer_cache.add(self, monotonic() - start, True)
 
     def __enter__(self) -> Buffer: return self
     def __exit__(self, *exc) -> Optional[bool]: self.destroy()
@@ -1051,10 +1701,131 @@ cdef class Buffer:
         if context is None: context = current_context()
         buffer: Buffer = Buffer.__new__(Buffer)
         buffer.context, buffer.name = context, name
-        buffer.impl = buffer.context.impl.create_buffer_from(
-            buffer.name, decoder.pimpl)
+        cdef string alure_name = name
+        start: float = monotonic()
+        with nogil: buffer.impl = buffer.context.impl.create_buffer_from(
+            alure_name, decoder.pimpl)
+        handler_of(buffer.context.impl).buffer_cache.add(
+            buffer, monotonic() - start, True)
         return buffer
 
+    @staticmethod
+    def load_async(name: str, context: Optional[Context] = None) -> Future:
+        """Return a future of the buffer loaded asynchronously.
+
+        The audio resource is decoded on alure's background thread,
+        and the returned `concurrent.futures.Future` is set with
+        the corresponding `Buffer` once it is loaded, or with
+        the exception raised during loading.  If the buffer is already
+        cached, the future would be done almost immediately.
+
+        Parameters
+        ----------
+        name : str
+            Audio file or resource name.
+        context : Optional[Context], optional
+            The context from which the buffer is to be created and cached.
+            By default `current_context()` is used.
+
+        Raise
+        -----
+        RuntimeError
+            If there is neither any context specified nor current.
+
+        See Also
+        --------
+        cache : Cache multiple audio resources asynchronously
+        """
+        if context is None: context = current_context()
+        if not context: raise RuntimeError('there is no context current')
+        return load_buffer_async(context, name)
+
+    @staticmethod
+    def from_array(array: Any, name: str, frequency: int,
+                   channel_config: Optional[str] = None,
+                   context: Optional[Context] = None) -> Buffer:
+        """Return a buffer created from the given array of samples.
+
+        The samples are uploaded directly from the memory
+        of the array, without calling back into Python.
+        Arrays which are not C-contiguous, e.g. strided slices,
+        are copied to contiguous memory first.
+
+        Parameters
+        ----------
+        array : Any
+            An object following Python buffer protocol,
+            e.g. a NumPy array, whose item format determines the sample
+            type: `'B'` for unsigned 8-bit, `'h'` for signed 16-bit
+            and `'f'` for 32-bit float.  Interleaved samples
+            of multiple channels may be given in a 2D array
+            of shape `(length, channels)`.
+        name : str
+            The name to give to the buffer.  It may alias an audio file,
+            but it must not currently exist in the buffer cache.
+        frequency : int
+            Sample frequency in hertz.
+        channel_config : Optional[str], optional
+            Channel configuration of the samples.  By default
+            this is inferred from the number of channels.
+        context : Optional[Context], optional
+            The context from which the buffer is to be created.
+            By default `current_context()` is used.
+
+        Raise
+        -----
+        ValueError
+            If the sample type or channel configuration is either
+            invalid or cannot be inferred from the array.
+        RuntimeError
+            If there is neither any context specified nor current;
+            or if `name` is already used for another buffer.
+
+        See Also
+        --------
+        from_buffer : Create a buffer from raw samples
+        """
+        view: memoryview = memoryview(array)
+        try:
+            sample_type = ARRAY_SAMPLE_TYPES[view.format.lstrip('@=')]
+        except KeyError:
+            raise ValueError(f'unsupported array format: {view.format}')
+        if channel_config is None:
+            channels = 1 if view.ndim < 2 else view.shape[-1]
+            try:
+                channel_config = ARRAY_CHANNEL_CONFIGS[channels]
+            except KeyError:
+                raise ValueError(
+                    f'unable to infer channel config: {channels}') from None
+        return buffer_from_memory(
+            view, name, frequency, channel_config, sample_type, context)
+
+    @staticmethod
+    def from_buffer(data: Any, name: str, frequency: int,
+                    channel_config: str, sample_type: str,
+                    context: Optional[Context] = None) -> Buffer:
+        """Return a buffer created from the given raw samples.
+
+        Like `from_array`, the samples are uploaded directly
+        from the memory of `data`, which can be of any object
+        following Python buffer protocol, e.g. `bytes`,
+        `bytearray` or `memoryview`, and is copied first
+        if it is not C-contiguous.  Its item format is ignored
+        in favor of the specified `sample_type`.
+
+        Raise
+        -----
+        ValueError
+            If either channel_config or sample_type is invalid,
+            or if the size of `data` is not a multiple of
+            the frame size.
+        RuntimeError
+            If there is neither any context specified nor current;
+            or if `name` is already used for another buffer.
+        """
+        return buffer_from_memory(memoryview(data), name, frequency,
+                                  channel_config, sample_type, context)
+
     @getter
     def length(self) -> int:
         """Length of the buffer in sample frames."""
@@ -1103,7 +1874,10 @@ cdef class Buffer:
         One buffer may be played from multiple sources simultaneously.
         """
         if source is None: source = Source(self.context)
-        (<Source> source).impl.play(self.impl)
+        with update_lock(self.context.impl):
+            (<Source> source).impl.play(self.impl)
+        track(self.context.impl, source)
+        handler_of(self.context.impl).buffer_cache.touch(self.name)
         return source
 
     @property
@@ -1135,12 +1909,8 @@ cdef class Buffer:
     @getter
     def sources(self) -> List[Source]:
         """`Source` objects currently playing the buffer."""
-        sources = []
-        for alure_source in self.impl.get_sources():
-            source: Source = Source.__new__(Source)
-            source.impl = alure_source
-            sources.append(source)
-        return sources
+        return [wrap_source(alure_source)
+                for alure_source in self.impl.get_sources()]
 
     @getter
     def source_count(self) -> int:
@@ -1160,13 +1930,389 @@ cdef class Buffer:
         This invalidates all other `Buffer` objects with the same name.
         """
         self.context.impl.remove_buffer(self.impl)
+        handler_of(self.context.impl).buffer_cache.discard(self.name)
 
 
+cdef class PendingBuffer:
+    """Buffer being loaded asynchronously by alure.
+
+    This class is NOT meant to be instantiated.
+    """
+
+    cdef alure.SharedFuture[alure.Buffer] impl
+    cdef Context context
+    cdef str name
+    cdef double start
+
+    def result(self) -> Buffer:
+        """Wait for the buffer to be loaded and return it."""
+        with nogil: self.impl.wait()
+        buffer: Buffer = Buffer.__new__(Buffer)
+        buffer.context, buffer.name = self.context, self.name
+        buffer.impl = self.impl.get()
+        # Eviction is left to the thread updating the context.
+        handler_of(self.context.impl).buffer_cache.add(
+            buffer, monotonic() - self.start, False)
+        return buffer
+
+
+cdef object load_buffer_async(Context context, str name):
+    """Return a future of the buffer of the given name."""
+    global buffer_loader
+    cdef PendingBuffer pending = PendingBuffer.__new__(PendingBuffer)
+    pending.context, pending.name, pending.start = context, name, monotonic()
+    cdef string alure_name = name
+    try:
+        with nogil: pending.impl = context.impl.get_buffer_async(alure_name)
+    except RuntimeError as e:
+        future: Future = Future()
+        future.set_exception(e)
+        return future
+    if buffer_loader is None:
+        buffer_loader = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='palace-buffer-loader')
+    return buffer_loader.submit(pending.result)
+
+
+# Cython does not keep class-level annotations NamedTuple relies on.
+CachedBuffer: Type = NamedTuple('CachedBuffer', [
+    ('name', str), ('size', int), ('length', int), ('frequency', int),
+    ('channel_config', str), ('sample_type', str), ('source_count', int),
+    ('load_time', float)])
+CachedBuffer.__doc__ = """Information of a buffer recorded by `BufferCache`.
+
+The loading time is in seconds, including the time waiting
+in the queue for buffers loaded asynchronously.
+"""
+
+
+cdef class BufferCache:
+    """Byte-budgeted manager of buffers cached by a context.
+
+    Buffers created by palace, e.g. via `Buffer`, `cache`
+    or `Buffer.from_array`, are recorded with their size
+    and the time they were last looked up or played.
+    When the total size exceeds `max_bytes`, the least recently
+    used buffers which are not being played are freed.
+    Being freed only from the context's cache, an evicted buffer
+    is transparently reloaded on the next `Buffer` lookup,
+    which never evicts the buffer it loads.
+
+    Iterating over the cache gives the names of the recorded buffers,
+    from the least to the most recently used.
+
+    Parameters
+    ----------
+    context : Context
+        The context whose buffers are to be managed.
+
+    Attributes
+    ----------
+    hits : int
+        Number of `Buffer` lookups served by the context's cache.
+    misses : int
+        Number of `Buffer` lookups decoding synchronously.
+    decode_time : float
+        Total number of seconds spent on synchronous loading,
+        including misses and buffers created from decoders or arrays.
+
+    See Also
+    --------
+    Context.buffer_cache : Manager of buffers cached by the context
+    Context.cached_buffers : Information of recorded buffers
+
+    Note
+    ----
+    Like `Buffer.destroy`, eviction invalidates all `Buffer` objects
+    of the evicted names, so they should not be kept around.  Budget
+    is enforced when buffers are loaded synchronously and during
+    `Context.update`, which are also where the context must be current.
+    """
+
+    cdef alure.Context impl
+    # Names mapped to sizes, times of last use and loading durations
+    cdef object entries    # type: OrderedDict[str, Tuple[int, float, float]]
+    cdef object lock
+    cdef size_t total
+    cdef object budget     # type: Optional[int]
+    cdef readonly unsigned long long hits
+    cdef readonly unsigned long long misses
+    cdef readonly double decode_time
+
+    def __init__(self, context: Context) -> None:
+        self.impl = context.impl
+        self.entries, self.lock = OrderedDict(), Lock()
+        self.total, self.budget = 0, None
+        self.hits = self.misses = 0
+        self.decode_time = 0.0
+
+    def __len__(self) -> int: return len(self.entries)
+    def __contains__(self, name: Any) -> bool: return name in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        with self.lock: return iter(list(self.entries))
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """Budget of the total size of cached buffers in bytes.
+
+        If set to `None` (default), nothing is evicted automatically.
+        Setting a budget evicts buffers exceeding it right away.
+        """
+        return self.budget
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]) -> None:
+        if value is not None and value < 0:
+            raise ValueError(f'invalid budget: {value}')
+        self.budget = value
+        self.evict()
+
+    @getter
+    def size(self) -> int:
+        """Total size of the recorded buffers in bytes."""
+        return self.total
+
+    def evict(self) -> List[str]:
+        """Free least recently used buffers exceeding the budget.
+
+        Return the names of the evicted buffers.
+        """
+        return self.trim(None)
+
+    cdef list trim(self, str keep):
+        """Evict buffers exceeding the budget, except the given one."""
+        evicted: List[str] = []
+        if self.budget is None or self.total <= self.budget: return evicted
+        cdef alure.Buffer buffer
+        cdef string alure_name
+        with self.lock: names = list(self.entries)
+        for name in names:
+            if self.total <= self.budget: break
+            if name == keep: continue
+            alure_name = name
+            # findBuffer blocks on pending asynchronous loads,
+            # whose message handler may need the GIL or the lock.
+            with nogil: buffer = self.impl.find_buffer(alure_name)
+            if <boolean> buffer and buffer.get_source_count(): continue
+            if <boolean> buffer: self.impl.remove_buffer(buffer)
+            with self.lock:
+                if name not in self.entries: continue
+                self.total -= self.entries.pop(name)[0]
+            evicted.append(name)
+        return evicted
+
+    cdef void add(self, Buffer buffer, double load_time,
+                  boolean sync) except *:
+        """Record the given newly loaded buffer."""
+        try:
+            size = buffer.impl.get_size()
+        except RuntimeError:    # context not current on this thread
+            return
+        with self.lock:
+            if buffer.name in self.entries:
+                self.total -= self.entries.pop(buffer.name)[0]
+            self.entries[buffer.name] = size, monotonic(), load_time
+            self.total += size
+        if not sync: return
+        self.decode_time += load_time
+        self.trim(buffer.name)
+
+    cdef void touch(self, str name) except *:
+        """Mark the buffer of the given name as recently used."""
+        with self.lock:
+            if name not in self.entries: return
+            size, last_used, load_time = self.entries[name]
+            self.entries[name] = size, monotonic(), load_time
+            self.entries.move_to_end(name)
+
+    cdef list records(self):
+        """Return information of the recorded buffers still cached."""
+        cdef list result = []
+        cdef alure.Buffer buffer
+        cdef string alure_name
+        with self.lock: entries = list(self.entries.items())
+        for name, (size, last_used, load_time) in entries:
+            alure_name = name
+            with nogil: buffer = self.impl.find_buffer(alure_name)
+            if not <boolean> buffer: continue
+            result.append(CachedBuffer(
+                name, size, buffer.get_length(), buffer.get_frequency(),
+                alure.get_channel_config_name(buffer.get_channel_config()),
+                alure.get_sample_type_name(buffer.get_sample_type()),
+                buffer.get_source_count(), load_time))
+        return result
+
+    cdef void discard(self, str name) except *:
+        """Forget the buffer of the given name."""
+        with self.lock:
+            if name in self.entries:
+                self.total -= self.entries.pop(name)[0]
+
+
+cdef void resolve_stop_waiters(size_t handle):
+    """Set results of futures waiting for the given source to stop."""
+    for loop, future in stop_waiters.pop(handle, ()):
+        loop.call_soon_threadsafe(_set_result_if_pending, future)
+
+
+def _set_result_if_pending(future: Any) -> None:
+    """Set the result of the future to None unless it is done."""
+    if not future.done(): future.set_result(None)
+
+
+cdef Device wrap_device(alure.Device impl):
+    """Return the wrapper of the given device, creating it if needed."""
+    cdef size_t handle = <size_t> impl.get_handle()
+    device = wrappers.get(handle)
+    if not isinstance(device, Device):
+        device = Device.__new__(Device)
+        (<Device> device).impl = impl
+        wrappers[handle] = device
+    return device
+
+
+cdef Context wrap_context(alure.Context impl):
+    """Return the wrapper of the given context, creating it if needed."""
+    cdef size_t handle = <size_t> impl.get_handle()
+    context = wrappers.get(handle)
+    if not isinstance(context, Context):
+        context = Context.__new__(Context)
+        (<Context> context).impl = impl
+        (<Context> context).device = wrap_device(impl.get_device())
+        (<Context> context).listener = Listener(context)
+        wrappers[handle] = context
+    return context
+
+
+cdef Source wrap_source(alure.Source impl):
+    """Return the wrapper of the given source, creating it if needed."""
+    cdef size_t handle = <size_t> impl.get_handle()
+    source = wrappers.get(handle)
+    if not isinstance(source, Source):
+        source = Source.__new__(Source)
+        (<Source> source).impl = impl
+        wrappers[handle] = source
+    return source
+
+
+cdef SourceGroup wrap_source_group(alure.SourceGroup impl):
+    """Return the wrapper of the given source group,
+    creating it if needed.
+    """
+    cdef size_t handle = <size_t> impl.get_handle()
+    source_group = wrappers.get(handle)
+    if not isinstance(source_group, SourceGroup):
+        source_group = SourceGroup.__new__(SourceGroup)
+        (<SourceGroup> source_group).impl = impl
+        if handle: wrappers[handle] = source_group
+    return source_group
+
+
+cdef CppMessageHandler* handler_of(alure.Context context) except NULL:
+    """Return the native message handler of the given context."""
+    if not <boolean> context:
+        raise RuntimeError('there is no context current')
+    return static_pointer_cast[CppMessageHandler, alure.MessageHandler](
+        context.get_message_handler()).get()
+
+
+cdef alure.Context current_impl():
+    """Return the implementation of the current context."""
+    if _thread: return alure.Context.get_thread_current()
+    return alure.Context.get_current()
+
+
+cdef milliseconds to_timeout(timeout: Optional[float]):
+    """Convert the timeout in seconds for waiting natively."""
+    if timeout is None: return milliseconds(-1)
+    return milliseconds(max(0, <long long> (timeout * 1000)))
+
+
+cdef void track(alure.Context context, Source source,
+                shared_ptr[StreamTelemetry] telemetry = \
+                shared_ptr[StreamTelemetry]()) except *:
+    """Track the played source for Context.wait_idle,
+    along with the telemetry of its stream if any.
+    """
+    cdef Updater* updater = handler_of(context).updater.get()
+    with nogil: updater.track(source.impl, telemetry)
+
+
+cdef void forget(alure.Context context, alure.Source source) except *:
+    """Stop tracking the source, waking up its waiters,
+    unless the context is null.
+    """
+    if not <boolean> context: return
+    cdef Updater* updater = handler_of(context).updater.get()
+    with nogil: updater.forget(source)
+
+
+cdef alure.Context owner_of(size_t handle):
+    """Return the context owning the source or source group
+    of the given address, or a null one if it is unknown.
+    """
+    owner = owners.get(handle)
+    if owner is None: return alure.Context()
+    return alure.Context(<alure.ContextImpl*> <size_t> owner)
+
+
+cdef UpdateLock update_lock(alure.Context context):
+    """Return the lock serializing calls with the updates
+    of the given context, which locks nothing if it is null.
+    """
+    cdef UpdateLock lock = UpdateLock.__new__(UpdateLock)
+    if <boolean> context: lock.updater = handler_of(context).updater
+    return lock
+
+
+StreamStats: Type = NamedTuple('StreamStats', [
+    ('chunks_queued', int), ('chunks_consumed', int), ('queue_depth', int),
+    ('min_headroom', Optional[int]), ('underruns', int),
+    ('latency_histogram', Tuple[int, ...]),
+    ('decode_speed', Optional[float]), ('prefetch_depth', int)])
+StreamStats.__doc__ = """Telemetry of a stream played by a source.
+
+Attributes
+----------
+chunks_queued : int
+    Number of chunks read from the decoder.
+chunks_consumed : int
+    Number of chunks finished playing, as of the last sample.
+queue_depth : int
+    Number of chunks queued but not yet played, as of the last sample.
+min_headroom : Optional[int]
+    Minimum sample frames queued ahead of playback over all samples,
+    or `None` if it has never been sampled.
+underruns : int
+    Number of times the queue was sampled empty before the end
+    of the stream, counting consecutive samples only once,
+    plus the chunks a prefetching ring had to pad with silence.
+latency_histogram : Tuple[int, ...]
+    Sample counts of the source's latency under 1, 2, 4, ..., 256 ms
+    and of higher latency.
+decode_speed : Optional[float]
+    Ratio of the duration of the decoded audio to the time spent
+    decoding it, or `None` if nothing has been decoded.
+prefetch_depth : int
+    Current depth limit in chunks of the adaptive prefetching ring,
+    or 0 if the stream is not adaptively prefetched.
+
+Note
+----
+The headroom is only sampled until the stream loops back.
+"""
+
+
 cdef class Source:
     """Sound source for playing audio.
 
     There is no practical limit to the number of sources one may create.
 
+    As long as a `Source` object is alive, it is the one returned
+    wherever its source is reported, e.g. by `Buffer.sources`
+    or to `MessageHandler`, so identity comparisons are reliable.
+
     When the source is no longer needed, `destroy` must be called,
     unless the context manager is used, which guarantees the source's
     destructioni upon completion of the block, even if an error occurs.
@@ -1184,11 +2330,16 @@ cdef class Source:
     """
 
     cdef alure.Source impl
+    cdef object __weakref__
 
     def __init__(self, context: Optional[Context] = None) -> None:
         if context is None: context = current_context()
         if not context: raise RuntimeError('there is no context current')
-        self.impl = (<Context> context).impl.create_source()
+        with update_lock((<Context> context).impl):
+            self.impl = (<Context> context).impl.create_source()
+        cdef size_t handle = <size_t> self.impl.get_handle()
+        wrappers[handle] = self
+        owners[handle] = <size_t> (<Context> context).impl.get_handle()
 
     def __enter__(self) -> Source: return self
     def __exit__(self, *exc) -> Optional[bool]: self.destroy()
@@ -1219,9 +2370,18 @@ cdef class Source:
 
     def __bool__(self) -> bool: return <boolean> self.impl
 
+    cdef UpdateLock serialized(self):
+        """Return the lock serializing calls with the updates
+        of the source's context.
+        """
+        return update_lock(owner_of(<size_t> self.impl.get_handle()))
+
     def stop(self) -> None:
         """Stop playback, releasing the buffer or decoder reference."""
-        self.impl.stop()
+        cdef size_t handle = <size_t> self.impl.get_handle()
+        with self.serialized(): self.impl.stop()
+        forget(owner_of(handle), self.impl)
+        resolve_stop_waiters(handle)
 
     def fade_out_to_stop(self, gain: float, ms: int) -> None:
         """Fade the source to `gain` over `ms` milliseconds.
@@ -1239,15 +2399,16 @@ cdef class Source:
         which should be called regularly (30 to 50 times per second)
         for the fading to be smooth.
         """
-        self.impl.fade_out_to_stop(gain, milliseconds(ms))
+        with self.serialized():
+            self.impl.fade_out_to_stop(gain, milliseconds(ms))
 
     def pause(self) -> None:
         """Pause the source if it is playing."""
-        self.impl.pause()
+        with self.serialized(): self.impl.pause()
 
     def resume(self) -> None:
         """Resume the source if it is paused."""
-        self.impl.resume()
+        with self.serialized(): self.impl.resume()
 
     @getter
     def playing(self) -> bool:
@@ -1259,6 +2420,113 @@ cdef class Source:
         """Whether the source is currently paused."""
         return self.impl.is_paused()
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the source is neither playing nor paused.
+
+        Return `False` if `timeout` seconds have passed before that
+        happens, otherwise `True`.
+
+        The condition is only rechecked after each update of
+        the source's context and upon `stop`, so either
+        `Context.start_auto_update` or `Context.update` on another
+        thread is needed to wait longer than the expiration of
+        the timeout.  Sources not played by `Buffer.play`
+        or `Decoder.play` are considered stopped.
+        """
+        cdef alure.Context owner = owner_of(<size_t> self.impl.get_handle())
+        if not <boolean> owner: return True
+        cdef Updater* updater = handler_of(owner).updater.get()
+        cdef milliseconds ms = to_timeout(timeout)
+        cdef boolean result
+        with nogil: result = updater.wait(self.impl, ms)
+        return result
+
+    def finished(self) -> Awaitable[None]:
+        """Return a future on the running event loop done on stop.
+
+        The future's result is set when the source is stopped,
+        either when its playback is finished, forcefully stopped,
+        or when `stop` or `destroy` is called.  If the source is
+        neither playing nor paused, the returned future is already done.
+
+        Note
+        ----
+        Finished playbacks are only detected during `Context.update`
+        calls, e.g. by running `Context.update_forever` on the loop.
+        """
+        loop = get_event_loop()
+        future = loop.create_future()
+        if self.playing or self.paused:
+            stop_waiters.setdefault(<size_t> self.impl.get_handle(),
+                                    []).append((loop, future))
+        else:
+            future.set_result(None)
+        return future
+
+    @getter
+    def stream_stats(self) -> Optional[StreamStats]:
+        """Telemetry of the stream played by `Decoder.play`.
+
+        This is `None` if the source is not streaming as of
+        the last update of its context.  The queue depth,
+        headroom and latency are sampled during the updates,
+        so an underrun only counts if the queue is sampled empty,
+        except for prefetched streams, whose ring also counts
+        every chunk it pads with silence.
+        """
+        owner = owners.get(<size_t> self.impl.get_handle())
+        if owner is None: return None
+        cdef Updater* updater = handler_of(alure.Context(
+            <alure.ContextImpl*> <size_t> owner)).updater.get()
+        cdef NativeStreamStats native
+        cdef boolean found
+        with nogil: found = updater.stream_stats(self.impl, native)
+        if not found: return None
+        return StreamStats(
+            native.chunks, native.consumed, native.depth,
+            None if native.min_headroom == <uint64_t> -1
+            else native.min_headroom,
+            native.underruns, tuple(native.latency),
+            native.speed or None, native.prefetch)
+
+    def play_stream(self, chunks: Iterable[Any], frequency: int,
+                    channel_config: str, sample_type: str,
+                    chunk_len: int, queue_size: int) -> ChunkDecoder:
+        """Stream raw samples from the given iterable of chunks.
+
+        This is a shorthand for playing a `ChunkDecoder`
+        via `Decoder.play` on this source.
+
+        Parameters
+        ----------
+        chunks : Iterable[Any]
+            Chunks of samples, e.g. `bytes` or NumPy arrays,
+            only taken when the playback queue has room for more.
+        frequency : int
+            Sample frequency, in hertz.
+        channel_config : str
+            Channel configuration of the samples.
+        sample_type : str
+            Sample type of the samples.
+        chunk_len : int
+            The number of sample frames to read for each chunk update.
+        queue_size : int
+            The number of chunks to keep queued during playback.
+
+        Return
+        ------
+        The decoder streaming the chunks, which also counts underruns.
+
+        Raise
+        -----
+        ValueError
+            If the channel config or the sample type is invalid.
+        """
+        decoder: ChunkDecoder = ChunkDecoder(
+            chunks, frequency, channel_config, sample_type)
+        decoder.play(chunk_len, queue_size, self)
+        return decoder
+
     @property
     def group(self) -> Optional[SourceGroup]:
         """Parent group of this source.
@@ -1275,16 +2543,15 @@ cdef class Source:
         --------
         SourceGroup : A group of `Source` references
         """
-        source_group: SourceGroup = SourceGroup.__new__(SourceGroup)
-        source_group.impl = self.impl.get_group()
-        return source_group or None
+        cdef alure.SourceGroup alure_source_group = self.impl.get_group()
+        if not <boolean> alure_source_group: return None
+        return wrap_source_group(alure_source_group)
 
     @group.setter
     def group(self, value: Optional[SourceGroup]) -> None:
-        if value is None:
-            self.impl.set_group(<alure.SourceGroup> nullptr)
-        else:
-            self.impl.set_group((<SourceGroup> value).impl)
+        cdef alure.SourceGroup group
+        if value is not None: group = (<SourceGroup> value).impl
+        with self.serialized(): self.impl.set_group(group)
 
     @property
     def priority(self) -> int:
@@ -1298,7 +2565,7 @@ cdef class Source:
 
     @priority.setter
     def priority(self, value: int) -> None:
-        self.impl.set_priority(value)
+        with self.serialized(): self.impl.set_priority(value)
 
     @property
     def offset(self) -> int:
@@ -1311,7 +2578,7 @@ cdef class Source:
 
     @offset.setter
     def offset(self, value: int) -> None:
-        self.impl.set_offset(value)
+        with self.serialized(): self.impl.set_offset(value)
 
     @getter
     def latency(self) -> int:
@@ -1350,7 +2617,7 @@ cdef class Source:
 
     @looping.setter
     def looping(self, value: bool) -> None:
-        self.impl.set_looping(value)
+        with self.serialized(): self.impl.set_looping(value)
 
     @property
     def pitch(self) -> float:
@@ -1365,7 +2632,7 @@ cdef class Source:
 
     @pitch.setter
     def pitch(self, value: float) -> None:
-        self.impl.set_pitch(value)
+        with self.serialized(): self.impl.set_pitch(value)
 
     @property
     def gain(self) -> float:
@@ -1380,7 +2647,7 @@ cdef class Source:
 
     @gain.setter
     def gain(self, value: float) -> None:
-        self.impl.set_gain(value)
+        with self.serialized(): self.impl.set_gain(value)
 
     @property
     def gain_range(self) -> Tuple[float, float]:
@@ -1407,7 +2674,7 @@ cdef class Source:
     @gain_range.setter
     def gain_range(self, value: Tuple[float, float]) -> None:
         mingain, maxgain = value
-        self.impl.set_gain_range(mingain, maxgain)
+        with self.serialized(): self.impl.set_gain_range(mingain, maxgain)
 
     @property
     def distance_range(self) -> Tuple[float, float]:
@@ -1439,7 +2706,7 @@ cdef class Source:
     @distance_range.setter
     def distance_range(self, value: Tuple[float, float]) -> None:
         refdist, maxdist = value
-        self.impl.set_distance_range(refdist, maxdist)
+        with self.serialized(): self.impl.set_distance_range(refdist, maxdist)
 
     @property
     def position(self) -> Vector3:
@@ -1448,7 +2715,7 @@ cdef class Source:
 
     @position.setter
     def position(self, value: Vector3) -> None:
-        self.impl.set_position(to_vector3(value))
+        with self.serialized(): self.impl.set_position(to_vector3(value))
 
     @property
     def velocity(self) -> Vector3:
@@ -1462,7 +2729,7 @@ cdef class Source:
 
     @velocity.setter
     def velocity(self, value: Vector3) -> None:
-        self.impl.set_velocity(to_vector3(value))
+        with self.serialized(): self.impl.set_velocity(to_vector3(value))
 
     @property
     def orientation(self) -> Tuple[Vector3, Vector3]:
@@ -1486,8 +2753,9 @@ cdef class Source:
     @orientation.setter
     def orientation(self, value: Tuple[Vector3, Vector3]) -> None:
         at, up = value
-        self.impl.set_orientation(
-            pair[alure.Vector3, alure.Vector3](to_vector3(at), to_vector3(up)))
+        cdef pair[alure.Vector3, alure.Vector3] orientation = pair[
+            alure.Vector3, alure.Vector3](to_vector3(at), to_vector3(up))
+        with self.serialized(): self.impl.set_orientation(orientation)
 
     @property
     def cone_angles(self) -> Tuple[float, float]:
@@ -1519,7 +2787,7 @@ cdef class Source:
     @cone_angles.setter
     def cone_angles(self, value: Tuple[float, float]) -> None:
         inner, outer = value
-        self.impl.set_cone_angles(inner, outer)
+        with self.serialized(): self.impl.set_cone_angles(inner, outer)
 
     @property
     def outer_cone_gains(self) -> Tuple[float, float]:
@@ -1545,7 +2813,7 @@ cdef class Source:
     @outer_cone_gains.setter
     def outer_cone_gains(self, value: Tuple[float, float]) -> None:
         gain, gain_hf = value
-        self.impl.set_outer_cone_gains(gain, gain_hf)
+        with self.serialized(): self.impl.set_outer_cone_gains(gain, gain_hf)
 
     @property
     def rolloff_factors(self) -> Tuple[float, float]:
@@ -1574,7 +2842,8 @@ cdef class Source:
     @rolloff_factors.setter
     def rolloff_factors(self, value: Tuple[float, float]) -> None:
         factor, room_factor = value
-        self.impl.set_rolloff_factors(factor, room_factor)
+        with self.serialized():
+            self.impl.set_rolloff_factors(factor, room_factor)
 
     @property
     def doppler_factor(self) -> float:
@@ -1592,7 +2861,7 @@ cdef class Source:
 
     @doppler_factor.setter
     def doppler_factor(self, value: float) -> None:
-        self.impl.set_doppler_factor(value)
+        with self.serialized(): self.impl.set_doppler_factor(value)
 
     @property
     def relative(self) -> bool:
@@ -1605,7 +2874,7 @@ cdef class Source:
 
     @relative.setter
     def relative(self, value: bool) -> None:
-        self.impl.set_relative(value)
+        with self.serialized(): self.impl.set_relative(value)
 
     @property
     def radius(self) -> float:
@@ -1622,7 +2891,7 @@ cdef class Source:
 
     @radius.setter
     def radius(self, value: float) -> None:
-        self.impl.set_radius(value)
+        with self.serialized(): self.impl.set_radius(value)
 
     @property
     def stereo_angles(self) -> Tuple[float, float]:
@@ -1639,7 +2908,7 @@ cdef class Source:
     @stereo_angles.setter
     def stereo_angles(self, value: Tuple[float, float]) -> None:
         left, right = value
-        self.impl.set_stereo_angles(left, right)
+        with self.serialized(): self.impl.set_stereo_angles(left, right)
 
     @property
     def spatialize(self) -> Optional[bool]:
@@ -1660,12 +2929,10 @@ cdef class Source:
 
     @spatialize.setter
     def spatialize(self, value: Optional[bool]) -> None:
-        if value is None:
-            self.impl.set_3d_spatialize(alure.Spatialize.Auto)
-        elif value:
-            self.impl.set_3d_spatialize(alure.Spatialize.On)
-        else:
-            self.impl.set_3d_spatialize(alure.Spatialize.Off)
+        cdef alure.Spatialize spatialize = alure.Spatialize.Auto
+        if value is not None:
+            spatialize = alure.Spatialize.On if value else alure.Spatialize.Off
+        with self.serialized(): self.impl.set_3d_spatialize(spatialize)
 
     @property
     def resampler_index(self) -> int:
@@ -1679,7 +2946,7 @@ cdef class Source:
 
     @resampler_index.setter
     def resampler_index(self, value: int) -> None:
-        self.impl.set_resampler_index(value)
+        with self.serialized(): self.impl.set_resampler_index(value)
 
     @property
     def air_absorption_factor(self) -> float:
@@ -1693,7 +2960,7 @@ cdef class Source:
 
     @air_absorption_factor.setter
     def air_absorption_factor(self, value: float) -> None:
-        self.impl.set_air_absorption_factor(value)
+        with self.serialized(): self.impl.set_air_absorption_factor(value)
 
     @property
     def gain_auto(self) -> Tuple[bool, bool, bool]:
@@ -1715,7 +2982,8 @@ cdef class Source:
     @gain_auto.setter
     def gain_auto(self, value: Tuple[bool, bool, bool]) -> None:
         direct_hf, send, send_hf = value
-        self.impl.set_gain_auto(direct_hf, send, send_hf)
+        with self.serialized():
+            self.impl.set_gain_auto(direct_hf, send, send_hf)
 
     @getter
     def sends(self) -> AuxiliarySends:
@@ -1748,11 +3016,19 @@ cdef class Source:
             Linear gain applying to low frequencies, default to 1.
         """
         gain, gain_hf, gain_lf = value
-        self.impl.set_direct_filter(make_filter(gain, gain_hf, gain_lf))
+        cdef alure.FilterParams params = make_filter(gain, gain_hf, gain_lf)
+        with self.serialized(): self.impl.set_direct_filter(params)
 
     def destroy(self) -> None:
         """Destroy the source, stop playback and release resources."""
-        self.impl.destroy()
+        cdef size_t handle = <size_t> self.impl.get_handle()
+        cdef alure.Context owner = owner_of(handle)
+        with update_lock(owner):
+            forget(owner, self.impl)
+            self.impl.destroy()
+        owners.pop(handle, None)
+        resolve_stop_waiters(handle)
+        wrappers.pop(handle, None)
 
 
 cdef class SendPath:
@@ -1778,13 +3054,15 @@ cdef class SendPath:
             Linear gain applying to low frequencies, default to 1.
         """
         gain, gain_hf, gain_lf = value
-        self.source.set_send_filter(
-            self.send, make_filter(gain, gain_hf, gain_lf))
+        cdef alure.FilterParams params = make_filter(gain, gain_hf, gain_lf)
+        with update_lock(owner_of(<size_t> self.source.get_handle())):
+            self.source.set_send_filter(self.send, params)
 
     @setter
     def effect(self, value: BaseEffect) -> None:
         """Effect applied to the send path signal."""
-        self.source.set_auxiliary_send(value.slot, self.send)
+        with update_lock(owner_of(<size_t> self.source.get_handle())):
+            self.source.set_auxiliary_send(value.slot, self.send)
 
 
 cdef class AuxiliarySends:
@@ -1832,11 +3110,16 @@ cdef class SourceGroup:
         If there is neither any context specified nor current.
     """
     cdef alure.SourceGroup impl
+    cdef object __weakref__
 
     def __init__(self, context: Optional[Context] = None) -> None:
         if context is None: context = current_context()
         if not context: raise RuntimeError('there is no context current')
-        self.impl = (<Context> context).impl.create_source_group()
+        with update_lock((<Context> context).impl):
+            self.impl = (<Context> context).impl.create_source_group()
+        cdef size_t handle = <size_t> self.impl.get_handle()
+        wrappers[handle] = self
+        owners[handle] = <size_t> (<Context> context).impl.get_handle()
 
     def __enter__(self) -> SourceGroup: return self
     def __exit__(self, *exc) -> Optional[bool]: self.destroy()
@@ -1858,102 +3141,685 @@ cdef class SourceGroup:
         if not isinstance(other, SourceGroup): return NotImplemented
         return self.impl != (<SourceGroup> other).impl
 
-    def __gt__(self, other: Any) -> bool:
-        if not isinstance(other, SourceGroup): return NotImplemented
-        return self.impl > (<SourceGroup> other).impl
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, SourceGroup): return NotImplemented
+        return self.impl > (<SourceGroup> other).impl
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, SourceGroup): return NotImplemented
+        return self.impl >= (<SourceGroup> other).impl
+
+    def __bool__(self) -> bool: return <boolean> self.impl
+
+    cdef UpdateLock serialized(self):
+        """Return the lock serializing calls with the updates
+        of the group's context.
+        """
+        return update_lock(owner_of(<size_t> self.impl.get_handle()))
+
+    @property
+    def parent_group(self) -> SourceGroup:
+        """The parent source group of this source group.
+
+        Raise
+        -----
+        RuntimeException
+            If this group is being added to its sub-group
+            (i.e. it would create a circular sub-group chain).
+        """
+        return wrap_source_group(self.impl.get_parent_group())
+
+    @parent_group.setter
+    def parent_group(self, value: SourceGroup) -> None:
+        with self.serialized(): self.impl.set_parent_group(value.impl)
+
+    @property
+    def gain(self) -> float:
+        """Source group gain.
+
+        This accumulates with its sources' and sub-groups' gain.
+        """
+        return self.impl.get_gain()
+
+    @gain.setter
+    def gain(self, value: float) -> None:
+        with self.serialized(): self.impl.set_gain(value)
+
+    @property
+    def pitch(self) -> float:
+        """Source group pitch.
+
+        This accumulates with its sources' and sub-groups' pitch.
+        """
+        return self.impl.get_pitch()
+
+    @pitch.setter
+    def pitch(self, value: float) -> None:
+        with self.serialized(): self.impl.set_pitch(value)
+
+    @getter
+    def sources(self) -> List[Source]:
+        """Sources under this group."""
+        return [wrap_source(alure_source)
+                for alure_source in self.impl.get_sources()]
+
+    @getter
+    def sub_groups(self) -> List[SourceGroup]:
+        """Source groups under this group."""
+        return [wrap_source_group(alure_source_group)
+                for alure_source_group in self.impl.get_sub_groups()]
+
+    def pause_all(self) -> None:
+        """Pause all currently-playing sources under this group.
+
+        This is done recursively, including sub-groups.
+        """
+        with self.serialized(): self.impl.pause_all()
+
+    def resume_all(self) -> None:
+        """Resume all currently-playing sources under this group.
+
+        This is done recursively, including sub-groups.
+        """
+        with self.serialized(): self.impl.resume_all()
+
+    def stop_all(self) -> None:
+        """Stop all currently-playing sources under this group.
+
+        This is done recursively, including sub-groups.
+        """
+        cdef alure.Context owner = owner_of(<size_t> self.impl.get_handle())
+        with update_lock(owner): self.impl.stop_all()
+        forget_group(owner, self.impl)
+
+    def destroy(self) -> None:
+        """Destroy the source group, remove and free all sources."""
+        cdef size_t handle = <size_t> self.impl.get_handle()
+        with self.serialized(): self.impl.destroy()
+        wrappers.pop(handle, None)
+        owners.pop(handle, None)
+
+
+cdef void forget_group(alure.Context context,
+                       alure.SourceGroup group) except *:
+    """Stop tracking the sources under the group, recursively."""
+    if not <boolean> context: return
+    cdef alure.Source source
+    for source in group.get_sources(): forget(context, source)
+    cdef alure.SourceGroup sub_group
+    for sub_group in group.get_sub_groups(): forget_group(context, sub_group)
+
+
+cdef float audibility(alure.Source source,
+                      alure.Vector3 listener) except -1:
+    """Return the gain of the source attenuated by its distance
+    to the listener, following the inverse distance model.
+    """
+    cdef alure.Vector3 position = source.get_position()
+    cdef boolean relative = source.get_relative()
+    cdef float distance = 0
+    cdef size_t i
+    for i in range(3):
+        distance += (position[i] - (0 if relative else listener[i])) ** 2
+    distance = sqrt(distance)
+    return attenuate(source.get_gain(),
+                     source.get_distance_range().first, distance)
+
+
+cdef float attenuate(float gain, float reference, float distance):
+    """Return the gain attenuated by the given distance
+    following the inverse distance model.
+    """
+    if distance <= reference: return gain
+    return gain * reference / distance
+
+
+cdef class SourcePool:
+    """Pool of preallocated sources for reuse.
+
+    Sources are handed out by `acquire` and back by `release`
+    in constant time.  When there is no idle source left, the ones
+    no longer playing are reclaimed, and failing that, a source is
+    stolen from the least important playback, i.e. the one with
+    the lowest `Source.priority`, then the lowest gain attenuated
+    by its distance to the listener.  Sources acquired since
+    the last `Context.update` are neither reclaimed nor stolen
+    until they start playing.
+
+    Each acquisition is identified by a lease, so that once
+    a source is reclaimed or stolen, it can only be released
+    by its new holder.
+
+    Reused sources keep the properties set during their previous
+    uses, except for `Source.priority`.
+
+    This can be used as a context manager that calls `destroy` upon
+    completion of the block, even if an error occurs.
+
+    Parameters
+    ----------
+    size : int
+        Number of sources to preallocate.
+    context : Optional[Context], optional
+        The context from which the sources are to be created.
+        By default `current_context()` is used.
+
+    Attributes
+    ----------
+    size : int
+        Number of sources in the pool.
+
+    Raise
+    -----
+    RuntimeError
+        If there is neither any context specified nor current.
+    ValueError
+        If `size` is not positive.
+    """
+    cdef Context context
+    cdef list idle
+    cdef dict busy  # (source, lease, update count) by handles
+    cdef unsigned long leases
+    cdef readonly unsigned size
+
+    def __init__(self, size: int, context: Optional[Context] = None) -> None:
+        if context is None: context = current_context()
+        if not context: raise RuntimeError('there is no context current')
+        if size < 1: raise ValueError(f'invalid pool size: {size}')
+        self.context, self.size = context, size
+        self.idle = [Source(context) for i in range(size)]
+        self.busy = {}
+        self.leases = 0
+
+    def __enter__(self) -> SourcePool: return self
+    def __exit__(self, *exc) -> Optional[bool]: self.destroy()
+
+    @getter
+    def available(self) -> int:
+        """Number of idle sources, without reclaiming."""
+        return len(self.idle)
+
+    def acquire(self, priority: int = 0) -> Optional[Tuple[Source, int]]:
+        """Return a source of the given priority from the pool
+        and the lease to release it with.
+
+        If no source is idle or reclaimable, the least important
+        playing source whose priority is not higher than
+        the given one is stopped and returned.  If there is
+        no such source, return `None`.
+        """
+        if not self.idle: self.reclaim()
+        cdef Source source
+        if self.idle:
+            source = self.idle.pop()
+        else:
+            source = self.victim(priority)
+            if source is None: return None
+            source.stop()
+        self.leases += 1
+        self.busy[<size_t> source.impl.get_handle()] = (
+            source, self.leases, self.update_count())
+        source.priority = priority
+        return source, self.leases
+
+    def release(self, source: Source, lease: int) -> None:
+        """Stop the given source and return it to the pool.
+
+        Raise
+        -----
+        ValueError
+            If the source is not currently acquired from this pool
+            with the given lease, e.g. if it has been stolen.
+        """
+        cdef size_t handle = <size_t> source.impl.get_handle()
+        held = self.busy.get(handle)
+        if held is None or held[1] != lease:
+            raise ValueError(f'{source} is not leased from this pool'
+                             f' as {lease}')
+        del self.busy[handle]
+        source.stop()
+        self.idle.append(source)
+
+    def reclaim(self) -> int:
+        """Return acquired sources no longer playing to the pool,
+        except the ones acquired since the last update.
+
+        Return the number of reclaimed sources.
+        """
+        cdef uint64_t updates = self.update_count()
+        cdef Source source
+        cdef list stopped = [
+            source for source, lease, acquired in self.busy.values()
+            if acquired != updates and not (source.impl.is_playing()
+                                            or source.impl.is_paused())]
+        for source in stopped:
+            del self.busy[<size_t> source.impl.get_handle()]
+        self.idle.extend(stopped)
+        return len(stopped)
+
+    cdef uint64_t update_count(self):
+        """Return the number of updates of the pool's context."""
+        cdef Updater* updater = handler_of(self.context.impl).updater.get()
+        return 0 if updater == NULL else updater.update_count()
+
+    cdef Source victim(self, unsigned priority):
+        """Return the least important acquired source playing
+        whose priority is not higher than the given one, if any.
+        """
+        cdef alure.Vector3 listener = handler_of(
+            self.context.impl).listener_position
+        cdef Source source, chosen = None
+        cdef unsigned lowest_priority
+        cdef float lowest_gain, gain
+        for source, lease, acquired in self.busy.values():
+            if source.impl.get_priority() > priority: continue
+            if not (source.impl.is_playing() or source.impl.is_paused()):
+                continue
+            gain = audibility(source.impl, listener)
+            if (chosen is None
+                    or source.impl.get_priority() < lowest_priority
+                    or (source.impl.get_priority() == lowest_priority
+                        and gain < lowest_gain)):
+                chosen, lowest_gain = source, gain
+                lowest_priority = source.impl.get_priority()
+        return chosen
+
+    def destroy(self) -> None:
+        """Destroy all sources in the pool, including acquired ones."""
+        cdef Source source
+        for source in self.idle: source.destroy()
+        for source, lease, acquired in self.busy.values(): source.destroy()
+        self.idle.clear()
+        self.busy.clear()
+
+
+cdef class VoiceManager
+
+
+cdef class Emitter:
+    """Virtual voice playing a buffer at a fixed position in the world.
+
+    Emitters are created by `VoiceManager.add` and only hold
+    a real `Source` from the manager's pool while audible
+    and among the most important ones.  Otherwise they are parked,
+    with their playback offset advanced virtually by the clock.
+
+    This class is NOT meant to be instantiated directly.
+
+    Attributes
+    ----------
+    buffer : Buffer
+        The buffer being played.
+    source : Optional[Source]
+        The real voice currently playing the emitter, if any.
+    """
+
+    cdef VoiceManager manager
+    cdef readonly Buffer buffer
+    cdef readonly Source source
+    cdef unsigned long lease        # of the source from the pool
+    cdef unsigned importance
+    cdef alure.Vector3 location
+    cdef float volume, refdist, maxdist
+    cdef boolean loop, stopped
+    cdef uint64_t parked_offset     # offset when last parked
+    cdef double parked_time         # time when last parked
+    cdef tuple cell
 
-    def __ge__(self, other: Any) -> bool:
-        if not isinstance(other, SourceGroup): return NotImplemented
-        return self.impl >= (<SourceGroup> other).impl
+    def __init__(self, *args, **kwargs) -> None:
+        raise TypeError('use VoiceManager.add to create emitters')
 
-    def __bool__(self) -> bool: return <boolean> self.impl
+    @getter
+    def position(self) -> Vector3:
+        """3D position of the emitter, which must not be relative."""
+        return tuple(from_vector3(self.location))
 
-    @property
-    def parent_group(self) -> SourceGroup:
-        """The parent source group of this source group.
+    @setter
+    def position(self, value: Vector3) -> None:
+        self.location = to_vector3(value)
+        if self.source is not None: self.source.position = value
+        if not self.stopped: self.manager.place(self)
 
-        Raise
-        -----
-        RuntimeException
-            If this group is being added to its sub-group
-            (i.e. it would create a circular sub-group chain).
+    @getter
+    def priority(self) -> int:
+        """Priority of the emitter when competing for real voices,
+        which is also given to its source.
         """
-        source_group: SourceGroup = SourceGroup.__new__(SourceGroup)
-        source_group.impl = self.impl.get_parent_group()
-        return source_group
+        return self.importance
 
-    @parent_group.setter
-    def parent_group(self, value: SourceGroup) -> None:
-        self.impl.set_parent_group(value.impl)
+    @setter
+    def priority(self, value: int) -> None:
+        if value < 0: raise ValueError(f'invalid priority: {value}')
+        self.importance = value
+        if self.source is not None: self.source.priority = value
 
-    @property
+    @getter
     def gain(self) -> float:
-        """Source group gain.
-
-        This accumulates with its sources' and sub-groups' gain.
-        """
-        return self.impl.get_gain()
+        """Base linear volume of the emitter."""
+        return self.volume
 
-    @gain.setter
+    @setter
     def gain(self, value: float) -> None:
-        self.impl.set_gain(value)
+        if value < 0: raise ValueError(f'invalid gain: {value}')
+        self.volume = value
+        if self.source is not None: self.source.gain = value
+        if not self.stopped: self.manager.place(self)
 
-    @property
-    def pitch(self) -> float:
-        """Source group pitch.
+    @getter
+    def distance_range(self) -> Tuple[float, float]:
+        """Reference and maximum distance of the emitter.
 
-        This accumulates with its sources' and sub-groups' pitch.
+        Beyond the maximum distance from the listener,
+        the emitter is inaudible and thus virtual.
         """
-        return self.impl.get_pitch()
+        return self.refdist, self.maxdist
 
-    @pitch.setter
-    def pitch(self, value: float) -> None:
-        self.impl.set_pitch(value)
+    @setter
+    def distance_range(self, value: Tuple[float, float]) -> None:
+        refdist, maxdist = value
+        if not 0 <= refdist <= maxdist:
+            raise ValueError(f'invalid distance range: {value}')
+        self.refdist, self.maxdist = refdist, maxdist
+        if self.source is not None:
+            self.source.distance_range = refdist, maxdist
+        if not self.stopped: self.manager.place(self)
 
     @getter
-    def sources(self) -> List[Source]:
-        """Sources under this group."""
-        sources = []
-        for alure_source in self.impl.get_sources():
-            source: Source = Source.__new__(Source)
-            source.impl = alure_source
-            sources.append(source)
-        return sources
+    def looping(self) -> bool:
+        """Whether the emitter loops between the buffer's loop points."""
+        return self.loop
+
+    @setter
+    def looping(self, value: bool) -> None:
+        if self.source is None:
+            self.parked_offset, self.parked_time = self.offset, now()
+        else:
+            self.source.looping = value
+        self.loop = value
 
     @getter
-    def sub_groups(self) -> List[SourceGroup]:
-        """Source groups under this group."""
-        source_groups = []
-        for alure_source_group in self.impl.get_sub_groups():
-            source_group: SourceGroup = SourceGroup.__new__(SourceGroup)
-            source_group.impl = alure_source_group
-            source_groups.append(source_group)
-        return source_groups
+    def offset(self) -> int:
+        """Playback offset in sample frames, tracked virtually
+        while the emitter is parked.
+        """
+        if self.source is not None: return self.source.impl.get_sample_offset()
+        cdef uint64_t frames = self.parked_offset + <uint64_t> (
+            (now() - self.parked_time) * self.buffer.impl.get_frequency())
+        cdef pair[unsigned, unsigned] loop_points
+        if self.loop:
+            loop_points = self.buffer.impl.get_loop_points()
+            if frames >= loop_points.second > loop_points.first:
+                frames = loop_points.first + (frames - loop_points.first) % (
+                    loop_points.second - loop_points.first)
+        return min(frames, self.buffer.impl.get_length())
 
-    def pause_all(self) -> None:
-        """Pause all currently-playing sources under this group.
+    @getter
+    def playing(self) -> bool:
+        """Whether the emitter is still playing, really or virtually."""
+        if self.stopped: return False
+        cdef alure.Source impl
+        if self.source is not None:
+            impl = self.source.impl
+            return impl.is_playing() or impl.is_paused()
+        return self.loop or self.offset < self.buffer.impl.get_length()
 
-        This is done recursively, including sub-groups.
+    @getter
+    def virtual(self) -> bool:
+        """Whether the emitter is parked without a real voice."""
+        return self.source is None
+
+    cdef float audibility(self, alure.Vector3 listener):
+        """Return the gain of the emitter attenuated by its distance
+        to the listener, or 0 beyond its maximum distance.
+        """
+        cdef float distance = 0
+        cdef size_t i
+        for i in range(3): distance += (self.location[i] - listener[i]) ** 2
+        distance = sqrt(distance)
+        if distance > self.maxdist: return 0
+        return attenuate(self.volume, self.refdist, distance)
+
+    cdef float reach(self, float threshold):
+        """Return the distance beyond which the emitter is inaudible."""
+        if threshold <= 0 or self.refdist == 0: return self.maxdist
+        return min(self.maxdist, self.volume * self.refdist / threshold)
+
+    cdef void promote(self) except *:
+        """Play the emitter from where it is on an idle real voice.
+
+        Voices are never reclaimed nor stolen here,
+        since they may still be held by other emitters.
         """
-        self.impl.pause_all()
+        if not self.manager.pool.idle: return
+        cdef Source source
+        source, self.lease = self.manager.pool.acquire(self.importance)
+        cdef uint64_t offset = self.offset
+        with source.serialized():
+            source.impl.set_relative(False)
+            source.impl.set_position(self.location)
+            source.impl.set_gain(self.volume)
+            source.impl.set_distance_range(self.refdist, self.maxdist)
+            source.impl.set_looping(self.loop)
+            source.impl.set_offset(offset)
+        self.buffer.play(source)
+        self.source = source
+        self.manager.real.add(self)
 
-    def resume_all(self) -> None:
-        """Resume all currently-playing sources under this group.
+    cdef void park(self) except *:
+        """Release the emitter's voice and keep playing virtually."""
+        self.parked_offset = self.source.impl.get_sample_offset()
+        self.parked_time = now()
+        self.manager.pool.release(self.source, self.lease)
+        self.manager.real.discard(self)
+        self.source = None
 
-        This is done recursively, including sub-groups.
+    def stop(self) -> None:
+        """Stop the emitter and remove it from its manager."""
+        if self.stopped: return
+        if self.source is not None: self.park()
+        self.stopped = True
+        self.manager.remove(self)
+
+
+cdef class VoiceManager:
+    """Manager of virtual voices backed by a pool of real sources.
+
+    Thousands of emitters can be placed into the world while only
+    the most important audible ones are given a `Source`, i.e.
+    the ones with the highest `Emitter.priority`, then the highest
+    gain attenuated by the distance to the listener, following
+    the inverse distance model.  Emitters beyond their maximum
+    distance or quieter than the gain threshold are parked and
+    promoted back at their virtual offset once audible again.
+
+    Emitters are indexed by their audible reach in grids whose cells
+    double in size from `cell_size` on, each emitter being placed
+    in the finest grid whose cells are no smaller than its reach.
+    Thus `update` only visits the real voices and, in each grid
+    holding emitters, the 27 cells around the listener.
+    Emitters reaching further than 2**31 times `cell_size`,
+    e.g. with no threshold and an infinite maximum distance,
+    are visited on every update.
+
+    This can be used as a context manager that calls `destroy` upon
+    completion of the block, even if an error occurs.
+
+    Parameters
+    ----------
+    voices : int
+        Maximum number of real voices, i.e. sources to preallocate.
+    cell_size : float, optional
+        Edge length of the finest grid's cubic cells, ideally close
+        to the shortest audible reach of emitters, by default 64.
+    threshold : float, optional
+        Minimum attenuated gain for emitters to be audible,
+        by default 0.001, i.e. -60 dB.
+    context : Optional[Context], optional
+        The context from which the sources are to be created.
+        By default `current_context()` is used.
+
+    Attributes
+    ----------
+    pool : SourcePool
+        The pool of real voices.
+    cell_size : float
+        Edge length of the finest grid's cells.
+    threshold : float
+        Minimum attenuated gain for emitters to be audible.
+
+    Raise
+    -----
+    RuntimeError
+        If there is neither any context specified nor current.
+    ValueError
+        If `voices`, `cell_size` or `threshold` is out of range.
+
+    See Also
+    --------
+    SourcePool : Pool of preallocated sources for reuse
+    """
+
+    cdef readonly SourcePool pool
+    cdef readonly float cell_size, threshold
+    cdef dict cells     # sets of emitters by grid levels and cells
+    cdef dict levels    # numbers of emitters by grid levels
+    cdef set emitters, real
+
+    def __init__(self, voices: int, cell_size: float = 64.0,
+                 threshold: float = 0.001,
+                 context: Optional[Context] = None) -> None:
+        if cell_size <= 0: raise ValueError(f'invalid cell size: {cell_size}')
+        if threshold < 0: raise ValueError(f'invalid threshold: {threshold}')
+        self.pool = SourcePool(voices, context)
+        self.cell_size, self.threshold = cell_size, threshold
+        self.cells, self.levels = {}, {}
+        self.emitters, self.real = set(), set()
+
+    def __enter__(self) -> VoiceManager: return self
+    def __exit__(self, *exc) -> Optional[bool]: self.destroy()
+    def __len__(self) -> int: return len(self.emitters)
+    def __iter__(self) -> Iterator[Emitter]: return iter(list(self.emitters))
+
+    @getter
+    def voices(self) -> List[Emitter]:
+        """Emitters currently playing on real voices."""
+        return list(self.real)
+
+    def add(self, buffer: Buffer, position: Vector3, gain: float = 1.0,
+            distance_range: Tuple[float, float] = (1.0, FLT_MAX),
+            looping: bool = False, priority: int = 0,
+            offset: int = 0) -> Emitter:
+        """Start playing the buffer virtually from the given position.
+
+        The emitter is given a real voice if needed on the next
+        `update`.  See `Emitter` for the meaning of the parameters.
         """
-        self.impl.resume_all()
+        cdef Emitter emitter = Emitter.__new__(Emitter)
+        emitter.manager, emitter.buffer = self, buffer
+        emitter.location = to_vector3(position)
+        emitter.loop = looping
+        emitter.parked_offset, emitter.parked_time = offset, now()
+        emitter.stopped = True  # not to place before being added
+        emitter.priority, emitter.gain = priority, gain
+        emitter.distance_range = distance_range
+        emitter.stopped = False
+        self.emitters.add(emitter)
+        self.place(emitter)
+        return emitter
+
+    cdef int level_of(self, Emitter emitter):
+        """Return the level of the finest grid whose cells are
+        no smaller than the emitter's reach, or -1 if none is.
+        """
+        cdef float reach = emitter.reach(self.threshold)
+        cdef int level
+        for level in range(GRID_LEVELS):
+            if reach <= self.cell_size * 2.0**level: return level
+        return -1
+
+    cdef tuple cell_of(self, alure.Vector3 position, int level):
+        """Return the cell of the given grid containing the position."""
+        cdef double size = self.cell_size * 2.0**level
+        return (level, <long> floor(position[0] / size),
+                <long> floor(position[1] / size),
+                <long> floor(position[2] / size))
+
+    cdef void place(self, Emitter emitter) except *:
+        """Move the emitter to the grid cell of its reach
+        and position, or out of the grids if it reaches too far.
+        """
+        cdef int level = self.level_of(emitter)
+        cdef tuple cell = () if level < 0 else self.cell_of(
+            emitter.location, level)
+        if cell == emitter.cell: return
+        if emitter.cell is not None: self.unplace(emitter)
+        self.cells.setdefault(cell, set()).add(emitter)
+        if cell: self.levels[level] = self.levels.get(level, 0) + 1
+        emitter.cell = cell
+
+    cdef void unplace(self, Emitter emitter) except *:
+        """Remove the emitter from the grids."""
+        cdef set members = self.cells[emitter.cell]
+        members.discard(emitter)
+        if not members: del self.cells[emitter.cell]
+        if emitter.cell:
+            level = emitter.cell[0]
+            self.levels[level] -= 1
+            if not self.levels[level]: del self.levels[level]
+        emitter.cell = None
+
+    cdef void remove(self, Emitter emitter) except *:
+        """Forget the given emitter, which must have been parked."""
+        self.unplace(emitter)
+        self.emitters.discard(emitter)
+
+    cdef list nearby(self, alure.Vector3 listener):
+        """Return the emitters which may reach the listener."""
+        cdef list found = list(self.cells.get((), ()))
+        cdef set members
+        cdef tuple center
+        cdef long x, y, z
+        for level in self.levels:
+            center = self.cell_of(listener, level)
+            for x in range(center[1] - 1, center[1] + 2):
+                for y in range(center[2] - 1, center[2] + 2):
+                    for z in range(center[3] - 1, center[3] + 2):
+                        members = self.cells.get((level, x, y, z))
+                        if members is not None: found.extend(members)
+        return found
 
-    def stop_all(self) -> None:
-        """Stop all currently-playing sources under this group.
+    def update(self) -> None:
+        """Reassign the real voices to the most important emitters.
 
-        This is done recursively, including sub-groups.
+        This is meant to be called once per frame, after
+        the listener and the emitters are moved.  Emitters found
+        to have finished playing are removed from the manager,
+        though far away ones may be kept until they come close.
         """
-        self.impl.stop_all()
+        cdef alure.Vector3 listener = handler_of(
+            self.pool.context.impl).listener_position
+        cdef Emitter emitter
+        for emitter in list(self.real):
+            if not emitter.playing: emitter.stop()
+        cdef list audible = []
+        cdef float gain
+        for emitter in self.nearby(listener):
+            if not emitter.playing:
+                emitter.stop()
+                continue
+            gain = emitter.audibility(listener)
+            if gain > 0 and gain >= self.threshold:
+                audible.append((emitter.importance, gain, emitter))
+        cdef set chosen = {item[2] for item in nlargest(
+            self.pool.size, audible, key=itemgetter(0, 1))}
+        for emitter in self.real - chosen: emitter.park()
+        for emitter in chosen - self.real: emitter.promote()
 
     def destroy(self) -> None:
-        """Destroy the source group, remove and free all sources."""
-        self.impl.destroy()
+        """Stop all emitters and destroy the pool of real voices."""
+        cdef Emitter emitter
+        for emitter in list(self.emitters): emitter.stop()
+        self.pool.destroy()
 
 
 cdef class BaseEffect:
@@ -2040,10 +3906,8 @@ cdef class BaseEffect:
         """List of sources using this effect and their pairing sends."""
         source_sends = []
         for source_send in self.slot.get_source_sends():
-            source: Source = Source.__new__(Source)
-            send = source_send.send
-            source.impl = source_send.source
-            source_sends.append((source, send))
+            source_sends.append((wrap_source(source_send.source),
+                                 source_send.send))
         return source_sends
 
     @getter
@@ -2557,7 +4421,9 @@ cdef class Decoder:
     def __init__(self, name: str, context: Optional[Context] = None) -> None:
         if context is None: context = current_context()
         if not context: raise RuntimeError('there is no context current')
-        self.pimpl = (<Context> context).impl.create_decoder(name)
+        cdef alure.Context impl = (<Context> context).impl
+        cdef string alure_name = name
+        with nogil: self.pimpl = impl.create_decoder(alure_name)
 
     @getter
     def frequency(self) -> int:
@@ -2630,20 +4496,82 @@ cdef class Decoder:
         See Also
         --------
         sample_length : length of samples of given size
+        readinto : decode into a preallocated buffer
+        """
+        cdef alure.Decoder* decoder = self.pimpl.get()
+        cdef alure.ChannelConfig channel_config = decoder.get_channel_config()
+        cdef alure.SampleType sample_type = decoder.get_sample_type()
+        samples: bytes = PyBytes_FromStringAndSize(
+            NULL, alure.frames_to_bytes(count, channel_config, sample_type))
+        cdef char* ptr = PyBytes_AS_STRING(samples)
+        cdef unsigned frames = count
+        with nogil: frames = decoder.read(ptr, frames)
+        count = frames
+        # Slicing to the full length returns the same object.
+        return samples[:alure.frames_to_bytes(
+            count, channel_config, sample_type)]
+
+    def readinto(self, buffer: Any) -> int:
+        """Decode sample frames into the given writable buffer.
+
+        As many whole sample frames as fit in `buffer`,
+        which can be any C-contiguous object following
+        Python buffer protocol, are decoded directly
+        into its memory, regardless of its item format.
+
+        Return the number of bytes written.  If it is less than
+        the size of the buffer, the end of the audio has been reached.
+
+        Raise
+        -----
+        TypeError
+            If `buffer` does not support the buffer protocol.
+        BufferError
+            If `buffer` is not writable or not C-contiguous.
+
+        See Also
+        --------
+        read_array : decode into a new NumPy array
+        """
+        cdef alure.Decoder* decoder = self.pimpl.get()
+        cdef alure.ChannelConfig channel_config = decoder.get_channel_config()
+        cdef alure.SampleType sample_type = decoder.get_sample_type()
+        cdef Py_buffer samples
+        cdef int count
+        PyObject_GetBuffer(buffer, &samples,
+                           PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS)
+        try:
+            with nogil: count = decoder.read(samples.buf, alure.bytes_to_frames(
+                samples.len, channel_config, sample_type))
+        finally:
+            PyBuffer_Release(&samples)
+        return alure.frames_to_bytes(count, channel_config, sample_type)
+
+    def read_array(self, count: int) -> Any:
+        """Decode and return `count` sample frames as a NumPy array.
+
+        The array is of shape `(frames, channels)`, whose data type
+        is either `uint8` (for unsigned 8-bit and mulaw samples),
+        `int16` or `float32`.  If less than the requested count
+        frames is returned, the end of the audio has been reached.
+
+        Raise
+        -----
+        ImportError
+            If NumPy is not installed.
         """
-        cdef void* ptr = PyMem_RawMalloc(alure.frames_to_bytes(
-            count, self.pimpl.get()[0].get_channel_config(),
-            self.pimpl.get()[0].get_sample_type()))
-        if ptr == NULL: raise RuntimeError('unable to allocate memory')
-        count = self.pimpl.get()[0].read(ptr, count)
-        cdef string samples = string(<const char*> ptr, alure.frames_to_bytes(
-            count, self.pimpl.get()[0].get_channel_config(),
-            self.pimpl.get()[0].get_sample_type()))
-        PyMem_RawFree(ptr)
-        return samples
-
-    def play(self, chunk_len: int, queue_size: int,
-             source: Optional[Source] = None) -> Source:
+        from numpy import empty     # NumPy is an optional dependency
+        sample_type: str = self.sample_type
+        sample_format: str = SAMPLE_FORMATS[sample_type]
+        channels: int = sample_size(1, self.channel_config,
+                                    sample_type) // calcsize(sample_format)
+        samples = empty((count, channels), dtype=sample_format)
+        return samples[:self.readinto(samples) // samples.strides[0]]
+
+    def play(self, chunk_len: Optional[int] = None,
+             queue_size: Optional[int] = None,
+             source: Optional[Source] = None, prefetch: int = 0,
+             auto: bool = False, target_latency_ms: int = 50) -> Source:
         """Stream audio asynchronously from the decoder.
 
         The decoder must NOT have its `read` or `seek` called
@@ -2651,24 +4579,206 @@ cdef class Decoder:
 
         Parameters
         ----------
-        chunk_len : int
+        chunk_len : Optional[int], optional
             The number of sample frames to read for each chunk update.
             Smaller values will require more frequent updates and
             larger values will handle more data with each chunk.
-        queue_size : int
+            This is only optional in the adaptive mode.
+        queue_size : Optional[int], optional
             The number of chunks to keep queued during playback.
             Smaller values use less memory while larger values
             improve protection against underruns.
+            This is only optional in the adaptive mode, where it
+            defaults to the minimum of 2.
         source : Optional[Source], optional
             The source object to play audio.  If `None` is given,
             a new one will be created from the current context.
+        prefetch : int, optional
+            The number of chunks to decode ahead of playback
+            on a separate thread.  If positive, the streaming thread
+            reads the chunks from a lock-free ring buffer without
+            acquiring the global interpreter lock.  Native decoders
+            are read by a native thread, which only acquires the GIL
+            when they call back into Python, e.g. to read a `FileIO`
+            implemented in Python.  On underruns, it waits
+            for at most a quarter of the chunk's duration before
+            padding the rest of the chunk with silence.
+            Seeking is forwarded to the decoding thread, which also
+            decodes ahead from the loop start once the stream ends,
+            so that looping back is not delayed by reacquiring
+            the GIL.  Loop points ending before the stream does
+            are not anticipated though.
+            The default is 0, i.e. the decoder is called directly,
+            except for the adaptive mode where it is 16.
+        auto : bool, optional
+            Whether to adapt the stream to the decoder's performance.
+            The chunk length is then derived from the target latency,
+            and the decoder is always prefetched: the ring starts
+            at two chunks, doubles whenever it had to pad with silence
+            or when decoding is slower than 1.5 times real time
+            with less than a chunk queued, and shrinks by one
+            chunk after every two calm seconds of decoding faster
+            than 4 times real time, within `prefetch` chunks.
+            Adaptation happens during updates of the source's context.
+        target_latency_ms : int, optional
+            Duration in milliseconds of the audio queued for playback
+            in the adaptive mode, by default 50.
 
         Return
         ------
-        The source used for playing.
+        The source used for playing, whose `Source.stream_stats`
+        reports the telemetry of this stream.
+
+        Raise
+        -----
+        ValueError
+            If `chunk_len` or `queue_size` is missing
+            outside of the adaptive mode, or if `queue_size`
+            is less than 2 or `target_latency_ms` is not positive
+            in the adaptive mode.
         """
+        cdef alure.Decoder* native = self.pimpl.get()
+        cdef unsigned frequency = native.get_frequency()
+        if auto:
+            if queue_size is None: queue_size = 2
+            if queue_size < 2:
+                raise ValueError(f'invalid queue size: {queue_size}')
+            if target_latency_ms <= 0:
+                raise ValueError(
+                    f'invalid target latency: {target_latency_ms} ms')
+            if chunk_len is None:
+                chunk_len = max(64, frequency * target_latency_ms
+                                // (1000 * queue_size))
+            if prefetch <= 0: prefetch = 16
+        elif chunk_len is None or queue_size is None:
+            raise ValueError('chunk length and queue size are required')
         if source is None: source = Source()
-        (<Source> source).impl.play(self.pimpl, chunk_len, queue_size)
+        cdef alure.Source impl = (<Source> source).impl
+        cdef int alure_chunk_len = chunk_len, alure_queue_size = queue_size
+        cdef shared_ptr[alure.Decoder] decoder = self.pimpl
+        cdef shared_ptr[StreamTelemetry] telemetry = (
+            make_shared[StreamTelemetry](alure_chunk_len, frequency))
+        cdef shared_ptr[ChunkRing] ring
+        cdef size_t chunk_size = alure.frames_to_bytes(
+            alure_chunk_len, native.get_channel_config(),
+            native.get_sample_type())
+        if prefetch > 0:
+            ring = make_shared[ChunkRing](<size_t> prefetch, chunk_size)
+            if auto: ring.get().set_limit(2)
+            telemetry.get().attach(ring, auto)
+            if isinstance(self, BaseDecoder):
+                decoder = prefetched(self, ring, telemetry)
+            else:
+                decoder = prefetch_native(decoder, ring, telemetry)
+        decoder = shared_ptr[alure.Decoder](
+            new MonitoredDecoder(decoder, telemetry, not ring))
+        cdef alure.Context owner = owner_of(<size_t> impl.get_handle())
+        if not <boolean> owner: owner = current_impl()
+        cdef Updater* updater = handler_of(owner).updater.get()
+        with nogil:
+            updater.lock()
+            try:
+                impl.play(decoder, alure_chunk_len, alure_queue_size)
+            finally:
+                updater.unlock()
+        track(owner, source, telemetry)
+        return source
+
+
+cdef class Prefetcher:
+    """Producer of chunks decoded ahead of playback.
+
+    This class is NOT meant to be instantiated.
+    """
+
+    cdef shared_ptr[ChunkRing] ring
+    cdef shared_ptr[StreamTelemetry] telemetry
+    cdef object decoder     # type: BaseDecoder
+
+    def run(self) -> None:
+        """Fill the ring until the decoder reading it is destroyed.
+
+        After the end of the stream, decoding goes on from the loop
+        start for the next generation of the ring, so that looping
+        does not wait for this thread to reacquire the GIL.
+        """
+        cdef ChunkRing* ring = self.ring.get()
+        cdef milliseconds timeout = milliseconds(100)
+        cdef unsigned generation = ring.generation(), current
+        cdef alure.Decoder* impl = (<Decoder> self.decoder).pimpl.get()
+        cdef unsigned frame_size = alure.frames_to_bytes(
+            1, impl.get_channel_config(), impl.get_sample_type())
+        cdef pair[uint64_t, uint64_t] loop_points = impl.get_loop_points()
+        cdef uint64_t loop_start = (loop_points.first if loop_points.first
+                                    < loop_points.second else 0)
+        cdef boolean ended = False, seeked = True
+        cdef size_t size
+        cdef double start
+        try:
+            while not ring.closed():
+                current = ring.generation()
+                # While decoding ahead, the generation is one step ahead.
+                if current != generation and current + 1 != generation:
+                    generation = current
+                    seeked = self.decoder.seek(ring.seek_position())
+                    ended = False
+                if (ended and current == generation
+                        and self.decoder.seek(loop_start)):
+                    generation += 1
+                    ring.anticipate(generation, loop_start)
+                    ended, seeked = False, True
+                if ended:
+                    with nogil: ring.wait_seek(current, timeout)
+                    continue
+                with nogil:
+                    if not ring.wait_writable(timeout) or ring.closed():
+                        continue
+                if not seeked:
+                    size = 0
+                else:
+                    start = now()
+                    size = decode_into(self.decoder, ring.chunk(),
+                                       ring.chunk_size())
+                    self.telemetry.get().on_decode(size // frame_size,
+                                                   now() - start)
+                ended = size < ring.chunk_size()
+                ring.commit(size, generation, ended)
+        finally:
+            ring.finish()
+
+
+cdef shared_ptr[alure.Decoder] prefetched(
+        Decoder decoder, shared_ptr[ChunkRing] ring,
+        shared_ptr[StreamTelemetry] telemetry) except *:
+    """Return a decoder reading from the ring filled on another thread,
+    whose decoding time is recorded to the given telemetry.
+    """
+    cdef alure.Decoder* impl = decoder.pimpl.get()
+    cdef Prefetcher producer = Prefetcher.__new__(Prefetcher)
+    producer.ring, producer.telemetry = ring, telemetry
+    producer.decoder = decoder
+    Thread(target=producer.run, name='palace-prefetcher', daemon=True).start()
+    return shared_ptr[alure.Decoder](new RingDecoder(
+        ring, impl.get_frequency(), impl.get_channel_config(),
+        impl.get_sample_type(), impl.get_length(), impl.get_loop_points()))
+
+
+cdef size_t decode_into(decoder, char* ptr, size_t size) except? 0:
+    """Return the number of bytes written to the given memory
+    by the read_into method of the decoder.
+
+    As the memory is not owned by Python, the view given to
+    read_into must not be exported beyond the call.
+    """
+    view: memoryview = PyMemoryView_FromMemory(ptr, size, PyBUF_WRITE)
+    try:
+        return decoder.read_into(view)
+    finally:
+        try:
+            view.release()
+        except BufferError:
+            raise BufferError(f'{decoder!r}.read_into left the given view'
+                              ' exported, e.g. by numpy.frombuffer') from None
 
 
 cdef class _BaseDecoder(Decoder):
@@ -2753,47 +4863,302 @@ class BaseDecoder(_BaseDecoder, metaclass=ABCMeta):
         the end of the audio has been reached.
         """
 
+    def read_into(self, view: memoryview) -> int:
+        """Decode sample frames into the given writable view.
+
+        Return the number of bytes written, which should be
+        a multiple of the frame size.  If it is less than
+        the size of the view, the end of the audio has been reached.
+
+        By default this is implemented using `read`.
+        Subclasses may override it to write samples in place,
+        e.g. using `readinto` of the underlying file or the `out`
+        argument of NumPy functions, and palace will prefer it
+        over `read` to avoid intermediate copies.  `view` is only
+        valid during the call and must not be stored elsewhere.
+
+        Raise
+        -----
+        BufferError
+            When called by palace, if `view` or any object exporting it,
+            such as an array created by `numpy.frombuffer`,
+            is still alive after returning.
+        """
+        data: bytes = self.read(sample_length(
+            len(view), self.channel_config, self.sample_type))
+        view[:len(data)] = data
+        return len(data)
+
+
+class ChunkDecoder(BaseDecoder):
+    """Decoder of raw samples from an iterable of chunks.
+
+    Each chunk may be any object following the buffer protocol,
+    e.g. `bytes` or a C-contiguous NumPy array, of samples
+    in the given format.  Chunks are only taken when samples are
+    requested, so when streamed via `Decoder.play`, a generator
+    is suspended as long as the playback queue is full.
+    The stream ends when the iterable is exhausted.
+
+    An empty chunk means that no sample is available yet,
+    e.g. from a live producer falling behind.  The rest of
+    the requested samples are then filled with silence
+    and counted as an underrun, instead of ending the stream.
+
+    Parameters
+    ----------
+    chunks : Iterable[Any]
+        Chunks of samples.
+    frequency : int
+        Sample frequency, in hertz.
+    channel_config : str
+        Channel configuration of the samples.
+    sample_type : str
+        Sample type of the samples.
+
+    Attributes
+    ----------
+    underruns : int
+        Number of times samples were requested but none was available.
+
+    Raise
+    -----
+    ValueError
+        If the channel config or the sample type is invalid.
+    """
+    def __init__(self, chunks: Iterable[Any], frequency: int,
+                 channel_config: str, sample_type: str) -> None:
+        self.frame_size = sample_size(1, channel_config, sample_type)
+        self.chunks, self.pending = iter(chunks), memoryview(b'')
+        self._frequency = frequency
+        self._channel_config, self._sample_type = channel_config, sample_type
+        self.silence = b'\x80' if sample_type == 'Unsigned 8-bit' else b'\0'
+        self.underruns = 0
+
+    @BaseDecoder.frequency.getter
+    def frequency(self) -> int: return self._frequency
+
+    @BaseDecoder.channel_config.getter
+    def channel_config(self) -> str: return self._channel_config
+
+    @BaseDecoder.sample_type.getter
+    def sample_type(self) -> str: return self._sample_type
+
+    @BaseDecoder.length.getter
+    def length(self) -> int: return 0
+
+    def seek(self, pos: int) -> bool: return False
+
+    @BaseDecoder.loop_points.getter
+    def loop_points(self) -> Tuple[int, int]: return 0, 0
+
+    def read(self, count: int) -> bytes:
+        samples = bytearray(count * self.frame_size)
+        return bytes(samples[:self.read_into(memoryview(samples))])
+
+    def read_into(self, view: memoryview) -> int:
+        size, done = len(view), 0
+        while done < size:
+            if not self.pending:
+                try:
+                    self.pending = memoryview(next(self.chunks)).cast('B')
+                except StopIteration:
+                    return done - done % self.frame_size
+                if not self.pending:
+                    view[done:] = self.silence * (size-done)
+                    self.underruns += 1
+                    return size
+            n = min(size-done, len(self.pending))
+            view[done:done+n] = self.pending[:n]
+            self.pending, done = self.pending[n:], done + n
+        return done
+
 
 cdef cppclass CppDecoder(alure.BaseDecoder):
     Decoder pyo
+    boolean read_into
 
     __init__(Decoder decoder):
         this.pyo = decoder
         Py_INCREF(pyo)
+        # Only use read_into if it is overridden to avoid extra copying.
+        this.read_into = (getattr(type(decoder), 'read_into', None)
+                          is not getattr(BaseDecoder, 'read_into', None))
 
     __dealloc__():
         Py_DECREF(pyo)
 
-    unsigned get_frequency_() const:
+    # Streaming decoders are used on background threads,
+    # e.g. alure's or the native one of Context.start_auto_update.
+    unsigned get_frequency_() with gil const:
         return pyo.frequency
 
-    alure.ChannelConfig get_channel_config_() const:
+    alure.ChannelConfig get_channel_config_() with gil const:
         return CHANNEL_CONFIGS.at(pyo.channel_config)
 
-    alure.SampleType get_sample_type_() const:
+    alure.SampleType get_sample_type_() with gil const:
         return SAMPLE_TYPES.at(pyo.sample_type)
 
-    uint64_t get_length_() const:
+    uint64_t get_length_() with gil const:
         return pyo.length
 
-    boolean seek_(uint64_t pos):
-        return pyo.seek(pos)
+    boolean seek_(uint64_t pos) nogil:
+        cdef double start = now(), acquired
+        cdef boolean result
+        with gil:
+            acquired = now()
+            result = pyo.seek(pos)
+            if instrumenting: record('BaseDecoder.seek', start, acquired, pyo)
+        return result
 
-    pair[uint64_t, uint64_t] get_loop_points_() const:
+    pair[uint64_t, uint64_t] get_loop_points_() with gil const:
         return pyo.loop_points
 
-    # FIXME: dead-global-interpreter-lock
-    # Without GIL Context.update causes segfault.
-    unsigned read_(void* ptr, unsigned count) with gil:
-        cdef string samples = pyo.read(count)
-        memcpy(ptr, samples.c_str(), samples.size())
-        return alure.bytes_to_frames(
-            samples.size(), get_channel_config_(), get_sample_type_())
+    unsigned read_(void* ptr, unsigned count) nogil:
+        cdef double start = now(), acquired
+        cdef unsigned result
+        with gil:
+            acquired = now()
+            result = read_samples(ptr, count)
+            if instrumenting: record('BaseDecoder.read', start, acquired, pyo)
+        return result
+
+    unsigned read_samples(void* ptr, unsigned count):
+        cdef alure.ChannelConfig channel_config = get_channel_config_()
+        cdef alure.SampleType sample_type = get_sample_type_()
+        cdef string samples
+        if not read_into:
+            samples = pyo.read(count)
+            memcpy(ptr, samples.c_str(), samples.size())
+            return alure.bytes_to_frames(
+                samples.size(), channel_config, sample_type)
+        return alure.bytes_to_frames(decode_into(pyo, <char*> ptr,
+            alure.frames_to_bytes(count, channel_config, sample_type)),
+            channel_config, sample_type)
+
+
+cdef cppclass CppArrayDecoder(alure.BaseDecoder):
+    const char* data
+    size_t size
+    size_t position
+    unsigned frame_size
+    unsigned frequency
+    alure.ChannelConfig channel_config
+    alure.SampleType sample_type
+    pair[uint64_t, uint64_t] loop_points
+    # Object keeping the samples alive, if any
+    object owner
+
+    __init__(const void* samples, size_t nbytes, unsigned sample_rate,
+             alure.ChannelConfig channels, alure.SampleType type):
+        this.data = <const char*> samples
+        this.size = nbytes
+        this.position = 0
+        this.loop_points = pair[uint64_t, uint64_t](0, 0)
+        this.frequency = sample_rate
+        this.channel_config = channels
+        this.sample_type = type
+        this.frame_size = alure.frames_to_bytes(1, channels, type)
+
+    unsigned get_frequency_() nogil const:
+        return frequency
+
+    alure.ChannelConfig get_channel_config_() nogil const:
+        return channel_config
+
+    alure.SampleType get_sample_type_() nogil const:
+        return sample_type
+
+    uint64_t get_length_() nogil const:
+        return size // frame_size
+
+    boolean seek_(uint64_t pos) nogil:
+        if pos * frame_size > size: return False
+        this.position = pos * frame_size
+        return True
+
+    pair[uint64_t, uint64_t] get_loop_points_() nogil const:
+        return loop_points
+
+    unsigned read_(void* ptr, unsigned count) nogil:
+        cdef size_t n = min(<size_t> count * frame_size, size - position)
+        memcpy(ptr, data + position, n)
+        this.position += n
+        return n // frame_size
+
+
+cdef Buffer buffer_from_memory(object view, str name, unsigned frequency,
+                               str channel_config, str sample_type,
+                               Context context):
+    """Return a buffer created directly from the memory of view,
+    or from a contiguous copy if it is not C-contiguous.
+    """
+    if not view.c_contiguous: view = memoryview(view.tobytes())
+    cdef alure.ChannelConfig alure_channel_config
+    cdef alure.SampleType alure_sample_type
+    try:
+        alure_channel_config = CHANNEL_CONFIGS.at(channel_config)
+    except IndexError:
+        raise ValueError(f'invalid channel config: {channel_config}') from None
+    try:
+        alure_sample_type = SAMPLE_TYPES.at(sample_type)
+    except IndexError:
+        raise ValueError(f'invalid sample type: {sample_type}') from None
+    if view.nbytes % alure.frames_to_bytes(
+            1, alure_channel_config, alure_sample_type):
+        raise ValueError(f'incomplete sample frames of {channel_config}'
+                         f' and {sample_type}')
+
+    if context is None: context = current_context()
+    if not context: raise RuntimeError('there is no context current')
+    cdef Py_buffer samples
+    PyObject_GetBuffer(view, &samples, PyBUF_C_CONTIGUOUS)
+    buffer: Buffer = Buffer.__new__(Buffer)
+    buffer.context, buffer.name = context, name
+    cdef string alure_name = name
+    cdef shared_ptr[alure.Decoder] decoder
+    start: float = monotonic()
+    try:
+        decoder = shared_ptr[alure.Decoder](new CppArrayDecoder(
+            samples.buf, samples.len, frequency,
+            alure_channel_config, alure_sample_type))
+        with nogil: buffer.impl = context.impl.create_buffer_from(
+            alure_name, decoder)
+    finally:
+        PyBuffer_Release(&samples)
+    handler_of(context.impl).buffer_cache.add(
+        buffer, monotonic() - start, True)
+    return buffer
 
 
 cdef class DecoderNamespace:
-    """Simple object for storing decoder factories."""
+    """Simple object for storing decoder factories.
+
+    Factories may declare the resources they support via
+    a `signatures` attribute, an iterable of magic bytes
+    at the start of the resources or pairs of their offsets
+    and magic bytes, and/or an `extensions` attribute,
+    an iterable of file extensions, e.g. `'.wav'`.
+    These must be set before the factories are stored.
+    """
     cdef dict __dict__
+    # Factories by extension, signature entries, factories
+    # declaring nothing, the ones declaring anything
+    # and the number of bytes to sniff
+    cdef dict by_extension
+    cdef list by_signature
+    cdef list generic
+    cdef list declared
+    cdef size_t sniff_size
+    cdef boolean indexed
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.__dict__[name] = value
+        self.indexed = False
+
+    def __delattr__(self, name: str) -> None:
+        del self.__dict__[name]
+        self.indexed = False
 
     def __repr__(self) -> str:
         decoders: str = ', '.join(
@@ -2803,6 +5168,48 @@ cdef class DecoderNamespace:
     def __iter__(self) -> Iterator[Callable[[FileIO], BaseDecoder]]:
         return map(itemgetter(1), sorted(vars(self).items()))
 
+    cdef void index(self) except *:
+        """Index the factories by their declared signatures
+        and extensions.
+        """
+        self.by_extension, self.by_signature, self.generic = {}, [], []
+        self.declared, self.sniff_size = [], 0
+        for factory in self:
+            extensions = getattr(factory, 'extensions', ())
+            signatures = getattr(factory, 'signatures', ())
+            if not extensions and not signatures:
+                self.generic.append(factory)
+            else:
+                self.declared.append(factory)
+            for extension in extensions:
+                self.by_extension.setdefault(
+                    '.' + extension.lstrip('.').lower(), []).append(factory)
+            for signature in signatures:
+                offset, magic = ((0, signature) if isinstance(signature, bytes)
+                                 else signature)
+                self.by_signature.append((offset, magic, factory))
+                self.sniff_size = max(self.sniff_size, offset+len(magic))
+        self.indexed = True
+
+    cdef list dispatch(self, resource: FileIO, str name):
+        """Return factories to be tried on the given resource.
+
+        Declared factories not matching the resource are still tried
+        last, in case the declarations are incomplete.
+        """
+        if not self.indexed: self.index()
+        cdef list candidates = []
+        if self.by_signature:
+            resource.seek(0)
+            header: bytes = resource.read(self.sniff_size)
+            for offset, magic, factory in self.by_signature:
+                if header.startswith(magic, offset):
+                    candidates.append(factory)
+        for factory in self.by_extension.get(splitext(name)[1].lower(), ()):
+            if factory not in candidates: candidates.append(factory)
+        return candidates + self.generic + [
+            factory for factory in self.declared if factory not in candidates]
+
 
 class FileIO(Protocol):
     """File I/O protocol.
@@ -2843,6 +5250,48 @@ class FileIO(Protocol):
         """Close the file."""
 
 
+class MmapFileIO(mmap):
+    """Read-only memory-mapped file, following the `FileIO` protocol.
+
+    When passed to `use_fileio`, internal decoders also read
+    memory-mapped files, but via a native implementation which
+    never calls back into Python, neither to read nor to seek.
+    Empty files cannot be mapped by either, so they fail to open
+    as if they did not exist.
+
+    Parameters
+    ----------
+    name : str
+        Path to the file to be mapped.
+
+    Raise
+    -----
+    FileNotFoundError
+        If the file does not exist.
+    ValueError
+        If the file is empty.
+    """
+
+    def __new__(cls, name: str) -> MmapFileIO:
+        with open(name, 'rb') as file:
+            return mmap.__new__(cls, file.fileno(), 0, access=ACCESS_READ)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Move to new file position and return the file position.
+
+        Parameters
+        ----------
+        offset : int
+            A byte count.
+        whence : int, optional
+            Either 0 (default, move relative to start of file),
+            1 (move relative to current position)
+            or 2 (move relative to end of file).
+        """
+        mmap.seek(self, offset, whence)
+        return self.tell()
+
+
 cdef cppclass CppStreamBuf(alure.BaseStreamBuf):
     size_t buffer_size
     object pyo  # type: FileIO
@@ -2857,12 +5306,26 @@ cdef cppclass CppStreamBuf(alure.BaseStreamBuf):
         pyo.close()
         Py_DECREF(pyo)
 
-    size_t seek(long long offset, int whence):
-        cdef size_t result = pyo.seek(offset, whence)
-        underflow()
+    size_t seek(long long offset, int whence) nogil:
+        cdef double start = now(), acquired
+        cdef size_t result
+        with gil:
+            acquired = now()
+            result = pyo.seek(offset, whence)
+            fill()
+            if instrumenting: record('FileIO.seek', start, acquired)
+        return result
+
+    int underflow() nogil:
+        cdef double start = now(), acquired
+        cdef int result
+        with gil:
+            acquired = now()
+            result = fill()
+            if instrumenting: record('FileIO.read', start, acquired)
         return result
 
-    int underflow():
+    int fill():
         this.buffer = pyo.read(buffer_size)
         cdef char* p = <char*> buffer.c_str()
         cdef size_t n = buffer.size()
@@ -2882,10 +5345,55 @@ cdef cppclass CppFileIOFactory(alure.BaseFileIOFactory):
     __dealloc__():
         Py_DECREF(pyo)
 
-    unique_ptr[istream] open_file(const string& name):
-        return make_unique[istream](new CppStreamBuf(pyo(name), buffer_size))
+    unique_ptr[istream] open_file(const string& name) nogil:
+        cdef double start = now(), acquired
+        cdef unique_ptr[istream] result
+        with gil:
+            acquired = now()
+            result = make_unique[istream](
+                new CppStreamBuf(pyo(name), buffer_size))
+            if instrumenting: record('FileIO.open', start, acquired)
+        return result
 
 
+Event: Type = NamedTuple('Event', [
+    ('message', str), ('time', float), ('target', Any)])
+Event.__doc__ = """Message received by a context.
+
+The message is the name of the corresponding `MessageHandler` method
+and the time is in seconds of a monotonic clock.  The target is
+the disconnected `Device`, the stopped `Source` or the name
+of the buffer being loaded.
+"""
+
+
+cdef list take_events(Updater* updater, size_t max):
+    """Take at most max of the oldest queued events
+    and resolve futures waiting for stopped sources.
+    """
+    cdef vector[NativeEvent] native
+    with nogil: native = updater.take(max)
+    cdef list events = []
+    cdef size_t i
+    for i in range(native.size()):
+        message: str = native[i].message.decode()
+        if message == 'device_disconnected':
+            target = wrap_device(native[i].device)
+        elif message == 'buffer_loading':
+            target = native[i].name
+        else:
+            target = wrap_source(native[i].source)
+            if stop_waiters:
+                resolve_stop_waiters(<size_t> native[i].source.get_handle())
+        events.append(Event(message, native[i].time, target))
+    return events
+
+
+def _put_events(queue: Queue, events: List[Event]) -> None:
+    """Put the message and target of each event to the queue."""
+    for message, time, target in events: queue.put_nowait((message, target))
+
+
 cdef class MessageHandler:
     """Message handler interface.
 
@@ -2896,10 +5404,17 @@ cdef class MessageHandler:
     Exceptions raised from `MessageHandler` instances are ignored.
     """
 
-    cdef list stopped_sources
+    def on_batch(self, events: List[Event]) -> None:
+        """Handle the messages queued since the previous update.
 
-    def __cinit__(self, *args, **kwargs) -> None:
-        self.stopped_sources = []
+        This is called once per `Context.update` with all messages
+        received since then, from the oldest to the newest.
+        By default, each message is handed to the method of the same
+        name, except for `buffer_loading`, which is always called
+        before the buffer is loaded.
+        """
+        for message, time, target in events:
+            if message != 'buffer_loading': getattr(self, message)(target)
 
     def device_disconnected(self, device: Device) -> None:
         """Handle disconnected device messages.
@@ -2978,38 +5493,84 @@ cdef class MessageHandler:
         return ''
 
 
+cdef boolean overrides(MessageHandler handler, str name) except *:
+    """Return whether the handler overrides the method of the given name."""
+    if name in getattr(handler, '__dict__', ()): return True
+    return getattr(type(handler), name) is not getattr(MessageHandler, name)
+
+
 cdef cppclass CppMessageHandler(alure.BaseMessageHandler):
     MessageHandler pyo
-
-    __init__(MessageHandler message_handler):
+    BufferCache buffer_cache
+    list listeners  # event loops and queues of Context.events
+    shared_ptr[Updater] updater
+    alure.Vector3 listener_position
+    # Whether pyo overrides the methods for the respective messages
+    boolean batching
+    boolean loading
+    boolean substituting
+
+    __init__(MessageHandler message_handler, BufferCache cache):
+        this.buffer_cache = cache
+        this.listeners = []
+        this.updater = make_shared[Updater]()
+        this.listener_position = alure.Vector3(0, 0, 0)
+        this.use(message_handler)
+
+    void use(MessageHandler message_handler):
         this.pyo = message_handler
-        Py_INCREF(pyo)
-
-    __dealloc__():
-        Py_DECREF(pyo)
-
-    void device_disconnected(alure.Device& alure_device):
-        cdef Device device = Device.__new__(Device)
-        device.impl = alure_device
-        pyo.device_disconnected(device)
-
-    void source_stopped(alure.Source& alure_source):
-        cdef Source source = Source.__new__(Source)
-        source.impl = alure_source
-        pyo.stopped_sources.append(source)
-
-    void source_force_stopped(alure.Source& alure_source):
-        cdef Source source = Source.__new__(Source)
-        source.impl = alure_source
-        pyo.source_force_stopped(source)
+        this.batching = False
+        for name in ('on_batch', 'device_disconnected',
+                     'source_stopped', 'source_force_stopped'):
+            if overrides(message_handler, name): this.batching = True
+        this.loading = overrides(message_handler, 'buffer_loading')
+        this.substituting = overrides(message_handler, 'resource_not_found')
+
+    void device_disconnected(alure.Device& alure_device) nogil:
+        updater.get().push('device_disconnected', alure_device)
+
+    void source_stopped(alure.Source& alure_source) nogil:
+        updater.get().push('source_stopped', alure_source)
+
+    void source_force_stopped(alure.Source& alure_source) nogil:
+        updater.get().push('source_force_stopped', alure_source)
+
+    void dispatch(list events):
+        if not events: return
+        cdef double start
+        if batching:
+            start = now()
+            pyo.on_batch(events)
+            if instrumenting: record('MessageHandler.on_batch', start, start)
+        for loop, queue in listeners:
+            loop.call_soon_threadsafe(_put_events, queue, events)
 
     void buffer_loading(
         string name, string channel_config, string sample_type,
-        unsigned sample_rate, const signed char* data, size_t size) with gil:
+        unsigned sample_rate, const signed char* data, size_t size) nogil:
+        updater.get().push('buffer_loading', name)
+        if loading: load(name, channel_config, sample_type,
+                         sample_rate, data, size, now())
+
+    void load(string name, string channel_config, string sample_type,
+              unsigned sample_rate, const signed char* data, size_t size,
+              double start) with gil:
+        cdef double acquired = now()
         cdef array a = array(shape=(size,), itemsize=sizeof(signed char),
                              format="b", allocate_buffer=False)
         a.data = <char*> data
         pyo.buffer_loading(name, channel_config, sample_type, sample_rate, a)
-
-    string resource_not_found(string name):
-        return pyo.resource_not_found(name)
+        if instrumenting:
+            record('MessageHandler.buffer_loading', start, acquired)
+
+    string resource_not_found(string name) nogil:
+        cdef string empty
+        if not substituting: return empty
+        return substitute(name, now())
+
+    string substitute(string name, double start) with gil:
+        cdef double acquired = now()
+        cdef string result = pyo.resource_not_found(name)
+        if instrumenting:
+            record('MessageHandler.resource_not_found', start, acquired)
+        return result
@@ -0,0 +1,350 @@
+// Ring-buffered decoding
+// Copyright (C) 2020  Nguyễn Gia Phong
+//
+// This file is part of palace.
+//
+// palace is free software: you can redistribute it and/or modify it
+// under the terms of the GNU Lesser General Public License as published
+// by the Free Software Foundation, either version 3 of the License,
+// or (at your option) any later version.
+//
+// palace is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public License
+// along with palace.  If not, see <https://www.gnu.org/licenses/>.
+
+#ifndef PALACE_RING_H
+#define PALACE_RING_H
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <cstdint>
+#include <cstring>
+#include <memory>
+#include <mutex>
+#include <utility>
+#include <vector>
+
+#include "alure2.h"
+
+namespace palace
+{
+  // Lock-free single-producer single-consumer ring of sample chunks.
+  // Each chunk is tagged with the seek generation it was decoded for,
+  // so that the consumer can drop the ones made stale by seeking.
+  // After the end of the stream, the producer may decode ahead
+  // for the generation following the current one, which is adopted
+  // if the consumer then seeks to the anticipated position, e.g. when
+  // looping, and skipped otherwise by advancing two generations.
+  // The mutex and condition variable are only used for sleeping
+  // and waking up.
+  // The memory of each chunk is allocated on first use and released
+  // by the producer when more chunks are held than the depth limit,
+  // which can be changed from any thread within the ring's capacity.
+  class ChunkRing
+  {
+    struct Chunk
+    {
+      std::unique_ptr<char[]> data;
+      std::size_t size = 0;
+      std::size_t offset = 0;
+      unsigned generation = 0;
+      bool end = false;
+    };
+
+    std::vector<Chunk> chunks;
+    std::size_t chunk_bytes;
+    std::size_t allocated = 0;          // owned by the producer
+    std::atomic<std::size_t> depth_limit;
+    std::atomic<std::size_t> head {0};  // next chunk to be written
+    std::atomic<std::size_t> tail {0};  // next chunk to be read
+    std::atomic<unsigned> gen {0};
+    std::atomic<std::uint64_t> position {0};
+    std::atomic<unsigned> ahead {0};    // generation decoded ahead
+    std::atomic<std::uint64_t> ahead_position {0};
+    std::atomic<bool> is_closed {false};
+    std::atomic<bool> is_finished {false};
+    std::atomic<std::uint64_t> starvations {0};
+    std::mutex mutex;
+    std::condition_variable changed;
+
+    // Lock the mutex before notifying, so that the notification
+    // cannot fall between a waiter's check and its sleep.
+    inline void
+    notify()
+    {
+      {
+        std::lock_guard<std::mutex> lock {mutex};
+      }
+      changed.notify_all();
+    }
+
+    template<typename Predicate> inline bool
+    wait_for (std::chrono::milliseconds timeout, Predicate ready)
+    {
+      std::unique_lock<std::mutex> lock {mutex};
+      return changed.wait_for (lock, timeout, ready);
+    }
+
+  public:
+    ChunkRing (std::size_t depth, std::size_t size)
+    : chunks (std::max<std::size_t> (depth, 1)), chunk_bytes (size),
+      depth_limit (chunks.size())
+    {}
+
+    inline std::size_t capacity() const noexcept { return chunks.size(); }
+    inline std::size_t limit() const noexcept { return depth_limit.load(); }
+
+    inline void
+    set_limit (std::size_t depth) noexcept
+    {
+      depth_limit.store (std::min (std::max<std::size_t> (depth, 1),
+                                   chunks.size()));
+      notify();
+    }
+
+    // Producer interface
+    inline std::size_t chunk_size() const noexcept { return chunk_bytes; }
+
+    inline bool
+    writable() const noexcept
+    {
+      return head.load (std::memory_order_relaxed)
+        - tail.load (std::memory_order_acquire) < depth_limit.load();
+    }
+
+    // Return the memory of the next chunk, only valid if writable
+    inline char*
+    chunk()
+    {
+      std::size_t i = head.load (std::memory_order_relaxed);
+      std::size_t end = tail.load (std::memory_order_acquire) + chunks.size();
+      Chunk& next = chunks[i % chunks.size()];
+      if (!next.data)
+        {
+          next.data.reset (new char[chunk_bytes]);
+          allocated++;
+        }
+      // Chunks from the next one to the tail are not queued
+      for (std::size_t j = i + 1; allocated > limit() && j < end; j++)
+        if (chunks[j % chunks.size()].data)
+          {
+            chunks[j % chunks.size()].data.reset();
+            allocated--;
+          }
+      return next.data.get();
+    }
+
+    inline void
+    commit (std::size_t size, unsigned generation, bool end) noexcept
+    {
+      std::size_t i = head.load (std::memory_order_relaxed);
+      Chunk& chunk = chunks[i % chunks.size()];
+      chunk.size = size;
+      chunk.offset = 0;
+      chunk.generation = generation;
+      chunk.end = end;
+      head.store (i + 1, std::memory_order_release);
+      notify();
+    }
+
+    inline bool
+    wait_writable (std::chrono::milliseconds timeout)
+    {
+      return wait_for (timeout, [this] { return writable() || closed(); });
+    }
+
+    inline bool
+    wait_seek (unsigned generation, std::chrono::milliseconds timeout)
+    {
+      return wait_for (timeout, [this, generation]
+                       { return gen.load() != generation || closed(); });
+    }
+
+    inline unsigned generation() const noexcept { return gen.load(); }
+    inline std::uint64_t seek_position() const noexcept
+    { return position.load(); }
+
+    inline bool closed() const noexcept { return is_closed.load(); }
+
+    // Announce that the following chunks are decoded from pos
+    // for the generation after the current one
+    inline void
+    anticipate (unsigned generation, std::uint64_t pos) noexcept
+    {
+      ahead_position.store (pos);
+      ahead.store (generation);
+    }
+
+    inline void
+    finish() noexcept
+    {
+      is_finished.store (true);
+      notify();
+    }
+
+    // Consumer interface
+    inline void
+    request_seek (std::uint64_t pos) noexcept
+    {
+      unsigned current = gen.load();
+      bool adopted = ahead.load() == current + 1
+        && ahead_position.load() == pos;
+      position.store (pos);
+      gen.store (current + (adopted ? 1 : 2));
+      notify();
+    }
+
+    inline void
+    close() noexcept
+    {
+      is_closed.store (true);
+      notify();
+    }
+
+    // Number of reads given up on for the producer lagging behind
+    inline std::uint64_t underruns() const noexcept
+    { return starvations.load(); }
+
+    // Read into ptr up to the given number of bytes, blocking
+    // on underruns for at most the given timeout in total
+    // for the producer to catch up, unless it finished or the ring
+    // is closed.  Return the number of bytes read, set end if
+    // the chunk ending the current generation is consumed,
+    // and set starved if the timeout expired.
+    inline std::size_t
+    read (char* ptr, std::size_t bytes, bool& end, bool& starved,
+          std::chrono::milliseconds timeout)
+    {
+      auto deadline = std::chrono::steady_clock::now() + timeout;
+      std::size_t done = 0;
+      while (done < bytes)
+        {
+          std::size_t i = tail.load (std::memory_order_relaxed);
+          if (i == head.load (std::memory_order_acquire))
+            {
+              if (is_finished.load() || closed())
+                break;
+              auto now = std::chrono::steady_clock::now();
+              if (now >= deadline)
+                {
+                  starvations.fetch_add (1);
+                  starved = true;
+                  break;
+                }
+              std::unique_lock<std::mutex> lock {mutex};
+              changed.wait_until (lock, deadline, [this, i]
+                {
+                  return i != head.load() || is_finished.load()
+                    || closed();
+                });
+              continue;
+            }
+          Chunk& chunk = chunks[i % chunks.size()];
+          bool current = chunk.generation == gen.load();
+          if (current)
+            {
+              std::size_t n = std::min (bytes - done,
+                                        chunk.size - chunk.offset);
+              std::memcpy (ptr + done, chunk.data.get() + chunk.offset, n);
+              chunk.offset += n;
+              done += n;
+              if (chunk.offset < chunk.size)
+                break;
+            }
+          // The chunk may be overwritten as soon as it is released.
+          bool ending = current && chunk.end;
+          tail.store (i + 1, std::memory_order_release);
+          notify();
+          if (ending)
+            {
+              end = true;
+              break;
+            }
+        }
+      return done;
+    }
+  };
+
+  // Decoder draining a chunk ring, never calling back into Python.
+  // Reads never block for longer than a quarter of the requested
+  // duration, which is padded with silence if the producer lags.
+  class RingDecoder : public alure::Decoder
+  {
+    std::shared_ptr<ChunkRing> ring;
+    unsigned frequency;
+    alure::ChannelConfig channel_config;
+    alure::SampleType sample_type;
+    std::uint64_t length;
+    std::pair<std::uint64_t, std::uint64_t> loop_points;
+    unsigned frame_size;
+    bool ended = false;
+
+  public:
+    RingDecoder (std::shared_ptr<ChunkRing> chunks, unsigned sample_rate,
+                 alure::ChannelConfig channels, alure::SampleType type,
+                 std::uint64_t frames,
+                 std::pair<std::uint64_t, std::uint64_t> loop)
+    : ring (std::move (chunks)), frequency (sample_rate),
+      channel_config (channels), sample_type (type),
+      length (frames), loop_points (loop),
+      frame_size (alure::FramesToBytes (1, channels, type))
+    {}
+
+    ~RingDecoder() override { ring->close(); }
+
+    inline ALuint getFrequency() const noexcept override
+    { return frequency; }
+    inline alure::ChannelConfig getChannelConfig() const noexcept override
+    { return channel_config; }
+    inline alure::SampleType getSampleType() const noexcept override
+    { return sample_type; }
+    inline uint64_t getLength() const noexcept override { return length; }
+    inline std::pair<uint64_t, uint64_t>
+    getLoopPoints() const noexcept override { return loop_points; }
+
+    // The actual seeking is done later by the producer, unless
+    // it has already decoded ahead from the given position,
+    // so only requests beyond the known length are rejected.
+    inline bool
+    seek (uint64_t pos) noexcept override
+    {
+      if (length && pos >= length)
+        return false;
+      ring->request_seek (pos);
+      ended = false;
+      return true;
+    }
+
+    inline ALuint
+    read (ALvoid* ptr, ALuint count) noexcept override
+    {
+      if (ended)
+        return 0;
+      char* samples = static_cast<char*> (ptr);
+      std::size_t size = std::size_t (count) * frame_size;
+      std::chrono::milliseconds patience {
+        std::max<std::uint64_t> (std::uint64_t (count) * 250 / frequency, 1)};
+      bool starved = false;
+      std::size_t bytes = ring->read (samples, size, ended, starved,
+                                      patience);
+      if (!starved)
+        return bytes / frame_size;
+      bytes -= bytes % frame_size;
+      int silence = 0;
+      if (sample_type == alure::SampleType::UInt8)
+        silence = 0x80;
+      else if (sample_type == alure::SampleType::Mulaw)
+        silence = 0xff;
+      std::memset (samples + bytes, silence, size - bytes);
+      return count;
+    }
+  };
+} // namespace palace
+
+#endif // PALACE_RING_H
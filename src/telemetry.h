@@ -0,0 +1,325 @@
+// Telemetry of streamed playbacks
+// Copyright (C) 2020  Nguyễn Gia Phong
+//
+// This file is part of palace.
+//
+// palace is free software: you can redistribute it and/or modify it
+// under the terms of the GNU Lesser General Public License as published
+// by the Free Software Foundation, either version 3 of the License,
+// or (at your option) any later version.
+//
+// palace is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public License
+// along with palace.  If not, see <https://www.gnu.org/licenses/>.
+
+#ifndef PALACE_TELEMETRY_H
+#define PALACE_TELEMETRY_H
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <limits>
+#include <memory>
+#include <thread>
+#include <utility>
+#include <vector>
+
+#include "alure2.h"
+#include "ring.h"
+
+namespace palace
+{
+  // Snapshot of the telemetry of a stream
+  struct StreamStats
+  {
+    std::uint64_t chunks = 0;
+    std::uint64_t consumed = 0;
+    std::uint64_t depth = 0;
+    std::uint64_t min_headroom = std::numeric_limits<std::uint64_t>::max();
+    std::uint64_t underruns = 0;
+    double speed = 0.0;         // real-time factor of decoding, 0 if unknown
+    std::uint64_t prefetch = 0; // depth limit of the elastic ring if any
+    // Counts of latencies under 1, 2, 4, ..., 256 ms and the rest
+    std::vector<std::uint64_t> latency = std::vector<std::uint64_t> (10);
+  };
+
+  // Counters written by the decoder on the streaming thread
+  // and sampled during context updates.  Sampling and snapshots
+  // are serialized by the caller, i.e. the updater's mutex.
+  // Underruns of the prefetching ring, if attached, are counted
+  // together with the ones observed by sampling.
+  // If the attached ring is elastic, its depth limit is doubled
+  // whenever the ring had to pad with silence since the last sample
+  // or decoding is slow with little headroom, and decreased by one
+  // chunk after every calm period with fast decoding.  The ring's own
+  // underruns are used since the padding keeps the sampled headroom
+  // of its consumer from ever running dry.
+  class StreamTelemetry
+  {
+    using clock = std::chrono::steady_clock;
+    std::uint64_t chunk_len;
+    double frequency;
+    std::atomic<std::uint64_t> chunks {0};
+    std::atomic<std::uint64_t> position {0};
+    std::atomic<bool> ended {false};
+    std::atomic<std::uint64_t> decoded {0};
+    std::atomic<std::uint64_t> decode_ns {0};
+    std::shared_ptr<ChunkRing> ring;
+    bool resizing = false;
+    std::uint64_t padded = 0;   // ring underruns as of the last sample
+    clock::time_point calm_since = clock::now();
+    StreamStats sampled;
+    bool starved = false;
+
+    inline double
+    speed() const noexcept
+    {
+      std::uint64_t ns = decode_ns.load();
+      if (!ns)
+        return 0.0;
+      return decoded.load() / frequency / (ns * 1e-9);
+    }
+
+    inline void
+    adapt (bool underrun, std::uint64_t headroom)
+    {
+      double rate = speed();
+      std::size_t depth = ring->limit();
+      auto now = clock::now();
+      if (underrun || (headroom < chunk_len && rate && rate < 1.5))
+        {
+          ring->set_limit (depth * 2);
+          calm_since = now;
+        }
+      else if (now - calm_since >= std::chrono::seconds (2))
+        {
+          if (rate >= 4.0)
+            ring->set_limit (depth - 1);
+          calm_since = now;
+        }
+    }
+
+  public:
+    StreamTelemetry (unsigned chunk_frames, unsigned sample_rate)
+    : chunk_len (std::max (chunk_frames, 1u)),
+      frequency (std::max (sample_rate, 1u))
+    {}
+
+    // Attach the prefetching ring, to be resized according to
+    // the stream's health if elastic
+    inline void
+    attach (std::shared_ptr<ChunkRing> chunks, bool elastic) noexcept
+    {
+      ring = std::move (chunks);
+      resizing = elastic;
+    }
+
+    // Record the time taken to decode the given number of frames
+    inline void
+    on_decode (std::uint64_t frames, double seconds) noexcept
+    {
+      decoded.fetch_add (frames);
+      decode_ns.fetch_add (static_cast<std::uint64_t> (seconds * 1e9));
+    }
+
+    inline void
+    on_read (std::uint64_t frames, bool end) noexcept
+    {
+      chunks.fetch_add (1);
+      position.fetch_add (frames);
+      if (end)
+        ended.store (true);
+    }
+
+    inline void
+    on_seek (std::uint64_t pos) noexcept
+    {
+      position.store (pos);
+      ended.store (false);
+    }
+
+    // Sample the playback of the given source, which must be active.
+    // The headroom is only known until the stream loops back.
+    inline void
+    sample (const alure::Source& source)
+    {
+      auto offset = source.getSampleOffsetLatency();
+      std::uint64_t pos = position.load();
+      std::uint64_t headroom = std::numeric_limits<std::uint64_t>::max();
+      if (pos >= offset.first)
+        {
+          headroom = pos - offset.first;
+          sampled.min_headroom = std::min (sampled.min_headroom, headroom);
+          bool dry = headroom == 0 && !ended.load();
+          if (dry && !starved)
+            sampled.underruns++;
+          starved = dry;
+          sampled.depth = (headroom + chunk_len - 1) / chunk_len;
+        }
+      if (resizing)
+        {
+          std::uint64_t pads = ring->underruns();
+          adapt (pads > padded, headroom);
+          padded = pads;
+        }
+      auto ms = std::chrono::duration_cast<std::chrono::milliseconds> (
+        offset.second).count();
+      std::size_t bucket = 0;
+      while (bucket + 1 < sampled.latency.size() && ms >= (1 << bucket))
+        bucket++;
+      sampled.latency[bucket]++;
+    }
+
+    inline StreamStats
+    snapshot() const
+    {
+      StreamStats stats = sampled;
+      stats.chunks = chunks.load();
+      stats.consumed = stats.chunks - std::min (stats.chunks, stats.depth);
+      stats.speed = speed();
+      if (ring)
+        stats.underruns += ring->underruns();
+      if (resizing)
+        stats.prefetch = ring->limit();
+      return stats;
+    }
+  };
+
+  // Decoder forwarding to another one while counting what it reads,
+  // and timing the reads if they do the actual decoding
+  class MonitoredDecoder : public alure::Decoder
+  {
+    std::shared_ptr<alure::Decoder> decoder;
+    std::shared_ptr<StreamTelemetry> telemetry;
+    bool timed;
+
+  public:
+    MonitoredDecoder (std::shared_ptr<alure::Decoder> source,
+                      std::shared_ptr<StreamTelemetry> counters,
+                      bool decoding = true)
+    : decoder (std::move (source)), telemetry (std::move (counters)),
+      timed (decoding)
+    {}
+
+    inline ALuint getFrequency() const noexcept override
+    { return decoder->getFrequency(); }
+    inline alure::ChannelConfig getChannelConfig() const noexcept override
+    { return decoder->getChannelConfig(); }
+    inline alure::SampleType getSampleType() const noexcept override
+    { return decoder->getSampleType(); }
+    inline uint64_t getLength() const noexcept override
+    { return decoder->getLength(); }
+    inline std::pair<uint64_t, uint64_t>
+    getLoopPoints() const noexcept override
+    { return decoder->getLoopPoints(); }
+
+    inline bool
+    seek (uint64_t pos) noexcept override
+    {
+      if (!decoder->seek (pos))
+        return false;
+      telemetry->on_seek (pos);
+      return true;
+    }
+
+    inline ALuint
+    read (ALvoid* ptr, ALuint count) noexcept override
+    {
+      if (!timed)
+        {
+          ALuint frames = decoder->read (ptr, count);
+          telemetry->on_read (frames, frames < count);
+          return frames;
+        }
+      auto start = std::chrono::steady_clock::now();
+      ALuint frames = decoder->read (ptr, count);
+      telemetry->on_decode (frames, std::chrono::duration<double> (
+        std::chrono::steady_clock::now() - start).count());
+      telemetry->on_read (frames, frames < count);
+      return frames;
+    }
+  };
+
+  // Return a decoder reading from a ring filled ahead from the given
+  // native one by a detached thread, which stops once the returned
+  // decoder is destroyed.  It follows the same protocol as the Python
+  // prefetcher, i.e. seeking when the generation of the ring changes
+  // and decoding ahead from the loop start after the stream ends,
+  // and it never holds the GIL, except for what the decoder itself
+  // needs, e.g. to read from a file implemented in Python.
+  inline std::shared_ptr<alure::Decoder>
+  prefetch_native (std::shared_ptr<alure::Decoder> decoder,
+                   std::shared_ptr<ChunkRing> ring,
+                   std::shared_ptr<StreamTelemetry> telemetry)
+  {
+    auto result = std::make_shared<RingDecoder> (
+      ring, decoder->getFrequency(), decoder->getChannelConfig(),
+      decoder->getSampleType(), decoder->getLength(),
+      decoder->getLoopPoints());
+    std::thread {[decoder, ring, telemetry]
+      {
+        std::chrono::milliseconds timeout {100};
+        unsigned generation = ring->generation();
+        unsigned frame_size = alure::FramesToBytes (
+          1, decoder->getChannelConfig(), decoder->getSampleType());
+        auto loop_points = decoder->getLoopPoints();
+        std::uint64_t loop_start = loop_points.first < loop_points.second
+          ? loop_points.first : 0;
+        bool ended = false, seeked = true;
+        try
+          {
+            while (!ring->closed())
+              {
+                unsigned current = ring->generation();
+                // While decoding ahead, the generation is one step ahead.
+                if (current != generation && current + 1 != generation)
+                  {
+                    generation = current;
+                    seeked = decoder->seek (ring->seek_position());
+                    ended = false;
+                  }
+                if (ended && current == generation
+                    && decoder->seek (loop_start))
+                  {
+                    ring->anticipate (++generation, loop_start);
+                    ended = false;
+                    seeked = true;
+                  }
+                if (ended)
+                  {
+                    ring->wait_seek (current, timeout);
+                    continue;
+                  }
+                if (!ring->wait_writable (timeout) || ring->closed())
+                  continue;
+                std::size_t size = 0;
+                if (seeked)
+                  {
+                    auto start = std::chrono::steady_clock::now();
+                    ALuint frames = decoder->read (
+                      ring->chunk(), ring->chunk_size() / frame_size);
+                    telemetry->on_decode (frames,
+                      std::chrono::duration<double> (
+                        std::chrono::steady_clock::now() - start).count());
+                    size = std::size_t (frames) * frame_size;
+                  }
+                ended = size < ring->chunk_size();
+                ring->commit (size, generation, ended);
+              }
+          }
+        catch (...)
+          {
+            // Let the consumer drain what is left
+          }
+        ring->finish();
+      }}.detach();
+    return result;
+  }
+} // namespace palace
+
+#endif // PALACE_TELEMETRY_H
@@ -0,0 +1,364 @@
+// Native context updating
+// Copyright (C) 2020  Nguyễn Gia Phong
+//
+// This file is part of palace.
+//
+// palace is free software: you can redistribute it and/or modify it
+// under the terms of the GNU Lesser General Public License as published
+// by the Free Software Foundation, either version 3 of the License,
+// or (at your option) any later version.
+//
+// palace is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public License
+// along with palace.  If not, see <https://www.gnu.org/licenses/>.
+
+#ifndef PALACE_UPDATE_H
+#define PALACE_UPDATE_H
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <deque>
+#include <exception>
+#include <iterator>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <utility>
+#include <vector>
+
+#include "alure2.h"
+#include "telemetry.h"
+
+namespace palace
+{
+  // Message received from alure, named after the handler's method
+  struct Event
+  {
+    const char* message;
+    double time;    // in seconds of the steady clock
+    alure::Device device;
+    alure::Source source;
+    alure::String name;
+
+    Event (const char* name) noexcept
+    : message (name),
+      time (std::chrono::duration<double> (
+        std::chrono::steady_clock::now().time_since_epoch()).count())
+    {}
+  };
+
+  // Serialized context updates, optionally run on a native thread,
+  // with messages queued for dispatching later.
+  // None of the methods may be called with the GIL held
+  // to avoid deadlocks with callbacks reacquiring it,
+  // except for the ones on the queue which never block for long
+  // and unlock.  Other calls into alure changing the context's state
+  // are to be made between lock and unlock to serialize them
+  // with the updates.  The sources still active are recorded
+  // after each update, so that waiting never calls into alure,
+  // and the bookkeeping mutex is not held during alure's updates,
+  // so that callbacks run by them may play and wait for sources.
+  class Updater
+  {
+    std::recursive_mutex updating;
+    std::mutex mutex;
+    std::condition_variable updated;
+    std::condition_variable stopping;
+    std::thread thread;
+    bool running = false;
+    std::exception_ptr failure;   // of the native thread
+    std::vector<alure::Source> tracked;   // active as of the last update
+    std::atomic<std::uint64_t> updates {0};
+    std::map<alure::Source, std::shared_ptr<StreamTelemetry>> monitored;
+    std::mutex queue_mutex;
+    std::deque<Event> events;
+    std::size_t capacity = 4096;  // of the queue, see enqueue
+
+    inline static bool
+    is_stop (const Event& event)
+    {
+      return !std::strcmp (event.message, "source_stopped")
+        || !std::strcmp (event.message, "source_force_stopped");
+    }
+
+    // Queue the event, making room if the queue is full by dropping
+    // the oldest event not about a source stopping.  Failing that,
+    // a stop event replaces the queued one of the same source
+    // and is otherwise queued beyond the capacity, since futures
+    // are waiting for it, while other events are dropped.
+    inline void
+    enqueue (Event&& event)
+    {
+      std::lock_guard<std::mutex> lock {queue_mutex};
+      if (events.size() >= capacity)
+        {
+          auto victim = std::find_if_not (events.begin(), events.end(),
+                                          is_stop);
+          if (victim == events.end() && is_stop (event))
+            victim = std::find_if (events.begin(), events.end(),
+                                   [&] (const Event& queued)
+                                   { return queued.source == event.source; });
+          if (victim != events.end())
+            events.erase (victim);
+          else if (!is_stop (event))
+            return;
+        }
+      events.push_back (std::move (event));
+    }
+
+    inline static bool
+    is_active (const alure::Source& source)
+    { return source.isPlaying() || source.isPaused(); }
+
+    inline void
+    refresh (alure::Context context)
+    {
+      std::lock_guard<std::recursive_mutex> guard {updating};
+      context.update();
+      ++updates;
+      std::lock_guard<std::mutex> lock {mutex};
+      for (auto stream = monitored.begin(); stream != monitored.end();)
+        if (is_active (stream->first))
+          {
+            stream->second->sample (stream->first);
+            ++stream;
+          }
+        else
+          {
+            stream = monitored.erase (stream);
+          }
+      tracked.erase (std::remove_if (tracked.begin(), tracked.end(),
+                                     [] (const alure::Source& source)
+                                     { return !is_active (source); }),
+                     tracked.end());
+      updated.notify_all();
+    }
+
+    inline void
+    run (alure::Context context, std::chrono::milliseconds period)
+    {
+      try
+        {
+          alure::Context::MakeThreadCurrent (context);
+        }
+      catch (...)
+        {
+          // Fallback to the process-wide current context
+        }
+      std::unique_lock<std::mutex> lock {mutex};
+      while (running)
+        {
+          lock.unlock();
+          try
+            {
+              refresh (context);
+            }
+          catch (...)
+            {
+              lock.lock();
+              failure = std::current_exception();
+              running = false;
+              break;
+            }
+          lock.lock();
+          stopping.wait_for (lock, period, [this] { return !running; });
+        }
+      updated.notify_all();
+      lock.unlock();
+      try
+        {
+          alure::Context::MakeThreadCurrent (nullptr);
+        }
+      catch (...)
+        {
+        }
+    }
+
+    // Must be called with the mutex locked
+    inline void
+    report()
+    {
+      auto error = std::exchange (failure, nullptr);
+      if (error)
+        std::rethrow_exception (error);
+    }
+
+  public:
+    ~Updater() { halt(); }
+
+    inline void
+    start (alure::Context context, std::chrono::milliseconds period)
+    {
+      halt();
+      std::lock_guard<std::mutex> lock {mutex};
+      failure = nullptr;
+      running = true;
+      thread = std::thread {&Updater::run, this, context, period};
+    }
+
+    // Stop the native thread, discarding its failure if any
+    inline void
+    halt() noexcept
+    {
+      {
+        std::lock_guard<std::mutex> lock {mutex};
+        running = false;
+      }
+      stopping.notify_all();
+      if (thread.joinable())
+        thread.join();
+    }
+
+    // Stop the native thread and rethrow its failure if any
+    inline void
+    stop()
+    {
+      halt();
+      std::lock_guard<std::mutex> lock {mutex};
+      report();
+    }
+
+    // Return whether the native thread is running,
+    // or rethrow the failure that stopped it if any.
+    inline bool
+    is_running()
+    {
+      std::lock_guard<std::mutex> lock {mutex};
+      report();
+      return running;
+    }
+
+    inline void
+    update (alure::Context context)
+    {
+      refresh (context);
+    }
+
+    // Number of updates done so far, by either thread
+    inline std::uint64_t update_count() const { return updates; }
+
+    // Serialize calls into alure with the updates
+    inline void lock() { updating.lock(); }
+    inline void unlock() { updating.unlock(); }
+
+    // Queue interface, safe to be called from any thread
+    inline void
+    push (const char* message, alure::Device device)
+    {
+      Event event {message};
+      event.device = device;
+      enqueue (std::move (event));
+    }
+
+    inline void
+    push (const char* message, alure::Source source)
+    {
+      Event event {message};
+      event.source = source;
+      enqueue (std::move (event));
+    }
+
+    inline void
+    push (const char* message, alure::String name)
+    {
+      Event event {message};
+      event.name = std::move (name);
+      enqueue (std::move (event));
+    }
+
+    // Take at most the given number of the oldest queued events
+    inline std::vector<Event>
+    take (std::size_t max)
+    {
+      std::lock_guard<std::mutex> lock {queue_mutex};
+      auto end = events.begin() + std::min (max, events.size());
+      std::vector<Event> taken {std::make_move_iterator (events.begin()),
+                                std::make_move_iterator (end)};
+      events.erase (events.begin(), end);
+      return taken;
+    }
+
+    // Track the playback just started by the given source,
+    // replacing any telemetry of its previous stream.
+    inline void
+    track (alure::Source source,
+           std::shared_ptr<StreamTelemetry> telemetry = nullptr)
+    {
+      std::lock_guard<std::mutex> lock {mutex};
+      if (std::find (tracked.begin(), tracked.end(), source) == tracked.end())
+        tracked.push_back (source);
+      if (telemetry)
+        monitored[source] = std::move (telemetry);
+      else
+        monitored.erase (source);
+    }
+
+    // Stop tracking the given source, e.g. once stopped or destroyed
+    inline void
+    forget (alure::Source source)
+    {
+      {
+        std::lock_guard<std::mutex> lock {mutex};
+        tracked.erase (std::remove (tracked.begin(), tracked.end(), source),
+                       tracked.end());
+        monitored.erase (source);
+      }
+      updated.notify_all();
+    }
+
+    // Return whether the source is streaming as of the last update,
+    // and if so its telemetry
+    inline bool
+    stream_stats (alure::Source source, StreamStats& stats)
+    {
+      std::lock_guard<std::mutex> lock {mutex};
+      auto stream = monitored.find (source);
+      if (stream == monitored.end())
+        return false;
+      stats = stream->second->snapshot();
+      return true;
+    }
+
+    // Wait for the given source to stop for at most the given timeout,
+    // or indefinitely if it is negative.  Return whether it stopped.
+    // Untracked sources are considered stopped.
+    inline bool
+    wait (alure::Source source, std::chrono::milliseconds timeout)
+    {
+      std::unique_lock<std::mutex> lock {mutex};
+      auto stopped = [&]
+        {
+          return std::find (tracked.begin(), tracked.end(),
+                            source) == tracked.end();
+        };
+      if (timeout.count() >= 0)
+        return updated.wait_for (lock, timeout, stopped);
+      updated.wait (lock, stopped);
+      return true;
+    }
+
+    // Wait for all tracked sources to stop, similar to wait.
+    inline bool
+    wait_idle (std::chrono::milliseconds timeout)
+    {
+      std::unique_lock<std::mutex> lock {mutex};
+      auto idle = [this] { return tracked.empty(); };
+      if (timeout.count() >= 0)
+        return updated.wait_for (lock, timeout, idle);
+      updated.wait (lock, idle);
+      return true;
+    }
+  };
+} // namespace palace
+
+#endif // PALACE_UPDATE_H
@@ -20,6 +20,7 @@
 #ifndef PALACE_UTIL_H
 #define PALACE_UTIL_H
 
+#include <chrono>
 #include <string>
 #include <map>
 #include <utility>
@@ -30,6 +31,14 @@
 
 namespace palace
 {
+  // Seconds on the steady clock, for timing callbacks
+  inline double
+  now() noexcept
+  {
+    return std::chrono::duration<double> (
+      std::chrono::steady_clock::now().time_since_epoch()).count();
+  }
+
   const std::map<std::string, alure::SampleType> SAMPLE_TYPES {
     {"Unsigned 8-bit", alure::SampleType::UInt8},
     {"Signed 16-bit", alure::SampleType::Int16},
@@ -17,14 +17,19 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with palace.  If not, see <https://www.gnu.org/licenses/>.
 
+from libc.stdint cimport uint64_t
+from libcpp cimport bool as boolean
 from libcpp.map cimport map
+from libcpp.memory cimport shared_ptr
 from libcpp.string cimport string
 from libcpp.utility cimport pair
 from libcpp.vector cimport vector
 
 from alure cimport (    # noqa
-    AttributePair, EFXEAXREVERBPROPERTIES, FilterParams,
-    ChannelConfig, SampleType, DistanceModel, Vector3)
+    AttributePair, EFXEAXREVERBPROPERTIES, FilterParams, FileIOFactory,
+    ChannelConfig, SampleType, DistanceModel, Vector3, Device, Context,
+    Source, Decoder)
+from std cimport milliseconds
 
 
 cdef extern from 'util.h' namespace 'palace' nogil:
@@ -37,3 +42,87 @@ cdef extern from 'util.h' namespace 'palace' nogil:
     cdef FilterParams make_filter(float gain, float gain_hf, float gain_lf)
     cdef vector[float] from_vector3(Vector3)
     cdef Vector3 to_vector3(vector[float])
+    cdef double now()
+
+
+cdef extern from 'mmapio.h' namespace 'palace' nogil:
+    cdef cppclass MmapFileIOFactory(FileIOFactory):
+        MmapFileIOFactory()
+
+
+cdef extern from 'ring.h' namespace 'palace' nogil:
+    cdef cppclass ChunkRing:
+        ChunkRing(size_t, size_t) except +
+        size_t capacity()
+        size_t limit()
+        void set_limit(size_t)
+        size_t chunk_size()
+        boolean writable()
+        char* chunk() except +
+        void commit(size_t, unsigned, boolean)
+        boolean wait_writable(milliseconds) except +
+        boolean wait_seek(unsigned, milliseconds) except +
+        unsigned generation()
+        uint64_t seek_position()
+        boolean closed()
+        void anticipate(unsigned, uint64_t)
+        void finish()
+
+    cdef cppclass RingDecoder(Decoder):
+        RingDecoder(shared_ptr[ChunkRing], unsigned, ChannelConfig, SampleType,
+                    uint64_t, pair[uint64_t, uint64_t]) except +
+
+
+cdef extern from 'telemetry.h' namespace 'palace' nogil:
+    cdef cppclass StreamStats:
+        uint64_t chunks
+        uint64_t consumed
+        uint64_t depth
+        uint64_t min_headroom
+        uint64_t underruns
+        double speed
+        uint64_t prefetch
+        vector[uint64_t] latency
+
+    cdef cppclass StreamTelemetry:
+        StreamTelemetry(unsigned, unsigned) except +
+        void attach(shared_ptr[ChunkRing], boolean)
+        void on_decode(uint64_t, double)
+
+    cdef cppclass MonitoredDecoder(Decoder):
+        MonitoredDecoder(shared_ptr[Decoder], shared_ptr[StreamTelemetry],
+                         boolean) except +
+
+    shared_ptr[Decoder] prefetch_native(
+        shared_ptr[Decoder], shared_ptr[ChunkRing],
+        shared_ptr[StreamTelemetry]) except +
+
+
+cdef extern from 'update.h' namespace 'palace' nogil:
+    cdef cppclass Event:
+        const char* message
+        double time
+        Device device
+        Source source
+        string name
+
+    cdef cppclass Updater:
+        Updater()
+        void start(Context, milliseconds) except +
+        void halt()
+        void stop() except +
+        boolean is_running() except +
+        void update(Context) except +
+        uint64_t update_count()
+        void lock() except +
+        void unlock()
+        void push(const char*, Device)
+        void push(const char*, Source)
+        void push(const char*, string)
+        vector[Event] take(size_t) except +
+        void track(Source) except +
+        void track(Source, shared_ptr[StreamTelemetry]) except +
+        void forget(Source) except +
+        boolean stream_stats(Source, StreamStats&) except +
+        boolean wait(Source, milliseconds) except +
+        boolean wait_idle(milliseconds) except +
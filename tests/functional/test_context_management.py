@@ -25,7 +25,8 @@ from pytest import mark, raises
 def test_current_context():
     """Test the current context."""
     with Device() as device, Context(device) as context:
-        assert current_context() == context
+        assert current_context() is context
+        assert current_context().device is device
     assert current_context() is None
 
 
@@ -0,0 +1,46 @@
+# File I/O functional tests
+# Copyright (C) 2020  Nguyễn Gia Phong
+#
+# This file is part of palace.
+#
+# palace is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# palace is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with palace.  If not, see <https://www.gnu.org/licenses/>.
+
+from uuid import uuid4
+
+from palace import (current_fileio, use_fileio, decode,
+                    Device, Context, Buffer, MmapFileIO)
+from pytest import raises
+
+
+def test_mmap(aiff, flac, tmp_path):
+    """Test decoding memory-mapped files."""
+    empty = tmp_path / 'empty.wav'
+    empty.touch()
+    empty = str(empty)
+    use_fileio(MmapFileIO)
+    try:
+        assert current_fileio() is MmapFileIO
+        with Device() as device, Context(device):
+            with open(aiff, 'rb') as f, MmapFileIO(aiff) as m:
+                assert m.read() == f.read()
+                assert m.seek(-4, 2) == f.seek(-4, 2)
+            decoder = decode(flac)
+            assert decoder.read(decoder.length)
+            with Buffer(aiff) as buffer: assert buffer.length
+            with raises(RuntimeError): Buffer(str(uuid4()))
+            with raises(RuntimeError): Buffer(empty)
+            with raises(ValueError): MmapFileIO(empty)
+    finally:
+        use_fileio(None)
+    assert current_fileio() is None
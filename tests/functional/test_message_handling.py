@@ -17,6 +17,7 @@
 # along with palace.  If not, see <https://www.gnu.org/licenses/>.
 
 import aifc
+from asyncio import ensure_future, new_event_loop, wait_for
 from os import environ
 from platform import system
 from unittest.mock import Mock
@@ -60,15 +61,70 @@ def test_source_force_stopped(ogg):
         context.message_handler = mock('source_force_stopped')
         # TODO: test source preempted by a higher-prioritized one
         with Buffer(ogg) as buffer: source = buffer.play()
+        context.update()
         context.message_handler.source_force_stopped.assert_called_with(source)
         with SourceGroup() as group, Buffer(ogg) as buffer:
             source.group = group
             buffer.play(source)
             group.stop_all()
+        context.update()
         context.message_handler.source_force_stopped.assert_called_with(source)
         source.destroy()
 
 
+@skipif_travis_macos
+def test_batch(ogg):
+    """Test batched delivery and draining of queued messages."""
+    with Device() as device, Context(device) as context:
+        context.message_handler = mock('on_batch')
+        with SourceGroup() as group, Buffer(ogg) as buffer:
+            loading, = context.drain_events()
+            assert loading.message == 'buffer_loading'
+            assert loading.target == ogg
+            sources = [buffer.play() for i in range(3)]
+            for source in sources: source.group = group
+            group.stop_all()
+            events = context.drain_events(max=1)
+            assert len(events) == 1
+            assert events[0].message == 'source_force_stopped'
+            assert events[0].target is sources[0]
+            context.update()
+            events, = context.message_handler.on_batch.call_args[0]
+            assert [event.target for event in events] == sources[1:]
+            assert events[0].time <= events[1].time
+            assert context.drain_events() == []
+        for source in sources: source.destroy()
+
+
+@skipif_travis_macos
+def test_source_finished(wav):
+    """Test awaiting the end of playbacks on an event loop."""
+    async def play(context, buffer):
+        updater = ensure_future(context.update_forever())
+        events = context.events()
+        try:
+            with buffer.play() as source:
+                event = ensure_future(events.__anext__())
+                await wait_for(source.finished(), 60)
+                assert not source.playing
+                assert await wait_for(event, 1) == ('source_stopped', source)
+                await source.finished()
+            with buffer.play() as source:
+                finished = source.finished()
+                source.stop()
+                await wait_for(finished, 1)
+        finally:
+            updater.cancel()
+            await events.aclose()
+
+    loop = new_event_loop()
+    with Device() as device, Context(device) as context, Buffer(wav) as buffer:
+        try:
+            loop.run_until_complete(play(context, buffer))
+        finally:
+            loop.close()
+
+
 @skipif_travis_macos
 def test_buffer_loading(aiff):
     """Test the handling of buffer loading message."""
@@ -84,6 +140,16 @@ def test_buffer_loading(aiff):
             # TODO: verify data
 
 
+def test_unhandled_messages(aiff):
+    """Test skipping messages not handled in Python."""
+    with Device() as device, Context(device) as context:
+        handler = context.message_handler = mock('source_stopped')
+        handler.buffer_loading = Mock()
+        with Buffer(aiff): handler.buffer_loading.assert_not_called()
+        context.message_handler = handler
+        with Buffer(aiff): handler.buffer_loading.assert_called_once()
+
+
 def test_resource_not_found(flac):
     """Test the handling of resource not found message."""
     with Device() as device, Context(device) as context:
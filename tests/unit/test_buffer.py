@@ -0,0 +1,230 @@
+# Buffer pytest module
+# Copyright (C) 2020  Nguyễn Gia Phong
+#
+# This file is part of palace.
+#
+# palace is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# palace is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with palace.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This pytest module tries to test the correctness of the class Buffer."""
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+from uuid import uuid4
+
+from numpy import float32, frombuffer, int16, zeros
+from palace import (cache, decode, free, load_buffers,
+                    BaseDecoder, Buffer, Context)
+from pytest import mark, raises
+
+
+class Silence(BaseDecoder):
+    """Decoder of silent 32-bit float mono audio."""
+    def __init__(self, length: int) -> None:
+        self.start, self.stop = 0, length
+
+    @BaseDecoder.frequency.getter
+    def frequency(self) -> int: return 44100
+
+    @BaseDecoder.channel_config.getter
+    def channel_config(self) -> str: return 'Mono'
+
+    @BaseDecoder.sample_type.getter
+    def sample_type(self) -> str: return '32-bit float'
+
+    @BaseDecoder.length.getter
+    def length(self) -> int: return self.stop
+
+    def seek(self, pos: int) -> bool: return False
+
+    @BaseDecoder.loop_points.getter
+    def loop_points(self) -> Tuple[int, int]: return 0, 0
+
+    def read(self, count: int) -> bytes:
+        raise AssertionError('read_into should have been preferred')
+
+    def read_into(self, view: memoryview) -> int:
+        out = frombuffer(view, dtype=float32)
+        count = min(len(out), self.stop - self.start)
+        out[:count] = 0
+        self.start += count
+        del out
+        return count * 4
+
+
+class Leaky(Silence):
+    """Silence decoder keeping a NumPy view of its output."""
+    def read_into(self, view: memoryview) -> int:
+        self.out = frombuffer(view, dtype=float32)
+        count = min(len(self.out), self.stop - self.start)
+        self.out[:count] = 0
+        self.start += count
+        return count * 4
+
+
+@mark.parametrize('dtype, sample_type', [(float32, '32-bit float'),
+                                         (int16, 'Signed 16-bit')])
+@mark.parametrize('channels, channel_config', [(1, 'Mono'), (2, 'Stereo')])
+def test_from_array(context, dtype, sample_type, channels, channel_config):
+    """Test buffer creation from NumPy arrays."""
+    samples = zeros((4410, channels), dtype=dtype)
+    with Buffer.from_array(samples, str(uuid4()), 44100) as buffer:
+        assert buffer.length == 4410
+        assert buffer.frequency == 44100
+        assert buffer.channel_config == channel_config
+        assert buffer.sample_type == sample_type
+
+
+def test_from_array_strided(context):
+    """Test buffer creation from non-contiguous arrays."""
+    samples = zeros((4410, 2), dtype=int16)
+    with Buffer.from_array(samples[::2], str(uuid4()), 44100) as buffer:
+        assert buffer.length == 2205
+        assert buffer.channel_config == 'Stereo'
+    with Buffer.from_array(samples[:, 0], str(uuid4()), 44100) as buffer:
+        assert buffer.length == 4410
+        assert buffer.channel_config == 'Mono'
+    with Buffer.from_buffer(memoryview(bytes(8820))[::2], str(uuid4()),
+                            44100, 'Mono', 'Signed 16-bit') as buffer:
+        assert buffer.length == 2205
+
+
+def test_from_array_invalid(context):
+    """Test buffer creation from unsupported arrays."""
+    with raises(ValueError):
+        Buffer.from_array(array('d', bytes(800)), str(uuid4()), 44100)
+    with raises(ValueError):
+        Buffer.from_array(zeros((10, 3), dtype=int16), str(uuid4()), 44100)
+    with raises(ValueError):
+        Buffer.from_array(zeros(10, dtype=int16), str(uuid4()), 44100, 'Foo')
+
+
+def test_from_buffer(context):
+    """Test buffer creation from raw samples."""
+    name = str(uuid4())
+    with Buffer.from_buffer(bytes(8820), name, 44100,
+                            'Stereo', 'Signed 16-bit') as buffer:
+        assert buffer.length == 2205
+        assert buffer.name == name
+        with raises(RuntimeError):
+            Buffer.from_buffer(bytes(4), name, 44100, 'Mono', 'Signed 16-bit')
+    with raises(ValueError):
+        Buffer.from_buffer(bytes(3), name, 44100, 'Mono', 'Signed 16-bit')
+
+
+def test_from_decoder_read_into(context):
+    """Test buffer creation from a decoder writing samples in place."""
+    with Buffer.from_decoder(Silence(4410), str(uuid4())) as buffer:
+        assert buffer.length == 4410
+
+
+def test_read_into_leak(context, monkeypatch):
+    """Test rejecting views exported beyond read_into."""
+    errors = []
+    monkeypatch.setattr('sys.unraisablehook', errors.append)
+    assert Leaky(4410).readinto(bytearray(400)) == 0
+    error, = errors
+    assert isinstance(error.exc_value, BufferError)
+
+
+def test_load_async(context, flac, ogg):
+    """Test asynchronous buffer loading."""
+    with Buffer.load_async(flac).result() as buffer:
+        assert buffer.name == flac
+        assert buffer == Buffer(flac)
+        futures = cache([flac, ogg, flac, str(uuid4())])
+        assert len(futures) == 3
+        assert futures[flac].result() == buffer
+        with futures[ogg].result() as buffer: assert buffer.name == ogg
+    name = str(uuid4())
+    with raises(RuntimeError): Buffer.load_async(name).result()
+    with raises(RuntimeError): cache([name])[name].result()
+
+
+def test_concurrent_decoding(context):
+    """Test buffer creation from decoders on multiple threads."""
+    names = [str(uuid4()) for i in range(4)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        buffers = list(executor.map(
+            lambda name: Buffer.from_decoder(Silence(44100), name), names))
+    for name, buffer in zip(names, buffers):
+        with buffer:
+            assert buffer.name == name
+            assert buffer.length == 44100
+
+
+def test_buffer_cache(device, flac, ogg):
+    """Test byte-budgeted eviction of cached buffers."""
+    with Context(device) as context:
+        buffer_cache = context.buffer_cache
+        assert buffer_cache is context.buffer_cache
+        assert buffer_cache.max_bytes is None
+        with Buffer(flac) as buffer:
+            assert list(buffer_cache) == [flac]
+            assert buffer_cache.size == buffer.size
+        assert flac not in buffer_cache and buffer_cache.size == 0
+        budget = max(Buffer(flac).size, Buffer(ogg).size)
+        buffer_cache.max_bytes = budget
+        assert list(buffer_cache) == [ogg]
+        assert Buffer(flac).name == flac
+        assert list(buffer_cache) == [flac]
+        with raises(ValueError): buffer_cache.max_bytes = -1
+        buffer_cache.max_bytes = None
+        free([flac])
+        assert len(buffer_cache) == 0
+
+
+def test_cache_stats(device, flac, ogg):
+    """Test introspection and statistics of cached buffers."""
+    with Context(device) as context:
+        buffer_cache = context.buffer_cache
+        assert buffer_cache.hits == buffer_cache.misses == 0
+        with Buffer(flac) as buffer, Buffer(ogg):
+            assert Buffer(flac) == buffer
+            assert buffer_cache.hits == 1
+            assert buffer_cache.misses == 2
+            assert buffer_cache.decode_time > 0
+            info, = (i for i in context.cached_buffers() if i.name == flac)
+            assert info.size == buffer.size
+            assert info.length == buffer.length
+            assert info.frequency == buffer.frequency
+            assert info.channel_config == buffer.channel_config
+            assert info.sample_type == buffer.sample_type
+            assert info.source_count == 0
+            assert info.load_time > 0
+            assert [i.name for i in context.cached_buffers()] == [ogg, flac]
+        assert context.cached_buffers() == []
+
+
+def test_load_buffers(device, flac, ogg, wav):
+    """Test loading buffers on a pool of decoding threads."""
+    with Context(device):
+        with Buffer(wav) as cached:
+            buffers = load_buffers([flac, ogg, wav, flac], workers=2)
+            assert list(buffers) == [flac, ogg, wav]
+            assert buffers[wav] == cached
+            for name, buffer in buffers.items():
+                decoder = decode(name)
+                assert buffer.name == name
+                assert buffer.frequency == decoder.frequency
+                assert buffer.channel_config == decoder.channel_config
+                assert buffer.sample_type == decoder.sample_type
+                assert buffer.length == len(decoder.read(buffer.length+1)) // (
+                    buffer.size // buffer.length)
+        free([flac, ogg])
+        with raises(RuntimeError): load_buffers([str(uuid4())])
+    with Context(device) as context, Buffer(wav):
+        with raises(RuntimeError):
+            load_buffers([flac, wav, str(uuid4()), ogg], workers=1)
+        assert [info.name for info in context.cached_buffers()] == [wav]
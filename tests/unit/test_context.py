@@ -20,11 +20,16 @@
 
 """This pytest module tries to test the correctness of the class Context."""
 
-from palace import current_context, distance_models, Context, MessageHandler
+from unittest.mock import Mock
+
+from palace import (current_context, distance_models,
+                    Buffer, Context, MessageHandler, Source)
 from pytest import raises
 
 from math import inf
 
+from numpy import arange, float32, float64, ones
+
 
 def test_comparison(device):
     """Test basic comparisons."""
@@ -51,6 +56,25 @@ def test_batch_control(device):
         context.end_batch()
 
 
+def test_set_sources(device):
+    """Test batch updates of sources."""
+    with Context(device) as context, Source() as s0, Source() as s1:
+        position = arange(6, dtype=float32).reshape(2, 3)
+        context.set_sources([s0, s1], position=position,
+                            gain=ones(2, dtype=float32) / 2)
+        assert s0.position == (0, 1, 2)
+        assert s1.position == (3, 4, 5)
+        assert s0.gain == s1.gain == 0.5
+        context.set_sources([s1], velocity=position[1:], pitch=position[1, :1])
+        assert s1.velocity == (3, 4, 5)
+        assert s1.pitch == 3
+        with raises(ValueError): context.set_sources([s0], position=position)
+        with raises(ValueError):
+            context.set_sources([s0, s1], gain=ones(2, dtype=float64))
+        with raises(ValueError):
+            context.set_sources([s0, s1], gain=-ones(2, dtype=float32))
+
+
 def test_message_handler(device):
     """Test read-write property MessageHandler."""
     context = Context(device)
@@ -69,6 +93,38 @@ def test_async_wake_interval(device):
         assert context.async_wake_interval == 42
 
 
+def test_auto_update(device, mp3):
+    """Test native auto-updating and waiting for sources."""
+    with Context(device) as context, Buffer(mp3) as buffer:
+        assert not context.auto_updating
+        context.message_handler = handler = type(
+            'SourceStopped', (MessageHandler,), {'source_stopped': Mock()})()
+        context.start_auto_update(10)
+        assert context.auto_updating
+        with buffer.play() as source:
+            assert source.wait(60)
+            assert context.wait_idle(0)
+            context.stop_auto_update()
+            assert not context.auto_updating
+            context.update()
+            handler.source_stopped.assert_called_once_with(source)
+        assert context.wait_idle()
+
+
+def test_auto_update_serialized(device, mp3):
+    """Test changing and waiting for sources while updating natively."""
+    with Context(device) as context, Buffer(mp3) as buffer:
+        context.start_auto_update(1)
+        for i in range(64):
+            with buffer.play() as source:
+                source.gain, source.position = i / 64, (i, 0, 0)
+                source.stop()
+                assert source.wait(0) and context.wait_idle(0)
+        with buffer.play() as source, Context(device):
+            assert source.wait(60)
+        context.stop_auto_update()
+
+
 def test_format_support(device):
     """Test method is_supported."""
     with Context(device) as context:
@@ -0,0 +1,234 @@
+# Decoder pytest module
+# Copyright (C) 2020  Nguyễn Gia Phong
+#
+# This file is part of palace.
+#
+# palace is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# palace is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with palace.  If not, see <https://www.gnu.org/licenses/>.
+
+"""This pytest module tries to test the correctness of the class Decoder."""
+
+from array import array
+from time import sleep, time
+from typing import Tuple
+from uuid import uuid4
+
+from palace import (current_pcm_cache, decode, decoder_factories,
+                    enable_instrumentation, sample_size, stats, use_pcm_cache,
+                    BaseDecoder, Buffer, ChunkDecoder, Decoder, Source)
+from pytest import raises
+
+
+class Ramp(BaseDecoder):
+    """Decoder of unsigned 8-bit mono ramps."""
+    def __init__(self, length: int) -> None:
+        self.position, self.stop = 0, length
+
+    @BaseDecoder.frequency.getter
+    def frequency(self) -> int: return 8000
+
+    @BaseDecoder.channel_config.getter
+    def channel_config(self) -> str: return 'Mono'
+
+    @BaseDecoder.sample_type.getter
+    def sample_type(self) -> str: return 'Unsigned 8-bit'
+
+    @BaseDecoder.length.getter
+    def length(self) -> int: return self.stop
+
+    def seek(self, pos: int) -> bool:
+        if pos > self.stop: return False
+        self.position = pos
+        return True
+
+    @BaseDecoder.loop_points.getter
+    def loop_points(self) -> Tuple[int, int]: return 0, 0
+
+    def read(self, count: int) -> bytes:
+        start, self.position = self.position, min(self.position+count,
+                                                  self.stop)
+        return bytes(i & 0xff for i in range(start, self.position))
+
+
+def test_read(context, wav):
+    """Test reading sample frames as bytes."""
+    decoder = Decoder(wav)
+    size = sample_size(1, decoder.channel_config, decoder.sample_type)
+    assert len(decoder.read(42)) == size * 42
+    assert len(decoder.read(decoder.length)) == size * (decoder.length-42)
+    assert decoder.read(42) == b''
+
+
+def test_readinto(context, wav):
+    """Test reading sample frames into a preallocated buffer."""
+    decoder = Decoder(wav)
+    size = sample_size(1, decoder.channel_config, decoder.sample_type)
+    samples = bytearray(size*42 + 1)
+    assert decoder.readinto(samples) == size * 42
+    assert decoder.seek(0)
+    assert samples[:size*42] == decoder.read(42)
+    with raises(BufferError): decoder.readinto(bytes(size))
+    with raises(TypeError): decoder.readinto(size)
+
+
+def test_read_array(context, wav):
+    """Test reading sample frames as a NumPy array."""
+    decoder = Decoder(wav)
+    samples = decoder.read_array(42)
+    assert samples.shape[0] == 42
+    assert samples.nbytes == sample_size(
+        42, decoder.channel_config, decoder.sample_type)
+    assert decoder.seek(0)
+    assert samples.tobytes() == decoder.read(42)
+
+
+def test_play_prefetch(context):
+    """Test streaming a Python decoder through a prefetching ring."""
+    decoder = Ramp(8000)
+    with decoder.play(256, 3, prefetch=4) as source:
+        assert source.playing
+        deadline = time() + 10
+        while source.playing and time() < deadline:
+            context.update()
+            sleep(0.025)
+        assert not source.playing
+    assert decoder.position == decoder.length
+
+
+def test_play_prefetch_loop(context):
+    """Test looping a stream through a prefetching ring."""
+    with Source() as source:
+        source.looping = True
+        Ramp(4000).play(256, 3, source, prefetch=4)
+        deadline = time() + 1.5
+        while time() < deadline:
+            context.update()
+            sleep(0.025)
+        assert source.playing
+        assert source.stream_stats.chunks_queued > 2 * 4000 // 256
+        source.stop()
+
+
+def test_play_prefetch_native(context, wav):
+    """Test streaming a native decoder through a prefetching ring."""
+    decoder = Decoder(wav)
+    assert decoder.seek(max(decoder.length - decoder.frequency // 4, 0))
+    with decoder.play(1024, 3, prefetch=4) as source:
+        deadline = time() + 10
+        while source.playing and time() < deadline:
+            context.update()
+            sleep(0.025)
+        assert not source.playing
+
+
+def test_play_auto(context, wav):
+    """Test streaming with adaptive chunk length and queue size."""
+    with raises(ValueError): Ramp(8000).play()
+    with raises(ValueError): Ramp(8000).play(auto=True, queue_size=0)
+    with raises(ValueError): Ramp(8000).play(auto=True, target_latency_ms=0)
+    decoder = Ramp(8000)
+    with decoder.play(auto=True, target_latency_ms=64) as source:
+        context.update()
+        stats = source.stream_stats
+        assert 2 <= stats.prefetch_depth <= 16
+        assert stats.decode_speed is None or stats.decode_speed > 0
+        deadline = time() + 10
+        while source.playing and time() < deadline:
+            context.update()
+            sleep(0.025)
+        assert not source.playing
+    assert decoder.position == decoder.length
+    with Decoder(wav).play(auto=True) as source:
+        context.update()
+        assert 2 <= source.stream_stats.prefetch_depth <= 16
+        source.stop()
+
+
+def test_decode_dispatch(context, flac, wav):
+    """Test dispatching resources to decoder factories."""
+    calls = []
+
+    def factory(name, decoder=None):
+        def create(resource):
+            calls.append(name)
+            if decoder is None: raise RuntimeError
+            return decoder
+        return create
+
+    riff, native = factory('riff', Ramp(1)), factory('native')
+    riff.signatures, native.extensions = [b'RIFF', (8, b'WAVE')], ['FLAC']
+    decoder_factories.a, decoder_factories.b = factory('generic'), riff
+    decoder_factories.c = native
+    try:
+        assert decode(wav).length == 1
+        assert calls == ['riff']
+        calls.clear()
+        assert decode(flac).length == 1
+        assert calls == ['native', 'generic', 'riff']
+        del decoder_factories.b
+        calls.clear()
+        assert type(decode(wav)) is Decoder
+        assert calls == ['generic', 'native']
+    finally:
+        for name in 'ac': delattr(decoder_factories, name)
+
+
+def test_pcm_cache(context, flac, tmp_path):
+    """Test persistently caching decoded samples."""
+    assert current_pcm_cache() is None
+    decoder = decode(flac)
+    samples = decoder.read(decoder.length)
+    directory = str(tmp_path / 'pcm')
+    use_pcm_cache(directory)
+    try:
+        assert current_pcm_cache() == directory
+        assert decode(flac).read(decoder.length + 1) == samples
+        assert len(list(tmp_path.glob('pcm/*.pcm'))) == 1
+        assert len(list(tmp_path.glob('pcm/*.json'))) == 1
+        cached = decode(flac)
+        assert cached.length == decoder.length
+        assert cached.frequency == decoder.frequency
+        assert cached.loop_points == decoder.loop_points
+        assert cached.read(cached.length + 1) == samples
+    finally:
+        use_pcm_cache(None)
+    assert current_pcm_cache() is None
+
+
+def test_chunk_decoder():
+    """Test decoding samples from an iterable of chunks."""
+    chunks = [b'\1\2', array('B', [3]), b'', b'\4\5']
+    decoder = ChunkDecoder(chunks, 8000, 'Mono', 'Unsigned 8-bit')
+    assert decoder.length == 0 and not decoder.seek(0)
+    assert decoder.read(1) == b'\1'
+    assert decoder.read(3) == b'\2\3\x80' and decoder.underruns == 1
+    assert decoder.read(4) == b'\4\5'
+    with raises(ValueError): ChunkDecoder(chunks, 8000, 'Mono', 'Foo')
+
+
+def test_instrumentation(context):
+    """Test timing of decoder callbacks and context updates."""
+    enable_instrumentation()
+    try:
+        decoder, other = Ramp(256), Ramp(256)
+        with Buffer.from_decoder(decoder, str(uuid4())): context.update()
+        calls = stats()
+        assert calls['BaseDecoder.read'].calls > 0
+        assert calls['Context.update'].calls == 1
+        assert 'MessageHandler.on_batch' not in calls
+        for call in calls.values():
+            assert 0 <= call.max <= call.total and call.gil_wait >= 0
+        assert stats(decoder)['BaseDecoder.read'] == calls['BaseDecoder.read']
+        assert stats(other) == {}
+    finally:
+        enable_instrumentation(False)
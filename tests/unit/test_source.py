@@ -23,7 +23,8 @@ from math import inf, pi
 from operator import is_
 from random import random, shuffle
 
-from palace import Buffer, BaseEffect, Source, SourceGroup
+from palace import (Buffer, BaseEffect, ChunkDecoder, Context, Emitter,
+                    Source, SourceGroup, SourcePool, VoiceManager)
 from pytest import raises
 
 from fmath import FLT_MAX, allclose, isclose
@@ -76,8 +77,9 @@ def test_group(context):
     with Source(context) as source, SourceGroup(context) as source_group:
         assert source.group is None
         source.group = source_group
-        assert source.group == source_group
-        assert source in source_group.sources
+        assert source.group is source_group
+        assert source_group.sources == [source]
+        assert source_group.sources[0] is source
         source.group = None
         assert source.group is None
 
@@ -90,6 +92,16 @@ def test_priority(context):
         assert source.priority == 42
 
 
+def test_wrapper_identity(device, context):
+    """Test keeping wrappers across destruction of other contexts."""
+    with Source(context) as source, SourceGroup(context) as source_group:
+        source.group = source_group
+        with Context(device):
+            pass
+        assert source.group is source_group
+        assert source_group.sources[0] is source
+
+
 def test_offset(context, ogg):
     """Test read-write property offset."""
     with Buffer(ogg) as buffer, buffer.play() as source:
@@ -343,3 +355,136 @@ def test_filter(context):
         source.filter = 0, 0, 0
         for gain, gain_hf, gain_lf in permutations([4, -2, 0]):
             with raises(ValueError): source.filter = gain, gain_hf, gain_lf
+
+
+def test_source_pool(context, ogg):
+    """Test reusing and stealing sources from a pool."""
+    with raises(ValueError): SourcePool(0)
+    with SourcePool(2) as pool, Buffer(ogg) as buffer:
+        assert pool.size == 2 and pool.available == 2
+        (near, near_lease), (far, far_lease) = pool.acquire(1), pool.acquire(1)
+        assert near != far and pool.available == 0
+        near.position, far.position = (0, 0, 1), (0, 0, 100)
+        buffer.play(near), buffer.play(far)
+        assert pool.acquire(0) is None
+        stolen, lease = pool.acquire(1)
+        assert stolen == far and stolen.priority == 1
+        assert not stolen.playing
+        with raises(ValueError): pool.release(far, far_lease)
+        pool.release(stolen, lease)
+        with raises(ValueError): pool.release(stolen, lease)
+        stolen, lease = pool.acquire(2)
+        assert stolen == far
+        near.stop()
+        assert pool.reclaim() == 0
+        context.update()
+        assert pool.reclaim() == 2 and pool.available == 2
+        with raises(ValueError): pool.release(near, near_lease)
+    assert not near and not far
+
+
+def test_source_pool_exhausted(context):
+    """Test that sources not yet played are not handed out twice."""
+    with SourcePool(1) as pool:
+        source, lease = pool.acquire()
+        assert pool.acquire() is None and pool.acquire(1) is None
+        pool.release(source, lease)
+        assert pool.acquire() == (source, lease + 1)
+        context.update()
+        assert pool.acquire() == (source, lease + 2)
+        with raises(ValueError): pool.release(source, lease + 1)
+        pool.release(source, lease + 2)
+
+
+def test_virtual_voices(context, ogg):
+    """Test parking and promoting emitters by audibility."""
+    with raises(ValueError): VoiceManager(2, cell_size=0)
+    with raises(ValueError): VoiceManager(2, threshold=-1)
+    with raises(TypeError): Emitter()
+    context.listener.position = 0, 0, 0
+    with Buffer(ogg) as buffer, VoiceManager(2, cell_size=16) as manager:
+        emitters = [manager.add(buffer, (i*10, 0, 0), distance_range=(1, 50),
+                                looping=True) for i in range(100)]
+        assert len(manager) == 100 and manager.voices == []
+        manager.update()
+        assert set(manager.voices) == set(emitters[:2])
+        assert all(emitter.source.playing for emitter in emitters[:2])
+        assert all(emitter.virtual for emitter in emitters[2:])
+        emitters[1].gain = 0
+        assert not emitters[1].virtual
+        manager.update()
+        assert emitters[1].virtual and emitters[1].playing
+        assert set(manager.voices) == {emitters[0], emitters[2]}
+        with raises(ValueError): emitters[50].priority = -1
+        emitters[50].priority = 1
+        manager.update()
+        assert emitters[50].virtual
+        context.listener.position = 500, 0, 0
+        manager.update()
+        assert emitters[50] in manager.voices
+        assert emitters[50].source.priority == 1
+        emitters[50].priority = 2
+        assert emitters[50].source.priority == 2
+        assert emitters[0].virtual and emitters[0].playing
+        assert len(manager.voices) == 2
+        emitters[50].stop()
+        assert not emitters[50].playing and len(manager) == 99
+        with raises(ValueError): manager.add(buffer, (0, 0, 0), priority=-1)
+        assert len(manager) == 99
+    assert len(manager) == 0
+
+
+def test_virtual_voices_reach(context, ogg):
+    """Test finding emitters of different audible reaches."""
+    context.listener.position = 0, 0, 0
+    with Buffer(ogg) as buffer, VoiceManager(1, cell_size=1) as manager:
+        near = manager.add(buffer, (0, 0, 0), distance_range=(1, 2),
+                           looping=True)
+        loud = manager.add(buffer, (3000, 0, 0), gain=10, looping=True,
+                           distance_range=(1, 5000), priority=1)
+        manager.update()
+        assert manager.voices == [loud]
+        loud.gain = 1
+        manager.update()
+        assert manager.voices == [near] and loud.virtual
+        with VoiceManager(1, threshold=0) as unbounded:
+            far = unbounded.add(buffer, (1e10, 0, 0), looping=True)
+            unbounded.update()
+            assert unbounded.voices == [far]
+
+
+def test_play_stream(context):
+    """Test streaming chunks of samples from a generator."""
+    taken = []
+
+    def chunks():
+        for i in range(64):
+            taken.append(i)
+            yield bytes(1024)
+
+    with Source() as source:
+        decoder = source.play_stream(chunks(), 44100, 'Mono', 'Signed 16-bit',
+                                     chunk_len=256, queue_size=2)
+        assert isinstance(decoder, ChunkDecoder)
+        assert source.playing
+        assert len(taken) < 64
+        source.stop()
+
+
+def test_stream_stats(context):
+    """Test telemetry of streamed playback."""
+    with Source() as source:
+        assert source.stream_stats is None
+        source.play_stream(repeat(bytes(1024), 64), 44100, 'Mono',
+                           'Signed 16-bit', chunk_len=256, queue_size=2)
+        context.update()
+        stats = source.stream_stats
+        assert stats.chunks_queued >= stats.queue_depth
+        assert stats.chunks_consumed == stats.chunks_queued - stats.queue_depth
+        assert stats.min_headroom is not None
+        assert stats.underruns >= 0
+        assert len(stats.latency_histogram) == 10
+        assert sum(stats.latency_histogram) == 1
+        source.stop()
+        context.update()
+        assert source.stream_stats is None